@@ -5,19 +5,39 @@ This script processes quantification and annotation results and stores them in a
 """
 
 import argparse
+import mmap
 import os
 import sys
-import glob
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import duckdb
 import json
 from pathlib import Path
 
+# eggNOG-mapper output columns and the annotations columns they populate
+EGGNOG_COLUMNS = {
+    '#query': 'protein_id',
+    'eggNOG_OGs': 'eggnog_id',
+    'GOs': 'go_terms',
+    'KEGG_ko': 'kegg_id',
+    'KEGG_Pathway': 'kegg_pathway',
+    'Preferred_name': 'gene_name',
+    'Description': 'description',
+}
+
+# DuckDB settings applied to every connection; filled in from the CLI by main()
+DUCKDB_CONFIG = {}
+
+
+def connect(db_path):
+    """Open a DuckDB connection with the configured threads and memory limit"""
+    return duckdb.connect(db_path, config=DUCKDB_CONFIG)
+
 
 def setup_database(db_path, sample_id):
     """Setup sample database and create necessary tables"""
     # Connect to database
-    con = duckdb.connect(db_path)
+    con = connect(db_path)
     
     # Create transcripts table
     con.execute("""
@@ -43,9 +63,10 @@ def setup_database(db_path, sample_id):
     """)
     
     # Create annotations table
+    con.execute("CREATE SEQUENCE IF NOT EXISTS annotation_id_seq")
     con.execute("""
     CREATE TABLE IF NOT EXISTS annotations (
-        annotation_id INTEGER PRIMARY KEY,
+        annotation_id INTEGER PRIMARY KEY DEFAULT nextval('annotation_id_seq'),
         protein_id VARCHAR,
         eggnog_id VARCHAR,
         go_terms VARCHAR,
@@ -81,6 +102,12 @@ def setup_database(db_path, sample_id):
     )
     """)
     
+    # Secondary indexes on the lookup columns. Bulk loads insert rows
+    # pre-sorted on these keys so DuckDB's per-row-group zonemaps stay tight.
+    con.execute("CREATE INDEX IF NOT EXISTS idx_expr_sample ON expression(sample_id)")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_proteins_transcript ON proteins(transcript_id)")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_annot_protein ON annotations(protein_id)")
+    
     # Insert sample record if not exists
     con.execute("""
     INSERT OR IGNORE INTO samples (sample_id, processing_date)
@@ -92,136 +119,227 @@ def setup_database(db_path, sample_id):
     return db_path
 
 
+def find_first_file(root, filename):
+    """Return the path of the first file named filename under root, or None.
+    
+    Unlike a recursive glob, the walk stops at the first match instead of
+    listing the whole tree.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_file() and entry.name == filename:
+                        return entry.path
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return None
+
+
 def process_quantification(quant_dir, db_path, sample_id):
     """Process salmon quantification results"""
     print(f"Processing quantification data in {quant_dir}")
     
-    # Look for quant.sf files
-    quant_files = glob.glob(os.path.join(quant_dir, "**", "quant.sf"), recursive=True)
+    # Use the first quant.sf file found
+    quant_file = find_first_file(quant_dir, "quant.sf")
     
-    if not quant_files:
+    if not quant_file:
         print("No quantification files found.")
         return
     
-    # Use the first file found
-    quant_file = quant_files[0]
     print(f"Using quantification file: {quant_file}")
     
-    # Read the quantification file
-    quant_df = pd.read_csv(quant_file, sep='\t')
-    
     # Connect to the database
-    con = duckdb.connect(db_path)
-    
-    # Insert expression data
-    for _, row in quant_df.iterrows():
-        transcript_id = row['Name']
-        tpm = row['TPM']
-        eff_length = row['EffectiveLength']
-        num_reads = row['NumReads']
-        
-        con.execute("""
+    con = connect(db_path)
+    
+    # Let DuckDB parse the TSV and insert the expression data in one statement
+    con.begin()
+    try:
+        count = con.execute("""
         INSERT OR REPLACE INTO expression (transcript_id, sample_id, tpm, num_reads, eff_length)
-        VALUES (?, ?, ?, ?, ?)
-        """, [transcript_id, sample_id, tpm, num_reads, eff_length])
+        SELECT Name, ?, TPM, NumReads, EffectiveLength
+        FROM read_csv(?, delim='\t', header=true)
+        ORDER BY Name
+        """, [sample_id, quant_file]).fetchone()[0]
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
     
     con.close()
-    print(f"Processed {len(quant_df)} transcript expression records")
+    print(f"Processed {count} transcript expression records")
+
+
+def parse_protein_headers(protein_file):
+    """Map protein IDs to transcript IDs from TransDecoder FASTA headers.
+    
+    The file is memory-mapped and scanned for header lines only, so
+    sequence lines are never decoded into Python strings.
+    """
+    transcript_protein_map = {}
+    if os.path.getsize(protein_file) == 0:
+        return transcript_protein_map
+    
+    with open(protein_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            def next_header(pos):
+                # Offset of the next '>' that starts a line, or -1
+                found = mm.find(b'\n>', pos)
+                return found + 1 if found != -1 else -1
+            
+            i = 0 if mm[:1] == b'>' else next_header(0)
+            while i != -1:
+                end = mm.find(b'\n', i)
+                if end == -1:
+                    end = len(mm)
+                
+                # Extract protein ID and transcript ID from header
+                # Format: >GENE.1.pep transcript=GENE.1
+                header = mm[i + 1:end].decode().strip()
+                parts = header.split(' ')
+                protein_id = parts[0]
+                
+                for part in parts:
+                    if part.startswith('transcript='):
+                        transcript_protein_map[protein_id] = part.split('=')[1]
+                        break
+                
+                # Jump straight to the next header, skipping sequence lines
+                i = next_header(end)
+    
+    return transcript_protein_map
+
+
+def count_comment_lines(path):
+    """Count the '##' comment lines at the top of an eggNOG-mapper file"""
+    skip = 0
+    with open(path, 'r') as f:
+        for line in f:
+            if not line.startswith('##'):
+                break
+            skip += 1
+    return skip
 
 
 def process_annotation(annot_dir, db_path, sample_id):
     """Process TransDecoder and eggNOG-mapper annotation results"""
     print(f"Processing annotation data in {annot_dir}")
     
-    # Look for protein files
-    protein_files = glob.glob(os.path.join(annot_dir, "**", "proteins.pep"), recursive=True)
+    # Use the first proteins.pep file found
+    protein_file = find_first_file(annot_dir, "proteins.pep")
     
-    if not protein_files:
+    if not protein_file:
         print("No protein files found.")
         return
     
-    # Use the first file found
-    protein_file = protein_files[0]
     print(f"Using protein file: {protein_file}")
     
-    # Look for annotation files
-    annot_files = glob.glob(os.path.join(annot_dir, "**", "eggnog_annotations.tsv"), recursive=True)
+    # Use the first eggnog_annotations.tsv file found
+    annot_file = find_first_file(annot_dir, "eggnog_annotations.tsv")
     
-    if not annot_files:
+    if not annot_file:
         print("No annotation files found.")
         return
     
-    # Use the first file found
-    annot_file = annot_files[0]
     print(f"Using annotation file: {annot_file}")
     
     # Parse protein file to get transcript to protein mapping
-    transcript_protein_map = {}
-    current_protein = ""
-    with open(protein_file, 'r') as f:
-        for line in f:
-            if line.startswith('>'):
-                # Extract protein ID and transcript ID from header
-                # Format: >GENE.1.pep transcript=GENE.1
-                header = line.strip()[1:]
-                parts = header.split(' ')
-                protein_id = parts[0]
-                transcript_id = None
-                
-                for part in parts:
-                    if part.startswith('transcript='):
-                        transcript_id = part.split('=')[1]
-                        break
-                
-                if transcript_id:
-                    transcript_protein_map[protein_id] = transcript_id
-                    current_protein = protein_id
+    transcript_protein_map = parse_protein_headers(protein_file)
     
     # Parse annotation file
     if os.path.exists(annot_file):
-        annot_df = pd.read_csv(annot_file, sep='\t', comment='#')
-        
         # Connect to the database
-        con = duckdb.connect(db_path)
+        con = connect(db_path)
+        
+        # eggNOG-mapper writes '##' comment lines before the '#query' header
+        # and after the last row; skip the leading ones and drop the trailing
+        # ones as short rows
+        reader = (
+            "read_csv(?, delim='\t', header=true, skip=?, "
+            "all_varchar=true, ignore_errors=true)"
+        )
+        reader_params = [annot_file, count_comment_lines(annot_file)]
+        columns = [
+            column[0] for column in
+            con.execute(f"SELECT * FROM {reader} LIMIT 0", reader_params).description
+        ]
+        
+        if '#query' not in columns:
+            print("No '#query' column found in annotation file.")
+            con.close()
+            return
+        
+        # Normalize eggNOG-mapper columns to the annotations schema, filling
+        # any column missing from this eggNOG-mapper version with ''
+        select_list = ", ".join(
+            f'"{source}" AS {target}' if source in columns else f"'' AS {target}"
+            for source, target in EGGNOG_COLUMNS.items()
+        )
+        con.execute(f"""
+        CREATE TEMP TABLE annot AS
+        SELECT {select_list} FROM {reader}
+        WHERE "#query" NOT LIKE '##%'
+        """, reader_params)
         
-        # Insert protein and annotation data
-        for _, row in annot_df.iterrows():
+        map_df = pd.DataFrame(
+            list(transcript_protein_map.items()),
+            columns=['protein_id', 'transcript_id'],
+            dtype=str,
+        )
+        con.register("map_df", map_df)
+        
+        # Stage the protein rows in a temp table without the transcripts
+        # foreign key, then check every reference with one anti-join so a
+        # bad batch is rejected up front rather than by per-row FK probes
+        con.execute("""
+        CREATE TEMP TABLE proteins_stage AS
+        SELECT DISTINCT a.protein_id, COALESCE(m.transcript_id, 'unknown') AS transcript_id
+        FROM annot a LEFT JOIN map_df m USING (protein_id)
+        """)
+        orphans = con.execute("""
+        SELECT count(*) FROM proteins_stage p
+        ANTI JOIN transcripts t USING (transcript_id)
+        """).fetchone()[0]
+        
+        if orphans:
+            print(f"Error processing annotation records: {orphans} proteins "
+                  "reference transcripts missing from the transcripts table")
+        else:
+            # Insert protein and annotation data, one statement per table, in
+            # a single transaction
+            con.begin()
             try:
-                protein_id = row['#query']
-                transcript_id = transcript_protein_map.get(protein_id, "unknown")
-                
-                # Get GO terms
-                go_terms = row.get('GOs', '')
-                
-                # Get KEGG info
-                kegg_id = row.get('KEGG_ko', '')
-                kegg_pathway = row.get('KEGG_Pathway', '')
-                
-                # Get description
-                gene_name = row.get('Preferred_name', '')
-                description = row.get('Description', '')
-                
-                # Store protein in database
                 con.execute("""
                 INSERT OR IGNORE INTO proteins 
                 (protein_id, transcript_id, sample_id, original_id)
-                VALUES (?, ?, ?, ?)
-                """, [protein_id, transcript_id, sample_id, protein_id])
+                SELECT protein_id, transcript_id, ?, protein_id
+                FROM proteins_stage
+                ORDER BY transcript_id, protein_id
+                """, [sample_id])
                 
-                # Store annotation in database
                 con.execute("""
                 INSERT INTO annotations 
-                (protein_id, eggnog_id, go_terms, kegg_id, kegg_pathway, 
+                (annotation_id, protein_id, eggnog_id, go_terms, kegg_id, kegg_pathway, 
                 gene_name, description, sample_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, [protein_id, row.get('eggNOG_OGs', ''), go_terms, kegg_id, 
-                     kegg_pathway, gene_name, description, sample_id])
-                
+                SELECT nextval('annotation_id_seq'), protein_id, eggnog_id, go_terms,
+                kegg_id, kegg_pathway, gene_name, description, ?
+                FROM (SELECT * FROM annot ORDER BY protein_id)
+                """, [sample_id])
+                con.commit()
             except Exception as e:
-                print(f"Error processing annotation row: {e}")
+                con.rollback()
+                print(f"Error processing annotation records: {e}")
         
+        count = con.execute("SELECT count(*) FROM annot").fetchone()[0]
+        con.unregister("map_df")
         con.close()
-        print(f"Processed {len(annot_df)} annotation records")
+        print(f"Processed {count} annotation records")
 
 
 def update_master_database(sample_db_path, master_db_path):
@@ -233,99 +351,151 @@ def update_master_database(sample_db_path, master_db_path):
         print("Creating new master database")
         setup_database(master_db_path, "master")
     
-    # Connect to both databases
-    sample_con = duckdb.connect(sample_db_path)
-    master_con = duckdb.connect(master_db_path)
+    # Connect to the master database and attach the sample database so
+    # each table can be copied with a single INSERT ... SELECT
+    master_con = connect(master_db_path)
+    master_con.execute(f"ATTACH '{sample_db_path}' AS s (READ_ONLY)")
+    master_con.execute("CREATE SEQUENCE IF NOT EXISTS annotation_id_seq")
     
-    # Copy data from sample database to master database
-    
-    # Transcripts
-    transcript_df = sample_con.execute("SELECT * FROM transcripts").fetchdf()
-    for _, row in transcript_df.iterrows():
+    # Copy all tables in a single transaction
+    master_con.begin()
+    try:
+        # Transcripts
         master_con.execute("""
         INSERT OR IGNORE INTO transcripts 
         (transcript_id, sample_id, length, gc_content, original_id)
-        VALUES (?, ?, ?, ?, ?)
-        """, [row['transcript_id'], row['sample_id'], row['length'], 
-             row['gc_content'], row['original_id']])
-    
-    # Proteins
-    protein_df = sample_con.execute("SELECT * FROM proteins").fetchdf()
-    for _, row in protein_df.iterrows():
+        SELECT transcript_id, sample_id, length, gc_content, original_id
+        FROM s.transcripts
+        ORDER BY sample_id, transcript_id
+        """)
+        
+        # Proteins
         master_con.execute("""
         INSERT OR IGNORE INTO proteins 
         (protein_id, transcript_id, sample_id, length, original_id)
-        VALUES (?, ?, ?, ?, ?)
-        """, [row['protein_id'], row['transcript_id'], row['sample_id'], 
-             row['length'], row['original_id']])
-    
-    # Annotations
-    annot_df = sample_con.execute("SELECT * FROM annotations").fetchdf()
-    for _, row in annot_df.iterrows():
+        SELECT protein_id, transcript_id, sample_id, length, original_id
+        FROM s.proteins
+        ORDER BY sample_id, transcript_id, protein_id
+        """)
+        
+        # Annotations
         master_con.execute("""
         INSERT INTO annotations 
-        (protein_id, eggnog_id, go_terms, kegg_id, kegg_pathway, 
+        (annotation_id, protein_id, eggnog_id, go_terms, kegg_id, kegg_pathway, 
         gene_name, description, sample_id)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, [row['protein_id'], row['eggnog_id'], row['go_terms'], 
-             row['kegg_id'], row['kegg_pathway'], row['gene_name'], 
-             row['description'], row['sample_id']])
-    
-    # Expression
-    expr_df = sample_con.execute("SELECT * FROM expression").fetchdf()
-    for _, row in expr_df.iterrows():
+        SELECT nextval('annotation_id_seq'), protein_id, eggnog_id, go_terms,
+        kegg_id, kegg_pathway, gene_name, description, sample_id
+        FROM (SELECT * FROM s.annotations ORDER BY sample_id, protein_id)
+        """)
+        
+        # Expression
         master_con.execute("""
         INSERT OR REPLACE INTO expression 
         (transcript_id, sample_id, tpm, num_reads, eff_length)
-        VALUES (?, ?, ?, ?, ?)
-        """, [row['transcript_id'], row['sample_id'], row['tpm'], 
-             row['num_reads'], row['eff_length']])
-    
-    # Samples
-    sample_df = sample_con.execute("SELECT * FROM samples").fetchdf()
-    for _, row in sample_df.iterrows():
+        SELECT transcript_id, sample_id, tpm, num_reads, eff_length
+        FROM s.expression
+        ORDER BY sample_id, transcript_id
+        """)
+        
+        # Samples
         master_con.execute("""
         INSERT OR REPLACE INTO samples 
         (sample_id, sra_accession, metadata, processing_date)
-        VALUES (?, ?, ?, ?)
-        """, [row['sample_id'], row['sra_accession'], row['metadata'], 
-             row['processing_date']])
+        SELECT sample_id, sra_accession, metadata, processing_date
+        FROM s.samples
+        """)
+        
+        master_con.commit()
+    except Exception:
+        master_con.rollback()
+        raise
     
-    sample_con.close()
+    master_con.execute("DETACH s")
     master_con.close()
     
     print("Master database update complete")
 
 
+def ingest_sample(sample_id, quant_dir, annot_dir, db_dir, duckdb_config=None):
+    """Load one sample's results into its own database; returns its path"""
+    if duckdb_config is not None:
+        # Worker processes do not inherit settings made in the parent's main()
+        DUCKDB_CONFIG.update(duckdb_config)
+    
+    # Setup sample database
+    sample_db_path = os.path.join(db_dir, f"{sample_id}.duckdb")
+    setup_database(sample_db_path, sample_id)
+    
+    # Process quantification results
+    process_quantification(quant_dir, sample_db_path, sample_id)
+    
+    # Process annotation results
+    process_annotation(annot_dir, sample_db_path, sample_id)
+    
+    return sample_db_path
+
+
 def main():
     parser = argparse.ArgumentParser(description="Update DuckDB database with RNA-Seq pipeline results")
-    parser.add_argument("--sample-id", required=True, help="Sample ID for database records")
-    parser.add_argument("--quant-dir", required=True, help="Directory containing quantification results")
-    parser.add_argument("--annot-dir", required=True, help="Directory containing annotation results")
+    parser.add_argument("--sample-id", required=True, nargs="+",
+                        help="Sample ID(s) for database records")
+    parser.add_argument("--quant-dir", required=True,
+                        help="Directory containing quantification results "
+                             "(may contain {sample_id} when loading several samples)")
+    parser.add_argument("--annot-dir", required=True,
+                        help="Directory containing annotation results "
+                             "(may contain {sample_id} when loading several samples)")
     parser.add_argument("--db-dir", required=True, help="Directory for database files")
     parser.add_argument("--threads", type=int, default=4, help="Number of threads to use")
+    parser.add_argument("--memory-limit", help="DuckDB memory limit, e.g. 4GB (default: DuckDB's own)")
+    parser.add_argument("--temp-dir", help="Directory for DuckDB to spill to when over the memory limit")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of samples to load in parallel")
     
     args = parser.parse_args()
     
-    # Create database directory if it doesn't exist
-    os.makedirs(args.db_dir, exist_ok=True)
+    sample_ids = list(dict.fromkeys(args.sample_id))
+    if len(sample_ids) > 1 and not (
+        "{sample_id}" in args.quant_dir and "{sample_id}" in args.annot_dir
+    ):
+        parser.error("--quant-dir and --annot-dir must contain {sample_id} "
+                     "when loading several samples")
     
-    # Setup sample database
-    sample_db_path = os.path.join(args.db_dir, f"{args.sample_id}.duckdb")
-    setup_database(sample_db_path, args.sample_id)
+    # Apply resource settings to every DuckDB connection
+    DUCKDB_CONFIG['threads'] = args.threads
+    if args.memory_limit:
+        DUCKDB_CONFIG['memory_limit'] = args.memory_limit
+    if args.temp_dir:
+        DUCKDB_CONFIG['temp_directory'] = args.temp_dir
     
-    # Process quantification results
-    process_quantification(args.quant_dir, sample_db_path, args.sample_id)
+    # Create database directory if it doesn't exist
+    os.makedirs(args.db_dir, exist_ok=True)
     
-    # Process annotation results
-    process_annotation(args.annot_dir, sample_db_path, args.sample_id)
+    # Each sample has its own database file, so samples can be loaded in
+    # separate processes; the master database takes a single writer and
+    # is updated afterwards, one sample at a time
+    jobs = [
+        (sample_id,
+         args.quant_dir.format(sample_id=sample_id),
+         args.annot_dir.format(sample_id=sample_id),
+         args.db_dir)
+        for sample_id in sample_ids
+    ]
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+            futures = [pool.submit(ingest_sample, *job, dict(DUCKDB_CONFIG)) for job in jobs]
+            sample_db_paths = [future.result() for future in futures]
+    else:
+        sample_db_paths = [ingest_sample(*job) for job in jobs]
     
     # Update master database if it exists
     master_db_path = os.path.join(args.db_dir, "rna_master.duckdb")
     if os.path.exists(master_db_path) or os.path.exists(os.path.dirname(master_db_path)):
-        update_master_database(sample_db_path, master_db_path)
+        for sample_db_path in sample_db_paths:
+            update_master_database(sample_db_path, master_db_path)
     
-    print(f"Database update complete for sample {args.sample_id}")
+    for sample_id in sample_ids:
+        print(f"Database update complete for sample {sample_id}")
 
 
 if __name__ == "__main__":
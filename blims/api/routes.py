@@ -1,15 +1,42 @@
 """API routes for the BLIMS system."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from blims.core.service import SampleService
 
 # Create a router
-router = APIRouter(prefix="/api/v1")
+router = APIRouter(prefix="/api/v1", default_response_class=ORJSONResponse)
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID path or body parameter, caching recently seen IDs.
+
+    Raises:
+        ValueError: If the value is not a valid UUID
+    """
+    return UUID(value)
+
+
+def _parse_uuids(values: List[str]) -> List[UUID]:
+    """Parse a list of UUID strings, dropping repeated IDs.
+
+    Raises:
+        ValueError: On the first value that is not a valid UUID
+    """
+    parsed = []
+    for value in dict.fromkeys(values):
+        try:
+            parsed.append(_parse_uuid(value))
+        except ValueError:
+            raise ValueError(f"Invalid sample ID: {value}") from None
+    return list(dict.fromkeys(parsed))
 
 
 # Service dependency
@@ -62,7 +89,7 @@ def create_sample(
         # Convert string UUIDs to UUID objects
         uuid_parent_ids = None
         if sample.parent_ids:
-            uuid_parent_ids = [UUID(pid) for pid in sample.parent_ids]
+            uuid_parent_ids = _parse_uuids(sample.parent_ids)
 
         created_sample = service.create_sample(
             name=sample.name,
@@ -94,7 +121,7 @@ def get_sample(
         HTTPException: If the sample is not found
     """
     try:
-        uuid_id = UUID(sample_id)
+        uuid_id = _parse_uuid(sample_id)
         sample = service.repository.get(uuid_id)
         if not sample:
             raise HTTPException(
@@ -124,7 +151,7 @@ def add_metadata(
         HTTPException: If the sample is not found
     """
     try:
-        uuid_id = UUID(sample_id)
+        uuid_id = _parse_uuid(sample_id)
         sample = service.add_metadata_to_sample(uuid_id, metadata.key, metadata.value)
         return sample.to_dict()
     except ValueError as e:
@@ -150,7 +177,7 @@ def add_file(
         HTTPException: If the sample is not found
     """
     try:
-        uuid_id = UUID(sample_id)
+        uuid_id = _parse_uuid(sample_id)
         sample = service.add_file_to_sample(uuid_id, file_data.file_path)
         return sample.to_dict()
     except ValueError as e:
@@ -176,7 +203,7 @@ def derive_sample(
         HTTPException: If the parent sample is not found
     """
     try:
-        uuid_parent_id = UUID(parent_id)
+        uuid_parent_id = _parse_uuid(parent_id)
         derived_sample = service.derive_sample(
             parent_id=uuid_parent_id,
             name=sample.name,
@@ -209,7 +236,7 @@ def get_lineage(
         HTTPException: If the sample is not found
     """
     try:
-        uuid_id = UUID(sample_id)
+        uuid_id = _parse_uuid(sample_id)
         lineage = service.get_sample_lineage(uuid_id)
 
         # Convert samples to dictionaries
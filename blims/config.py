@@ -2,7 +2,7 @@
 
 import os
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 # Default AWS region
 DEFAULT_REGION = "us-east-1"
@@ -10,10 +10,41 @@ DEFAULT_REGION = "us-east-1"
 # AWS configuration
 AWS_CONFIG_FILE = os.environ.get("BLIMS_CONFIG", "config/aws_config.json")
 
+# Last loaded configuration, keyed by the config file's (mtime_ns, size)
+_config_cache: Dict[str, Any] = {"stamp": None, "config": None}
+
+
+def _config_stamp() -> Optional[Tuple[int, int]]:
+    """Get the modification stamp of the config file, or None if missing."""
+    try:
+        st = os.stat(AWS_CONFIG_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 
 def get_aws_config() -> Dict[str, Any]:
     """Get AWS configuration for BLIMS.
     
+    The parsed configuration is cached and only re-read when the config
+    file's modification time or size changes.
+    
+    Returns:
+        Configuration dictionary
+    """
+    stamp = _config_stamp()
+    if _config_cache["config"] is not None and stamp == _config_cache["stamp"]:
+        return _config_cache["config"]
+
+    config = _load_aws_config()
+    _config_cache["stamp"] = stamp
+    _config_cache["config"] = config
+    return config
+
+
+def _load_aws_config() -> Dict[str, Any]:
+    """Load AWS configuration from disk, falling back to defaults.
+    
     Returns:
         Configuration dictionary
     """
@@ -3,13 +3,22 @@
 import os
 import logging
 import json
-from typing import Any, Dict, List, Optional, Union
-from uuid import UUID
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID, uuid4
+
+from botocore.exceptions import ClientError
 
 from blims.core.repository import SampleRepository
 from blims.models.sample import Sample
 from blims.models.analysis import Analysis, AnalysisStatus
 from blims.utils.aws_utils import get_aws_manager
+from blims.utils.concurrency import ShardedMap
 from blims.utils.bioinformatics import (
     get_bioinf_manager, 
     AnalysisType, 
@@ -29,6 +38,41 @@ DEFAULT_BUCKET = get_s3_bucket("bioinformatics")
 DEFAULT_REGION = get_aws_region()
 DEFAULT_JOB_QUEUE = get_batch_job_queue()
 
+# AWS Batch job status -> AnalysisStatus
+_BATCH_STATUS_MAP = MappingProxyType({
+    "SUBMITTED": AnalysisStatus.PENDING,
+    "PENDING": AnalysisStatus.PENDING,
+    "RUNNABLE": AnalysisStatus.PENDING,
+    "STARTING": AnalysisStatus.RUNNING,
+    "RUNNING": AnalysisStatus.RUNNING,
+    "SUCCEEDED": AnalysisStatus.SUCCEEDED,
+    "FAILED": AnalysisStatus.FAILED
+})
+
+# Statuses after which a job is no longer tracked
+_TERMINAL_STATUSES = frozenset({AnalysisStatus.SUCCEEDED, AnalysisStatus.FAILED})
+
+# Number of finished jobs whose final status is remembered
+_RECENT_TERMINAL_SIZE = 1024
+
+# Number of presigned URLs kept for reuse
+_URL_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, caching recently seen IDs.
+
+    Raises:
+        ValueError: If the value is not a valid UUID
+    """
+    return UUID(value)
+
+
+def _enum_str(value: Union[Enum, str]) -> str:
+    """Get the string form of an enum member or plain string."""
+    return str(value.value) if isinstance(value, Enum) else str(value)
+
 
 class AnalysisService:
     """Service for managing bioinformatics analyses in BLIMS."""
@@ -38,7 +82,9 @@ class AnalysisService:
         sample_repository: Optional[SampleRepository] = None,
         bucket: str = DEFAULT_BUCKET,
         region: str = DEFAULT_REGION,
-        job_queue: str = DEFAULT_JOB_QUEUE
+        job_queue: str = DEFAULT_JOB_QUEUE,
+        status_ttl: float = 0.0,
+        url_cache_ttl: float = 300.0
     ):
         """Initialize the analysis service.
         
@@ -47,18 +93,51 @@ class AnalysisService:
             bucket: S3 bucket name for bioinformatics data
             region: AWS region
             job_queue: AWS Batch job queue
+            status_ttl: Seconds for which a polled job status is reused by
+                get_analysis_status (0 always queries AWS Batch)
+            url_cache_ttl: Seconds for which a generated presigned URL is
+                reused, capped at half the URL's expiry (0 disables reuse)
         """
         self.repository = sample_repository or SampleRepository()
         self.bucket = bucket
         self.region = region
         self.job_queue = job_queue
+        self.status_ttl = status_ttl
+        self.url_cache_ttl = url_cache_ttl
         
         # Initialize managers
         self.bioinf = get_bioinf_manager(bucket=bucket, job_queue=job_queue, region=region)
         self.aws = get_aws_manager(region=region)
         
-        # Analysis registry: job_id -> (analysis, sample_id)
-        self._active_analyses = {}
+        # Analysis registry: job_id -> (analysis, sample, the analysis record
+        # stored in sample.analyses), so status updates need no lookups.
+        # Sharded so pollers and the event listener updating different jobs
+        # do not contend; a job's shard lock serializes its status updates
+        self._active_analyses: ShardedMap[str, Tuple[Analysis, Sample, Dict[str, Any]]] = ShardedMap()
+        
+        # Last polled status of active jobs: job_id -> (monotonic time, status)
+        self._status_cache: Dict[str, Tuple[float, AnalysisStatus]] = {}
+        
+        # Final status of recently finished jobs, most recent last
+        self._recent_terminal: "OrderedDict[str, AnalysisStatus]" = OrderedDict()
+        self._recent_terminal_lock = threading.Lock()
+        
+        # File lookup indexes: (sample UUID, file_name) -> sequencing data
+        # record and (sample UUID, analysis ID, file_name) -> output file record
+        self._file_index: Dict[Tuple[UUID, str], Dict[str, Any]] = {}
+        self._result_index: Dict[Tuple[UUID, str, str], Dict[str, Any]] = {}
+        
+        # Direct uploads awaiting completion: upload_id -> pending record
+        self._pending_uploads: Dict[str, Dict[str, Any]] = {}
+        
+        # Presigned URLs: (bucket, s3_key, expiry) -> (monotonic time, url),
+        # least recently used first
+        self._url_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, str]]" = OrderedDict()
+        self._url_cache_lock = threading.Lock()
+        
+        # Job state-change listener
+        self._event_thread: Optional[threading.Thread] = None
+        self._event_stop = threading.Event()
     
     # Data Management
     
@@ -91,7 +170,7 @@ class AnalysisService:
             raise ValueError(f"Sample with ID {sample_id} not found")
         
         # Upload the data
-        success, s3_key = self.bioinf.upload_reads(
+        success, s3_key, size = self.bioinf.upload_reads(
             sample_id=str(sample.sample_id),
             file_path=file_path,
             sequencing_type=sequencing_type,
@@ -102,20 +181,143 @@ class AnalysisService:
         if not success:
             raise ValueError(f"Failed to upload {file_path}")
         
-        # Create data record
+        return self._add_sequencing_record(
+            sample,
+            sequencing_type=_enum_str(sequencing_type),
+            file_type=_enum_str(file_type),
+            file_name=os.path.basename(file_path),
+            s3_key=s3_key,
+            size=size if size is not None else os.path.getsize(file_path),
+            metadata=metadata
+        )
+    
+    def request_upload_url(
+        self,
+        sample_id: Union[UUID, str],
+        file_name: str,
+        sequencing_type: Union[str, SequencingType] = SequencingType.ILLUMINA,
+        file_type: Union[str, FileType] = FileType.FASTQ,
+        metadata: Optional[Dict[str, Any]] = None,
+        expiry: int = 3600
+    ) -> Dict[str, Any]:
+        """Start a direct upload of sequencing data from the client to S3.
+        
+        The client PUTs the file to the returned URL, then calls
+        complete_upload with the returned upload_id to record it on the
+        sample, so the file never passes through this service.
+        
+        Args:
+            sample_id: Sample ID
+            file_name: Name of the file to upload
+            sequencing_type: Type of sequencing data
+            file_type: Type of file
+            metadata: Additional metadata
+            expiry: Expiry time of the upload URL in seconds
+            
+        Returns:
+            Dictionary with the upload_id, the presigned PUT url, the
+            s3_key and expires_in
+            
+        Raises:
+            ValueError: If sample not found or URL generation fails
+        """
+        # Verify sample exists
+        sample = self._get_sample(sample_id)
+        if not sample:
+            raise ValueError(f"Sample with ID {sample_id} not found")
+        
+        file_name = os.path.basename(file_name)
+        s3_key = self.bioinf.get_reads_key(str(sample.sample_id), file_name, sequencing_type)
+        
+        url = self.aws.get_presigned_put_url(self.bucket, s3_key, expiry)
+        if not url:
+            raise ValueError(f"Failed to generate upload URL for {file_name}")
+        
+        upload_id = str(uuid4())
+        self._pending_uploads[upload_id] = {
+            "sample_id": sample.id,
+            "type": _enum_str(sequencing_type),
+            "file_type": _enum_str(file_type),
+            "file_name": file_name,
+            "s3_key": s3_key,
+            "metadata": metadata,
+        }
+        
+        return {
+            "upload_id": upload_id,
+            "url": url,
+            "s3_key": s3_key,
+            "expires_in": expiry
+        }
+    
+    def complete_upload(self, upload_id: str, size: Optional[int] = None) -> Dict[str, Any]:
+        """Record a finished direct upload on its sample.
+        
+        Args:
+            upload_id: ID returned by request_upload_url
+            size: Size of the uploaded file in bytes (looked up in S3 if None,
+                which also confirms the upload happened)
+            
+        Returns:
+            Information about the uploaded data
+            
+        Raises:
+            ValueError: If the upload is unknown, or the object is not in S3
+        """
+        pending = self._pending_uploads.get(upload_id)
+        if pending is None:
+            raise ValueError(f"Upload {upload_id} not found")
+        
+        if size is None:
+            size = self.aws.get_object_size(self.bucket, pending["s3_key"])
+            if size is None:
+                raise ValueError(f"File {pending['file_name']} has not been uploaded")
+        
+        sample = self._get_sample(pending["sample_id"])
+        if not sample:
+            raise ValueError(f"Sample with ID {pending['sample_id']} not found")
+        
+        del self._pending_uploads[upload_id]
+        
+        return self._add_sequencing_record(
+            sample,
+            sequencing_type=pending["type"],
+            file_type=pending["file_type"],
+            file_name=pending["file_name"],
+            s3_key=pending["s3_key"],
+            size=size,
+            metadata=pending["metadata"]
+        )
+    
+    def _add_sequencing_record(
+        self,
+        sample: Sample,
+        sequencing_type: str,
+        file_type: str,
+        file_name: str,
+        s3_key: str,
+        size: int,
+        metadata: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Add a sequencing data record for an uploaded file to a sample.
+        
+        Returns:
+            The added record
+        """
         data_info = {
-            "type": str(sequencing_type.value) if hasattr(sequencing_type, "value") else str(sequencing_type),
-            "file_type": str(file_type.value) if hasattr(file_type, "value") else str(file_type),
-            "file_name": os.path.basename(file_path),
+            "type": sequencing_type,
+            "file_type": file_type,
+            "file_name": file_name,
             "s3_key": s3_key,
             "s3_bucket": self.bucket,
             "s3_uri": f"s3://{self.bucket}/{s3_key}",
-            "size": os.path.getsize(file_path),
+            "size": size,
             "metadata": metadata or {}
         }
         
         # Add to sample record
         sample.add_sequencing_data(data_info)
+        self._file_index.setdefault((sample.id, file_name), data_info)
         
         return data_info
     
@@ -143,27 +345,22 @@ class AnalysisService:
         if not sample:
             raise ValueError(f"Sample with ID {sample_id} not found")
         
-        # Find the file in the sample's sequencing data
-        s3_key = None
-        for data in sample.sequencing_data:
-            if data.get("file_name") == file_name:
-                s3_key = data.get("s3_key")
-                break
+        # Find the file in the sample's sequencing data, falling back to a
+        # scan for records that were not added through this service
+        data = self._file_index.get((sample.id, file_name))
+        if data is None:
+            for data in sample.sequencing_data:
+                if data.get("file_name") == file_name:
+                    self._file_index[(sample.id, file_name)] = data
+                    break
+            else:
+                data = {}
+        s3_key = data.get("s3_key")
         
         if not s3_key:
             raise ValueError(f"File {file_name} not found in sample {sample_id}")
         
-        # Generate URL
-        url = self.aws.get_presigned_url(
-            bucket=self.bucket,
-            object_name=s3_key,
-            expiration=expiry
-        )
-        
-        if not url:
-            raise ValueError(f"Failed to generate URL for {file_name}")
-        
-        return url
+        return self._presigned_url(s3_key, file_name, expiry)
     
     # Analysis Management
     
@@ -202,7 +399,7 @@ class AnalysisService:
         # Create analysis object
         analysis = Analysis(
             name=analysis_name,
-            analysis_type=str(analysis_type.value) if hasattr(analysis_type, "value") else str(analysis_type),
+            analysis_type=_enum_str(analysis_type),
             sample_id=sample.id,
             created_by=created_by,
             input_files=input_files or [],
@@ -238,18 +435,19 @@ class AnalysisService:
         analysis.job_id = job_id
         analysis.update_status(AnalysisStatus.RUNNING)
         
-        # Register this analysis in the active analyses
-        self._active_analyses[job_id] = (analysis, sample.id)
-        
         # Add to sample
-        sample.add_analysis({
+        analysis_dict = {
             "id": str(analysis.id),
             "name": analysis.name,
             "type": analysis.analysis_type,
             "status": analysis.status.value,
             "job_id": analysis.job_id,
             "started_at": analysis.started_at.isoformat() if analysis.started_at else None
-        })
+        }
+        sample.add_analysis(analysis_dict)
+        
+        # Register this analysis in the active analyses
+        self._active_analyses[job_id] = (analysis, sample, analysis_dict)
         
         return analysis
     
@@ -265,70 +463,239 @@ class AnalysisService:
         Returns:
             Current status or None if not found
         """
-        if job_id not in self._active_analyses:
-            return None
-        
-        # Get current status from AWS
+        entry = self._active_analyses.get(job_id)
+        if entry is None:
+            # A job that finished recently still has a known final status
+            return self._recent_terminal.get(job_id)
+        
+        # A final status never changes, so there is nothing to ask AWS
+        if entry[0].status in _TERMINAL_STATUSES:
+            return entry[0].status
+        
+        # While the event listener runs it keeps the cache current, so
+        # any cached status is fresh; otherwise reuse a recent poll
+        cached = self._status_cache.get(job_id)
+        if cached and (
+            self.event_listener_running
+            or time.monotonic() - cached[0] < self.status_ttl
+        ):
+            return cached[1]
+        
+        # Get current status from AWS, without holding any lock
         status_str = self.bioinf.check_analysis_status(job_id)
         
         if not status_str:
             return None
         
-        # Map AWS Batch status to our AnalysisStatus
-        status_map = {
-            "SUBMITTED": AnalysisStatus.PENDING,
-            "PENDING": AnalysisStatus.PENDING,
-            "RUNNABLE": AnalysisStatus.PENDING,
-            "STARTING": AnalysisStatus.RUNNING,
-            "RUNNING": AnalysisStatus.RUNNING,
-            "SUCCEEDED": AnalysisStatus.SUCCEEDED,
-            "FAILED": AnalysisStatus.FAILED
+        return self._apply_job_status(job_id, status_str)
+    
+    def poll_all_active(self) -> Dict[str, AnalysisStatus]:
+        """Refresh the status of every active analysis job.
+        
+        Statuses are fetched with one AWS Batch request per 100 jobs
+        rather than one request per job.
+        
+        Returns:
+            Mapping of job ID to current status for the jobs that were found
+        """
+        job_ids = self._active_analyses.keys()
+        if not job_ids:
+            return {}
+        
+        status_strs = self.bioinf.check_analysis_status_batch(job_ids)
+        
+        return {
+            job_id: self._apply_job_status(job_id, status_str)
+            for job_id, status_str in status_strs.items()
+            if job_id in self._active_analyses
         }
+    
+    # Job state-change events
+    
+    @property
+    def event_listener_running(self) -> bool:
+        """Whether the job state-change listener thread is running."""
+        return self._event_thread is not None and self._event_thread.is_alive()
+    
+    def start_event_listener(self, queue_url: str, wait_time: int = 20) -> None:
+        """Start consuming AWS Batch job state-change events in the background.
+        
+        The queue must already receive "Batch Job State Change" events,
+        either from an EventBridge rule targeting the queue directly or via
+        an SNS topic. While the listener runs, get_analysis_status answers
+        from the statuses it records instead of calling AWS Batch.
+        
+        Args:
+            queue_url: URL of the SQS queue receiving the events
+            wait_time: Long-poll wait time in seconds (at most 20)
+        """
+        if self.event_listener_running:
+            return
+        
+        self._event_stop.clear()
+        self._event_thread = threading.Thread(
+            target=self._listen_for_job_events,
+            args=(queue_url, wait_time),
+            name="blims-batch-events",
+            daemon=True
+        )
+        self._event_thread.start()
+    
+    def stop_event_listener(self, timeout: Optional[float] = None) -> None:
+        """Stop the job state-change listener.
         
-        status = status_map.get(status_str, AnalysisStatus.RUNNING)
+        The listener exits after its current long poll returns.
         
-        # Update our local record
-        analysis, sample_id = self._active_analyses[job_id]
+        Args:
+            timeout: Seconds to wait for the listener thread to exit
+        """
+        self._event_stop.set()
+        if self._event_thread is not None:
+            self._event_thread.join(timeout)
+            self._event_thread = None
+    
+    def _listen_for_job_events(self, queue_url: str, wait_time: int) -> None:
+        """Long-poll the event queue until stop_event_listener is called.
         
-        # If status changed and it's a terminal status, update sample and remove from active
-        if status != analysis.status and status in [AnalysisStatus.SUCCEEDED, AnalysisStatus.FAILED]:
-            analysis.update_status(status)
+        Args:
+            queue_url: URL of the SQS queue receiving the events
+            wait_time: Long-poll wait time in seconds
+        """
+        while not self._event_stop.is_set():
+            try:
+                response = self.aws.sqs_client.receive_message(
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=10,
+                    WaitTimeSeconds=wait_time
+                )
+            except ClientError as e:
+                logger.error(f"Failed to receive job events: {str(e)}")
+                self._event_stop.wait(wait_time)
+                continue
             
-            # Update sample record
-            sample = self._get_sample(sample_id)
-            if sample:
-                # Find and update the analysis record in the sample
-                for analysis_dict in sample.analyses:
-                    if analysis_dict.get("job_id") == job_id:
-                        analysis_dict["status"] = status.value
-                        analysis_dict["completed_at"] = analysis.completed_at.isoformat()
-                        break
+            messages = response.get("Messages", [])
+            if not messages:
+                continue
+            
+            for message in messages:
+                self._handle_job_event(message["Body"])
             
-            # If succeeded, collect output files
-            if status == AnalysisStatus.SUCCEEDED:
-                self._collect_analysis_results(analysis, sample)
+            try:
+                self.aws.sqs_client.delete_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                        for i, message in enumerate(messages)
+                    ]
+                )
+            except ClientError as e:
+                logger.error(f"Failed to delete job events: {str(e)}")
+    
+    def _handle_job_event(self, body: str) -> None:
+        """Apply one AWS Batch job state-change event.
+        
+        Args:
+            body: SQS message body holding the event, or an SNS notification
+                wrapping it
+        """
+        try:
+            event = json.loads(body)
+            if "Message" in event and "detail" not in event:
+                event = json.loads(event["Message"])
+            detail = event["detail"]
+            job_id, status_str = detail["jobId"], detail["status"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed job state-change event")
+            return
+        
+        self._apply_job_status(job_id, status_str)
+    
+    def _apply_job_status(self, job_id: str, status_str: str) -> AnalysisStatus:
+        """Record an AWS Batch status for an active analysis job.
+        
+        Holds the job's shard lock, so concurrent updates of the same job
+        apply once; a job that has already finished is left untouched.
+        
+        Args:
+            job_id: AWS Batch job ID
+            status_str: Status reported by AWS Batch
+            
+        Returns:
+            The corresponding AnalysisStatus
+        """
+        # Map AWS Batch status to our AnalysisStatus
+        status = _BATCH_STATUS_MAP.get(status_str, AnalysisStatus.RUNNING)
+        
+        with self._active_analyses.lock_for(job_id):
+            entry = self._active_analyses.get(job_id)
+            if entry is None:
+                return status
+            
+            self._status_cache[job_id] = (time.monotonic(), status)
+            
+            # Update our local record
+            analysis, sample, analysis_dict = entry
+            
+            # If status changed and it's a terminal status, update sample and remove from active
+            if status != analysis.status and status in _TERMINAL_STATUSES:
+                analysis.update_status(status)
+                
+                # Update the analysis record in the sample
+                analysis_dict["status"] = status.value
+                analysis_dict["completed_at"] = analysis.completed_at.isoformat()
                 
-            # Remove from active analyses if complete
-            del self._active_analyses[job_id]
+                # If succeeded, collect output files
+                if status == AnalysisStatus.SUCCEEDED:
+                    self._collect_analysis_results(analysis, sample, analysis_dict)
+                    
+                # Remove from active analyses if complete
+                self._remember_terminal(job_id, status)
+                del self._active_analyses[job_id]
+                self._status_cache.pop(job_id, None)
         
         return status
     
-    def _collect_analysis_results(self, analysis: Analysis, sample: Sample) -> None:
+    def _remember_terminal(self, job_id: str, status: AnalysisStatus) -> None:
+        """Record the final status of a finished job.
+        
+        Args:
+            job_id: AWS Batch job ID
+            status: Final status
+        """
+        with self._recent_terminal_lock:
+            self._recent_terminal[job_id] = status
+            self._recent_terminal.move_to_end(job_id)
+            if len(self._recent_terminal) > _RECENT_TERMINAL_SIZE:
+                self._recent_terminal.popitem(last=False)
+    
+    def _collect_analysis_results(
+        self,
+        analysis: Analysis,
+        sample: Sample,
+        analysis_dict: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Collect analysis results and update records.
         
         Args:
             analysis: Analysis object
             sample: Sample object
+            analysis_dict: The analysis record in sample.analyses, if known
         """
+        if analysis_dict is None:
+            analysis_dict = next(
+                (a for a in sample.analyses if a.get("id") == str(analysis.id)),
+                None
+            )
+        
         # Get analysis results
         results = self.bioinf.get_analysis_results(
             sample_id=str(sample.sample_id),
             analysis_type=analysis.analysis_type
         )
         
-        # Add output files to analysis
-        for result in results:
-            file_info = {
+        # Build all output file records, then add them in one go
+        file_infos = [
+            {
                 "file_name": result["file_name"],
                 "s3_key": result["key"],
                 "s3_bucket": self.bucket,
@@ -337,16 +704,20 @@ class AnalysisService:
                 "last_modified": result["last_modified"],
                 "metadata": result.get("metadata", {})
             }
-            
-            analysis.add_output_file(file_info)
-            
-            # Find and update the analysis record in the sample
-            for analysis_dict in sample.analyses:
-                if analysis_dict.get("id") == str(analysis.id):
-                    if "output_files" not in analysis_dict:
-                        analysis_dict["output_files"] = []
-                    analysis_dict["output_files"].append(file_info)
-                    break
+            for result in results
+        ]
+        
+        analysis.add_output_files(file_infos)
+        
+        # Update the analysis record in the sample
+        if analysis_dict is not None:
+            analysis_dict.setdefault("output_files", []).extend(file_infos)
+        
+        analysis_id = analysis._id_str
+        for file_info in file_infos:
+            self._result_index.setdefault(
+                (sample.id, analysis_id, file_info["file_name"]), file_info
+            )
     
     def get_analysis_result_url(
         self,
@@ -374,6 +745,11 @@ class AnalysisService:
         if not sample:
             raise ValueError(f"Sample with ID {sample_id} not found")
         
+        # Output files collected by this service are indexed directly
+        file_info = self._result_index.get((sample.id, str(analysis_id), file_name))
+        if file_info is not None:
+            return self._presigned_url(file_info["s3_key"], file_name, expiry)
+        
         # Find the analysis in the sample's analyses
         analysis_type = None
         s3_key = None
@@ -395,7 +771,39 @@ class AnalysisService:
             # Try to generate the key based on naming convention
             s3_key = f"samples/{sample.sample_id}/analyses/{analysis_type}/{file_name}"
             
-        # Generate URL
+        return self._presigned_url(s3_key, file_name, expiry)
+    
+    # Helper methods
+    
+    def _presigned_url(self, s3_key: str, file_name: str, expiry: int) -> str:
+        """Generate a presigned URL for an object in the service bucket.
+        
+        A URL signed within the last url_cache_ttl seconds (and no more
+        than half its expiry ago) is returned instead of signing again.
+        
+        Args:
+            s3_key: S3 object key
+            file_name: Name of the file, used in error messages
+            expiry: Expiry time in seconds
+            
+        Returns:
+            Presigned URL
+            
+        Raises:
+            ValueError: If URL generation fails
+        """
+        key = (self.bucket, s3_key, expiry)
+        max_age = min(self.url_cache_ttl, expiry / 2)
+        now = time.monotonic()
+        
+        with self._url_cache_lock:
+            cached = self._url_cache.get(key)
+            if cached is not None:
+                if now - cached[0] < max_age:
+                    self._url_cache.move_to_end(key)
+                    return cached[1]
+                del self._url_cache[key]
+        
         url = self.aws.get_presigned_url(
             bucket=self.bucket,
             object_name=s3_key,
@@ -405,10 +813,15 @@ class AnalysisService:
         if not url:
             raise ValueError(f"Failed to generate URL for {file_name}")
         
+        if max_age > 0:
+            with self._url_cache_lock:
+                self._url_cache[key] = (now, url)
+                self._url_cache.move_to_end(key)
+                if len(self._url_cache) > _URL_CACHE_SIZE:
+                    self._url_cache.popitem(last=False)
+        
         return url
     
-    # Helper methods
-    
     def _get_sample(self, sample_id: Union[UUID, str]) -> Optional[Sample]:
         """Get a sample by ID.
         
@@ -420,14 +833,13 @@ class AnalysisService:
         """
         # Convert to UUID if it's a string
         if isinstance(sample_id, str):
+            # It might be a human-readable sample_id like "s1"
+            sample = self.repository.get_by_sample_id(sample_id)
+            if sample:
+                return sample
             try:
-                sample_id = UUID(sample_id)
+                sample_id = _parse_uuid(sample_id)
             except ValueError:
-                # If it's not a valid UUID, it might be a sample_id like "s1"
-                # Find it in the repository
-                for sample in self.repository.get_all():
-                    if sample.sample_id == sample_id:
-                        return sample
                 return None
         
         return self.repository.get(sample_id)
\ No newline at end of file
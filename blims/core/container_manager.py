@@ -1,6 +1,6 @@
 """Container management service for BLIMS."""
 
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import uuid
 
 from blims.services.sample_service import SampleService
@@ -44,26 +44,84 @@ class ContainerManager:
             raise ValueError(f"Container with ID {container_id} not found")
         
         # Check if container is a container
-        if not getattr(container, 'is_container', False):
+        if not container.is_container:
             raise ValueError(f"Sample {container.name} is not a container")
         
         # Remove from current container if any
-        if hasattr(sample, 'container_id') and sample.container_id:
+        if sample.container_id:
             self.remove_sample_from_container(sample_id)
         
         # Add to new container
         sample.container_id = container.id
         
-        # Add to container's contained_sample_ids list
-        if not hasattr(container, 'contained_sample_ids'):
-            container.contained_sample_ids = []
+        # Add to container's contained samples
+        container.add_contained_sample(sample.id)
         
-        if sample.id not in container.contained_sample_ids:
-            container.contained_sample_ids.append(sample.id)
+        # Update both samples together
+        self.sample_service.update_samples([sample, container])
         
-        # Update both samples
-        self.sample_service.update_sample(sample)
-        self.sample_service.update_sample(container)
+        return True
+    
+    def add_samples_to_container(
+        self,
+        sample_ids: List[Union[str, uuid.UUID]],
+        container_id: Union[str, uuid.UUID]
+    ) -> bool:
+        """Add several samples to a container in one batch.
+        
+        Samples are fetched together, removed from their current containers
+        grouped by container, and saved with the target in one update.
+        
+        Args:
+            sample_ids: The IDs of the samples to add
+            container_id: The ID of the container to add the samples to
+            
+        Returns:
+            True if the samples were added
+            
+        Raises:
+            ValueError: If a sample or the container doesn't exist, or if the
+                container isn't actually a container
+        """
+        container = self.sample_service.get_sample(container_id)
+        if not container:
+            raise ValueError(f"Container with ID {container_id} not found")
+        
+        # Check if container is a container
+        if not container.is_container:
+            raise ValueError(f"Sample {container.name} is not a container")
+        
+        found = self.sample_service.get_samples(sample_ids)
+        samples = []
+        for sample_id in sample_ids:
+            sample = found.get(str(sample_id))
+            if not sample:
+                raise ValueError(f"Sample with ID {sample_id} not found")
+            samples.append(sample)
+        
+        # Remove from current containers, fetching each old container once
+        updated = {str(sample.id): sample for sample in samples}
+        old_container_ids = {
+            str(sample.container_id)
+            for sample in samples
+            if sample.container_id
+            and str(sample.container_id) != str(container.id)
+        }
+        old_containers = self.sample_service.get_samples(old_container_ids)
+        for sample in samples:
+            old = old_containers.get(str(sample.container_id)) if sample.container_id else None
+            if old is not None and old.contains_sample(sample.id):
+                old.remove_contained_sample(sample.id)
+                updated[str(old.id)] = old
+            
+            # Add to new container
+            sample.container_id = container.id
+        
+        container.add_contained_samples(sample.id for sample in samples)
+        updated[str(container.id)] = container
+        
+        # Update the samples and every changed container together
+        self.sample_service.update_samples(updated.values())
         
         return True
     
@@ -85,7 +143,7 @@ class ContainerManager:
             raise ValueError(f"Sample with ID {sample_id} not found")
         
         # Check if sample is in a container
-        if not hasattr(sample, 'container_id') or not sample.container_id:
+        if not sample.container_id:
             return False
         
         # Get the container
@@ -96,15 +154,15 @@ class ContainerManager:
             self.sample_service.update_sample(sample)
             return True
         
-        # Remove from container's contained_sample_ids list
-        if hasattr(container, 'contained_sample_ids'):
-            if sample.id in container.contained_sample_ids:
-                container.contained_sample_ids.remove(sample.id)
-                self.sample_service.update_sample(container)
+        # Remove from container's contained samples
+        updated = [sample]
+        if container.contains_sample(sample.id):
+            container.remove_contained_sample(sample.id)
+            updated.append(container)
         
-        # Update sample
+        # Update the sample, and the container if it changed, together
         sample.container_id = None
-        self.sample_service.update_sample(sample)
+        self.sample_service.update_samples(updated)
         
         return True
     
@@ -126,17 +184,22 @@ class ContainerManager:
             raise ValueError(f"Container with ID {container_id} not found")
         
         # Check if container is a container
-        if not getattr(container, 'is_container', False):
+        if not container.is_container:
             raise ValueError(f"Sample {container.name} is not a container")
         
-        # Build hierarchy recursively
-        return self._build_hierarchy(container)
+        # Fetch all samples once and resolve contained IDs locally
+        index = {str(sample.id): sample for sample in self.sample_service.iter_samples()}
+        return self._build_hierarchy(container, index)
     
-    def _build_hierarchy(self, container) -> dict:
+    def _build_hierarchy(self, container, index: Dict[str, Any]) -> dict:
         """Build a hierarchy dictionary for a container.
         
+        Nested containers are expanded with an explicit stack rather than
+        recursion; each container is expanded at most once.
+        
         Args:
             container: The container to build the hierarchy for
+            index: All samples keyed by string ID
             
         Returns:
             A dictionary representing the container and its contained samples
@@ -148,19 +211,27 @@ class ContainerManager:
             'children': []
         }
         
-        if hasattr(container, 'contained_sample_ids') and container.contained_sample_ids:
-            for sample_id in container.contained_sample_ids:
-                sample = self.sample_service.get_sample(sample_id)
-                if sample:
-                    if getattr(sample, 'is_container', False):
-                        # Recursive call for nested containers
-                        result['children'].append(self._build_hierarchy(sample))
-                    else:
-                        # Add leaf sample
-                        result['children'].append({
-                            'id': str(sample.id),
-                            'name': sample.name,
-                            'type': sample.sample_type,
-                        })
-        
-        return result
\ No newline at end of file
+        expanded = {str(container.id)}
+        stack = [(container, result)]
+        while stack:
+            current, node = stack.pop()
+            children = node['children']
+            for sample_id in current.contained_sample_ids:
+                sample = index.get(str(sample_id))
+                if not sample:
+                    continue
+                child = {
+                    'id': str(sample.id),
+                    'name': sample.name,
+                    'type': sample.sample_type,
+                }
+                children.append(child)
+                
+                # Nested containers get their own children, filled in later
+                if sample.is_container:
+                    child['children'] = []
+                    if child['id'] not in expanded:
+                        expanded.add(child['id'])
+                        stack.append((sample, child))
+        
+        return result
@@ -1,10 +1,17 @@
 """Sample repository for storing and retrieving samples."""
 
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict, deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from blims.models.sample import Sample
 
+# Number of lineage query results kept by each repository
+_LINEAGE_CACHE_SIZE = 1024
+
+# Sentinel for metadata keys a sample does not have
+_MISSING = object()
+
 
 class SampleRepository:
     """Repository for managing sample records.
@@ -15,7 +22,22 @@ class SampleRepository:
 
     def __init__(self):
         """Initialize a new sample repository."""
+        # Keyed by UUID, matching the parent/child IDs held on samples;
+        # converting to uuid.hex per lookup costs more than hashing the UUID
         self._samples: Dict[UUID, Sample] = {}
+        # Position of each sample in insertion order, for ordering results
+        # taken from the unordered metadata index
+        self._positions: Dict[UUID, int] = {}
+        # Human-readable sample_id (s1, s2, ...) -> UUID
+        self._by_sample_id: Dict[str, UUID] = {}
+        # Inverted index of (metadata key, value) -> sample IDs
+        self._metadata_index: Dict[Tuple[str, Hashable], Set[UUID]] = {}
+        # Lineage query results: (link attribute, sample ID) -> related
+        # samples, least recently used first. Lineage only changes in add(),
+        # which drops the affected entries
+        self._lineage_cache: "OrderedDict[Tuple[str, UUID], Tuple[Sample, ...]]" = OrderedDict()
+        # Parent IDs named by stored samples but not (yet) in the repository
+        self._missing_parent_ids: Set[UUID] = set()
 
     def add(self, sample: Sample) -> None:
         """Add a sample to the repository.
@@ -33,8 +55,82 @@ class SampleRepository:
         for parent_id in sample.parent_ids:
             if parent_id in self._samples:
                 self._samples[parent_id].add_child(sample.id)
+            else:
+                self._missing_parent_ids.add(parent_id)
 
+        self._positions[sample.id] = len(self._samples)
         self._samples[sample.id] = sample
+        self._by_sample_id[sample.sample_id] = sample.id
+        self._invalidate_lineage(sample)
+
+        for key, value in sample.metadata.items():
+            self._index_metadata(sample.id, key, value)
+
+    def _invalidate_lineage(self, sample: Sample) -> None:
+        """Drop the cached lineage results a newly added sample changes.
+
+        A new sample only joins the descendants of its ancestors, unless
+        stored samples already named it as a parent; their whole lineage
+        then changes, and the cache is cleared.
+
+        Args:
+            sample: The sample just added
+        """
+        if sample.id in self._missing_parent_ids:
+            self._missing_parent_ids.discard(sample.id)
+            self._lineage_cache.clear()
+            return
+
+        if not self._lineage_cache:
+            return
+        for ancestor in self._walk_lineage(sample, "parent_ids"):
+            self._lineage_cache.pop(("child_ids", ancestor.id), None)
+
+    def _index_metadata(self, sample_id: UUID, key: str, value: Any) -> None:
+        """Record a metadata value in the inverted index.
+
+        Unhashable values (lists, dicts) are not indexed and are only found
+        by the linear fallback in search_by_metadata.
+        """
+        try:
+            self._metadata_index.setdefault((key, value), set()).add(sample_id)
+        except TypeError:
+            pass
+
+    def _unindex_metadata(self, sample_id: UUID, key: str, value: Any) -> None:
+        """Remove a metadata value from the inverted index."""
+        try:
+            sample_ids = self._metadata_index.get((key, value))
+        except TypeError:
+            return
+        if sample_ids is not None:
+            sample_ids.discard(sample_id)
+            if not sample_ids:
+                del self._metadata_index[(key, value)]
+
+    def set_metadata(self, sample_id: UUID, key: str, value: Any) -> Sample:
+        """Set a metadata value on a stored sample and keep the index in sync.
+
+        Args:
+            sample_id: The ID of the sample to modify
+            key: The metadata key
+            value: The metadata value
+
+        Returns:
+            The updated sample
+
+        Raises:
+            ValueError: If the sample does not exist
+        """
+        sample = self._samples.get(sample_id)
+        if not sample:
+            raise ValueError(f"Sample with ID {sample_id} not found")
+
+        if key in sample.metadata:
+            self._unindex_metadata(sample_id, key, sample.metadata[key])
+        sample.add_metadata(key, value)
+        self._index_metadata(sample_id, key, value)
+        return sample
 
     def get(self, sample_id: UUID) -> Optional[Sample]:
         """Get a sample by ID.
@@ -47,6 +143,36 @@ class SampleRepository:
         """
         return self._samples.get(sample_id)
 
+    def get_by_sample_id(self, sample_id: str) -> Optional[Sample]:
+        """Get a sample by its human-readable ID.
+
+        Args:
+            sample_id: The sample ID to look up (s1, s2, etc.)
+
+        Returns:
+            The sample if found, None otherwise
+        """
+        uuid = self._by_sample_id.get(sample_id)
+        if uuid is None:
+            return None
+        return self._samples.get(uuid)
+
+    def get_many(self, sample_ids: Iterable[UUID]) -> Dict[UUID, Sample]:
+        """Get several samples by ID in one call.
+
+        Args:
+            sample_ids: The IDs of the samples to retrieve
+
+        Returns:
+            The samples found, keyed by ID; missing IDs are left out
+        """
+        samples = self._samples
+        return {
+            sample_id: samples[sample_id]
+            for sample_id in sample_ids
+            if sample_id in samples
+        }
+
     def get_all(self) -> List[Sample]:
         """Get all samples in the repository.
 
@@ -65,10 +191,52 @@ class SampleRepository:
         Returns:
             List of samples with matching metadata
         """
+        return self.search_by_metadata({key: value})
+
+    def search_by_metadata(self, metadata_filters: Dict[str, Any]) -> List[Sample]:
+        """Get samples matching all of the given metadata filters.
+
+        Hashable filter values are answered from the inverted index by
+        intersecting the matching ID sets, smallest first. Unhashable values
+        are checked against each candidate sample.
+
+        Args:
+            metadata_filters: Dictionary of metadata key-value pairs to match
+
+        Returns:
+            List of matching samples, in the order they were added
+        """
+        postings = []
+        for key, value in metadata_filters.items():
+            try:
+                postings.append(self._metadata_index.get((key, value), set()))
+            except TypeError:
+                continue
+
+        if postings:
+            postings.sort(key=len)
+            candidate_ids = set(postings[0]).intersection(*postings[1:])
+            positions = self._positions
+            candidates = [
+                self._samples[sample_id]
+                for sample_id in sorted(
+                    (sid for sid in candidate_ids if sid in positions),
+                    key=positions.__getitem__,
+                )
+            ]
+        else:
+            candidates = list(self._samples.values())
+
+        # Re-check every filter so metadata changed outside set_metadata
+        # can never produce a false match
+        filters = tuple(metadata_filters.items())
         return [
             sample
-            for sample in self._samples.values()
-            if key in sample.metadata and sample.metadata[key] == value
+            for sample in candidates
+            if all(
+                sample.metadata.get(key, _MISSING) == value
+                for key, value in filters
+            )
         ]
 
     def get_ancestry(self, sample_id: UUID) -> List[Sample]:
@@ -83,20 +251,11 @@ class SampleRepository:
         Raises:
             ValueError: If the sample does not exist
         """
-        if sample_id not in self._samples:
+        sample = self._samples.get(sample_id)
+        if sample is None:
             raise ValueError(f"Sample with ID {sample_id} does not exist")
 
-        sample = self._samples[sample_id]
-        ancestors = []
-
-        # Recursively collect all ancestors
-        for parent_id in sample.parent_ids:
-            parent = self.get(parent_id)
-            if parent:
-                ancestors.append(parent)
-                ancestors.extend(self.get_ancestry(parent_id))
-
-        return ancestors
+        return self._walk_lineage(sample, "parent_ids")
 
     def get_descendants(self, sample_id: UUID) -> List[Sample]:
         """Get all descendants of a sample.
@@ -110,17 +269,48 @@ class SampleRepository:
         Raises:
             ValueError: If the sample does not exist
         """
-        if sample_id not in self._samples:
+        sample = self._samples.get(sample_id)
+        if sample is None:
             raise ValueError(f"Sample with ID {sample_id} does not exist")
 
-        sample = self._samples[sample_id]
-        descendants = []
+        return self._walk_lineage(sample, "child_ids")
+
+    def _walk_lineage(self, start: Sample, link_attr: str) -> List[Sample]:
+        """Collect the samples reachable from a sample through one link type.
+
+        Walks breadth-first with a visited set, so a sample reached along
+        several paths (diamond-shaped lineages) is returned only once. Each
+        sample is looked up once, when it is first reached. Results are
+        cached until an add() changes them, so repeated queries skip the walk.
 
-        # Recursively collect all descendants
-        for child_id in sample.child_ids:
-            child = self.get(child_id)
-            if child:
-                descendants.append(child)
-                descendants.extend(self.get_descendants(child_id))
+        Args:
+            start: The sample to start from
+            link_attr: The sample attribute to follow ("parent_ids" or "child_ids")
 
-        return descendants
+        Returns:
+            List of related samples, nearest first
+        """
+        cache_key = (link_attr, start.id)
+        cached = self._lineage_cache.get(cache_key)
+        if cached is not None:
+            self._lineage_cache.move_to_end(cache_key)
+            return list(cached)
+
+        get = self._samples.get
+        visited = {start.id}
+        related = []
+        queue = deque([start])
+        while queue:
+            for linked_id in getattr(queue.popleft(), link_attr):
+                if linked_id in visited:
+                    continue
+                visited.add(linked_id)
+                linked = get(linked_id)
+                if linked is not None:
+                    related.append(linked)
+                    queue.append(linked)
+
+        self._lineage_cache[cache_key] = tuple(related)
+        if len(self._lineage_cache) > _LINEAGE_CACHE_SIZE:
+            self._lineage_cache.popitem(last=False)
+        return related
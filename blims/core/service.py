@@ -52,15 +52,18 @@ class SampleService:
         """
         # Validate parent samples exist
         if parent_ids:
-            for parent_id in parent_ids:
-                if not self.repository.get(parent_id):
-                    raise ValueError(f"Parent sample with ID {parent_id} not found")
+            parents = self.repository.get_many(parent_ids)
+            if len(parents) != len(set(parent_ids)):
+                missing = next(pid for pid in parent_ids if pid not in parents)
+                raise ValueError(f"Parent sample with ID {missing} not found")
 
-        # Validate contained samples exist
+        # Validate contained samples exist, keeping them for the update below
+        contained: Dict[UUID, Sample] = {}
         if contained_sample_ids:
-            for sample_id in contained_sample_ids:
-                if not self.repository.get(sample_id):
-                    raise ValueError(f"Sample with ID {sample_id} not found")
+            contained = self.repository.get_many(contained_sample_ids)
+            if len(contained) != len(set(contained_sample_ids)):
+                missing = next(sid for sid in contained_sample_ids if sid not in contained)
+                raise ValueError(f"Sample with ID {missing} not found")
 
         # Create and add the sample
         sample = Sample(
@@ -78,11 +81,8 @@ class SampleService:
         self.repository.add(sample)
         
         # Update container references for contained samples
-        if contained_sample_ids:
-            for sample_id in contained_sample_ids:
-                contained_sample = self.repository.get(sample_id)
-                if contained_sample:
-                    contained_sample.set_container(sample.id)
+        for contained_sample in contained.values():
+            contained_sample.set_container(sample.id)
         
         return sample
 
@@ -142,12 +142,7 @@ class SampleService:
         Raises:
             ValueError: If the sample doesn't exist
         """
-        sample = self.repository.get(sample_id)
-        if not sample:
-            raise ValueError(f"Sample with ID {sample_id} not found")
-
-        sample.add_metadata(key, value)
-        return sample
+        return self.repository.set_metadata(sample_id, key, value)
 
     def add_file_to_sample(self, sample_id: UUID, file_path: str) -> Sample:
         """Add a file to an existing sample.
@@ -182,15 +177,18 @@ class SampleService:
         Raises:
             ValueError: If either sample doesn't exist
         """
-        sample = self.repository.get(sample_id)
+        found = self.repository.get_many((sample_id, container_id))
+
+        sample = found.get(sample_id)
         if not sample:
             raise ValueError(f"Sample with ID {sample_id} not found")
-            
-        container = self.repository.get(container_id)
+
+        container = found.get(container_id)
         if not container:
             raise ValueError(f"Container sample with ID {container_id} not found")
-            
-        # Check if the sample is already in another container
+
+        # Check if the sample is already in another container; only then is
+        # a further lookup needed
         if sample.container_id and sample.container_id != container_id:
             old_container = self.repository.get(sample.container_id)
             if old_container:
@@ -266,11 +264,7 @@ class SampleService:
         if not container:
             raise ValueError(f"Container sample with ID {container_id} not found")
             
-        return [
-            self.repository.get(sample_id) 
-            for sample_id in container.contained_sample_ids
-            if self.repository.get(sample_id)
-        ]
+        return list(self.repository.get_many(container.contained_sample_ids).values())
 
     def search_samples(self, metadata_filters: Dict[str, Any]) -> List[Sample]:
         """Search for samples matching metadata filters.
@@ -281,15 +275,4 @@ class SampleService:
         Returns:
             List of samples matching all filters
         """
-        # Start with all samples
-        results = self.repository.get_all()
-
-        # Apply each filter
-        for key, value in metadata_filters.items():
-            results = [
-                sample
-                for sample in results
-                if key in sample.metadata and sample.metadata[key] == value
-            ]
-
-        return results
+        return self.repository.search_by_metadata(metadata_filters)
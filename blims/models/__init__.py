@@ -6,4 +6,4 @@ from blims.models.sample import Sample
 from blims.models.job import Job, JobStatus, JobType
 from blims.models.analysis import Analysis
 from blims.models.genome import Genome
-from blims.models.feature import Feature, FeatureType
+from blims.models.feature import Feature, FeatureType, FrozenFeature
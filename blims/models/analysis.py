@@ -16,12 +16,30 @@ class AnalysisStatus(Enum):
     CANCELED = "canceled"
 
 
+# AnalysisStatus by value, for converting serialized statuses
+_STATUS_BY_VALUE = {status.value: status for status in AnalysisStatus}
+
+# Timestamp fields stored as ISO 8601 strings when serialized
+_TIMESTAMP_FIELDS = ('started_at', 'completed_at', 'created_at')
+
+# Statuses that mark an analysis as complete
+_FINISHED_STATUSES = frozenset({
+    AnalysisStatus.SUCCEEDED, AnalysisStatus.FAILED, AnalysisStatus.CANCELED
+})
+
+
 class Analysis:
     """An analysis in the LIMS system.
     
     Represents a bioinformatics analysis run on sample data.
     """
     
+    __slots__ = (
+        "id", "name", "analysis_type", "sample_id", "created_by", "created_at",
+        "job_id", "status", "input_files", "output_files", "parameters",
+        "started_at", "completed_at", "metadata", "_id_str", "_created_at_iso",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -37,6 +55,7 @@ class Analysis:
         started_at: Optional[datetime] = None,
         completed_at: Optional[datetime] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None,
     ):
         """Initialize a new Analysis.
         
@@ -54,13 +73,15 @@ class Analysis:
             started_at: When the analysis started
             completed_at: When the analysis completed
             metadata: Additional metadata
+            created_at: Creation time (now if not provided); pass one shared
+                value when creating many objects at once
         """
         self.id = id or uuid4()
         self.name = name
         self.analysis_type = analysis_type
         self.sample_id = sample_id
         self.created_by = created_by
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
         self.job_id = job_id
         self.status = status
         self.input_files = input_files or []
@@ -70,6 +91,11 @@ class Analysis:
         self.completed_at = completed_at
         self.metadata = metadata or {}
         
+        # String forms used by to_dict; id and created_at never change.
+        # created_at is formatted on first use, keeping bulk creation cheap
+        self._id_str = str(self.id)
+        self._created_at_iso: Optional[str] = None
+        
     def update_status(self, status: AnalysisStatus) -> None:
         """Update the status of the analysis.
         
@@ -78,12 +104,12 @@ class Analysis:
         """
         self.status = status
         
-        # Update timestamps based on status
-        now = datetime.now()
-        if status == AnalysisStatus.RUNNING and not self.started_at:
-            self.started_at = now
-        elif status in [AnalysisStatus.SUCCEEDED, AnalysisStatus.FAILED, AnalysisStatus.CANCELED]:
-            self.completed_at = now
+        # Update timestamps based on status, reading the clock only if needed
+        if status == AnalysisStatus.RUNNING:
+            if not self.started_at:
+                self.started_at = datetime.now()
+        elif status in _FINISHED_STATUSES:
+            self.completed_at = datetime.now()
     
     def add_output_file(self, file_info: Dict[str, Any]) -> None:
         """Add an output file to the analysis.
@@ -93,6 +119,14 @@ class Analysis:
         """
         self.output_files.append(file_info)
     
+    def add_output_files(self, file_infos: List[Dict[str, Any]]) -> None:
+        """Add several output files to the analysis.
+        
+        Args:
+            file_infos: Information about each output file
+        """
+        self.output_files.extend(file_infos)
+    
     def add_metadata(self, key: str, value: Any) -> None:
         """Add metadata to the analysis.
         
@@ -102,29 +136,58 @@ class Analysis:
         """
         self.metadata[key] = value
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization.
+    def _raw_dict(self) -> Dict[str, Any]:
+        """Get the serialized fields, with UUIDs and datetimes left as objects.
         
-        Returns:
-            Dictionary representation of the analysis
+        Shared by to_dict and to_orjson so the field set is defined once.
         """
         return {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
             "analysis_type": self.analysis_type,
-            "sample_id": str(self.sample_id) if isinstance(self.sample_id, UUID) else self.sample_id,
+            "sample_id": self.sample_id,
             "created_by": self.created_by,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
             "job_id": self.job_id,
             "status": self.status.value if isinstance(self.status, AnalysisStatus) else self.status,
             "input_files": self.input_files,
             "output_files": self.output_files,
             "parameters": self.parameters,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
             "metadata": self.metadata,
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+        
+        Returns:
+            Dictionary representation of the analysis
+        """
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+        
+        data = self._raw_dict()
+        data["id"] = self._id_str
+        if isinstance(self.sample_id, UUID):
+            data["sample_id"] = str(self.sample_id)
+        data["created_at"] = self._created_at_iso
+        data["started_at"] = self.started_at.isoformat() if self.started_at else None
+        data["completed_at"] = self.completed_at.isoformat() if self.completed_at else None
+        return data
+    
+    def to_orjson(self) -> Dict[str, Any]:
+        """Convert to dictionary for orjson serialization.
+        
+        UUIDs and datetimes are left as objects; orjson serializes them
+        natively to the same strings to_dict produces, without the
+        per-field string conversions.
+        
+        Returns:
+            Dictionary representation of the analysis
+        """
+        return self._raw_dict()
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Analysis':
         """Create an Analysis from a dictionary.
@@ -135,23 +198,20 @@ class Analysis:
         Returns:
             Analysis instance
         """
-        # Convert status string to enum
-        if 'status' in data and isinstance(data['status'], str):
-            try:
-                data['status'] = AnalysisStatus(data['status'])
-            except ValueError:
-                # Default to pending if invalid status
-                data['status'] = AnalysisStatus.PENDING
+        # Convert status string to enum, defaulting to pending if invalid
+        status = data.get('status')
+        if type(status) is str:
+            data['status'] = _STATUS_BY_VALUE.get(status, AnalysisStatus.PENDING)
                 
         # Convert timestamp strings to datetime
-        if 'started_at' in data and data['started_at'] and isinstance(data['started_at'], str):
-            data['started_at'] = datetime.fromisoformat(data['started_at'])
-            
-        if 'completed_at' in data and data['completed_at'] and isinstance(data['completed_at'], str):
-            data['completed_at'] = datetime.fromisoformat(data['completed_at'])
+        for field in _TIMESTAMP_FIELDS:
+            value = data.get(field)
+            if type(value) is str and value:
+                data[field] = datetime.fromisoformat(value)
             
         # Convert id to UUID if needed
-        if 'id' in data and data['id'] and isinstance(data['id'], str):
-            data['id'] = UUID(data['id'])
+        analysis_id = data.get('id')
+        if type(analysis_id) is str and analysis_id:
+            data['id'] = UUID(analysis_id)
             
         return cls(**data)
\ No newline at end of file
@@ -1,8 +1,9 @@
 """Feature model for BLIMS."""
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Any, Set, Union, Tuple
 from uuid import UUID, uuid4
 
 
@@ -23,6 +24,90 @@ class FeatureType(str, Enum):
     CUSTOM = "CUSTOM"
 
 
+def _as_uuid(value: Union[UUID, str]) -> UUID:
+    """Convert a non-UUID ID to a UUID, parsing strings without a str() copy.
+
+    Callers check ``type(value) is UUID`` inline first, so the common case
+    costs no function call.
+    """
+    if type(value) is str:
+        return UUID(value)
+    return UUID(str(value))
+
+
+class _IdList(list):
+    """A list of IDs that counts its in-place changes.
+    
+    Models keep string forms and membership sets of their public ID lists;
+    these record the version they were built at and are rebuilt once it
+    has moved on, however the list was changed.
+    """
+    
+    __slots__ = ("version",)
+    
+    def __init__(self, ids: Iterable[Any] = ()) -> None:
+        super().__init__(ids)
+        self.version = 0
+    
+    def __reduce__(self):
+        # Rebuilt through __init__, so copies and unpickled lists start counting at 0
+        return (_IdList, (list(self),))
+
+
+def _counting(name: str):
+    """Wrap a mutating list method so it bumps _IdList.version."""
+    method = getattr(list, name)
+    
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(_IdList, _name, _counting(_name))
+del _name
+
+
+class FrozenFeature(NamedTuple):
+    """A read-only snapshot of a feature's identity and coordinates.
+    
+    Used by query paths that only read positions, so results carry no
+    metadata or child lists. Hydrate the full Feature by ID when needed.
+    """
+    
+    id: UUID
+    name: str
+    feature_type: FeatureType
+    chromosome: str
+    start: int
+    end: int
+    strand: Optional[str]
+    genome_id: Union[UUID, str]
+    parent_id: Optional[Union[UUID, str]]
+    
+    def get_position(self) -> Tuple[str, int, int, Optional[str]]:
+        """Get the genomic position of this feature.
+        
+        Returns:
+            Tuple of (chromosome, start, end, strand)
+        """
+        return (self.chromosome, self.start, self.end, self.strand)
+    
+    def get_length(self) -> int:
+        """Get the length of this feature in base pairs.
+        
+        Returns:
+            Length of the feature
+        """
+        return self.end - self.start + 1
+
+
 class Feature:
     """A genomic feature in the LIMS system.
     
@@ -30,6 +115,15 @@ class Feature:
     exons, variants, or regulatory elements.
     """
     
+    __slots__ = (
+        "id", "name", "feature_type", "chromosome", "start", "end", "genome_id",
+        "created_by", "created_at", "strand", "description", "sequence",
+        "parent_id", "_metadata", "_child_ids", "_child_id_set",
+        "_child_id_set_version", "_id_str",
+        "_created_at_iso", "_child_ids_str", "_child_ids_str_version", "_position",
+        "_position_key", "_length",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -45,6 +139,7 @@ class Feature:
         sequence: Optional[str] = None,
         parent_id: Optional[Union[UUID, str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None,
     ):
         """Initialize a new Feature.
         
@@ -62,38 +157,126 @@ class Feature:
             sequence: Optional nucleotide sequence of the feature
             parent_id: Optional ID of a parent feature (e.g., gene for an exon)
             metadata: Additional metadata as key-value pairs
+            created_at: Creation time (now if not provided); pass one shared
+                value when creating many objects at once
         """
         self.id = id or uuid4()
         self.name = name
         self.feature_type = feature_type if isinstance(feature_type, FeatureType) else FeatureType(feature_type)
-        self.chromosome = chromosome
+        # Interned: a genome has few chromosome names shared by many features
+        self.chromosome = chromosome = sys.intern(chromosome)
         self.start = start
         self.end = end
         self.genome_id = genome_id
         self.created_by = created_by
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
         self.strand = strand
         self.description = description
         self.sequence = sequence
         self.parent_id = parent_id
-        self.metadata = metadata or {}
-        self.child_ids: List[UUID] = []
+        # Most features have no metadata or children; these containers are
+        # allocated on first use (see the metadata and child_ids properties)
+        self._metadata: Optional[Dict[str, Any]] = metadata or None
+        self._child_ids: Optional[_IdList] = None
+        self._child_id_set: Optional[Set[UUID]] = None
+        self._child_id_set_version = 0
+        
+        # Coordinates are fixed once the feature is created
+        self._position = (chromosome, start, end, strand)
+        self._position_key = (chromosome, start, end)
+        self._length = end - start + 1
+        
+        # String forms used by to_dict; id and created_at never change.
+        # created_at is formatted on first use, keeping bulk creation cheap
+        self._id_str = str(self.id)
+        self._created_at_iso: Optional[str] = None
+        self._child_ids_str: Optional[List[str]] = None
+        self._child_ids_str_version = 0
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional metadata as key-value pairs, allocated on first access."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+    
+    @property
+    def child_ids(self) -> List[UUID]:
+        """IDs of the child features, allocated on first access.
+        
+        Assigning a list stores a copy; change the contents in place or
+        with add_child/add_children.
+        """
+        if self._child_ids is None:
+            self._child_ids = _IdList()
+        return self._child_ids
+    
+    @child_ids.setter
+    def child_ids(self, value: List[UUID]) -> None:
+        self._child_ids = _IdList(value)
+        self._child_id_set = None
+        self._child_ids_str = None
+    
+    def _synced_child_id_set(self) -> Set[UUID]:
+        """Get the child ID set, rebuilt if child_ids changed without add_child."""
+        child_ids = self.child_ids
+        child_id_set = self._child_id_set
+        if child_id_set is None or self._child_id_set_version != child_ids.version:
+            child_id_set = self._child_id_set = set(child_ids)
+            self._child_id_set_version = child_ids.version
+        return child_id_set
+    
+    def _synced_child_ids_str(self) -> Optional[List[str]]:
+        """Get the string forms of child_ids, or None if not built or stale."""
+        child_ids_str = self._child_ids_str
+        if child_ids_str is not None and self._child_ids_str_version != self.child_ids.version:
+            child_ids_str = self._child_ids_str = None
+        return child_ids_str
     
     def get_position(self) -> Tuple[str, int, int, Optional[str]]:
         """Get the genomic position of this feature.
         
+        Computed once when the feature is created; coordinates are not
+        expected to change afterwards.
+        
         Returns:
             Tuple of (chromosome, start, end, strand)
         """
-        return (self.chromosome, self.start, self.end, self.strand)
+        return self._position
+    
+    @property
+    def position_key(self) -> Tuple[str, int, int]:
+        """Sort key ordering features by (chromosome, start, end).
+        
+        Computed once when the feature is created, so sorting many
+        features does not rebuild a key tuple per feature.
+        """
+        return self._position_key
     
     def get_length(self) -> int:
         """Get the length of this feature in base pairs.
         
+        Computed once when the feature is created.
+        
         Returns:
             Length of the feature
         """
-        return self.end - self.start + 1
+        return self._length
+    
+    def freeze(self) -> FrozenFeature:
+        """Get a read-only snapshot of this feature's identity and coordinates.
+        
+        Returns:
+            The frozen feature
+        """
+        return FrozenFeature(
+            self.id, self.name, self.feature_type, self.chromosome, self.start,
+            self.end, self.strand, self.genome_id, self.parent_id,
+        )
     
     def add_child(self, feature_id: Union[UUID, str]) -> None:
         """Add a child feature to this feature.
@@ -101,9 +284,40 @@ class Feature:
         Args:
             feature_id: The ID of the child feature
         """
-        feature_id_uuid = feature_id if isinstance(feature_id, UUID) else UUID(str(feature_id))
-        if feature_id_uuid not in self.child_ids:
-            self.child_ids.append(feature_id_uuid)
+        feature_id_uuid = feature_id if type(feature_id) is UUID else _as_uuid(feature_id)
+        
+        seen = self._synced_child_id_set()
+        if feature_id_uuid not in seen:
+            seen.add(feature_id_uuid)
+            child_ids = self.child_ids
+            child_ids_str = self._synced_child_ids_str()
+            child_ids.append(feature_id_uuid)
+            self._child_id_set_version = child_ids.version
+            if child_ids_str is not None:
+                child_ids_str.append(str(feature_id_uuid))
+                self._child_ids_str_version = child_ids.version
+    
+    def add_children(self, feature_ids: Iterable[Union[UUID, str]]) -> None:
+        """Add several child features to this feature.
+        
+        Children already present, or repeated in feature_ids, are added once.
+        
+        Args:
+            feature_ids: The IDs of the child features
+        """
+        seen = self._synced_child_id_set()
+        child_ids = self.child_ids
+        child_ids_str = self._synced_child_ids_str()
+        for feature_id in feature_ids:
+            feature_id_uuid = feature_id if type(feature_id) is UUID else _as_uuid(feature_id)
+            if feature_id_uuid not in seen:
+                seen.add(feature_id_uuid)
+                child_ids.append(feature_id_uuid)
+                if child_ids_str is not None:
+                    child_ids_str.append(str(feature_id_uuid))
+        self._child_id_set_version = child_ids.version
+        if child_ids_str is not None:
+            self._child_ids_str_version = child_ids.version
     
     def update_metadata(self, key: str, value: Any) -> None:
         """Update metadata for this feature.
@@ -114,26 +328,67 @@ class Feature:
         """
         self.metadata[key] = value
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert this feature to a dictionary for serialization.
+    def _raw_dict(self) -> Dict[str, Any]:
+        """Get the serialized fields, with UUIDs and datetimes left as objects.
         
-        Returns:
-            Dictionary representation of the feature
+        Shared by to_dict and to_orjson so the field set is defined once;
+        child_ids is the live list, replaced by both callers.
         """
         return {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
             "feature_type": self.feature_type.value,
             "chromosome": self.chromosome,
             "start": self.start,
             "end": self.end,
             "strand": self.strand,
-            "genome_id": str(self.genome_id),
+            "genome_id": self.genome_id,
             "created_by": self.created_by,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
             "description": self.description,
             "sequence": self.sequence,
-            "parent_id": str(self.parent_id) if self.parent_id else None,
-            "child_ids": [str(cid) for cid in self.child_ids],
-            "metadata": self.metadata
-        }
\ No newline at end of file
+            "parent_id": self.parent_id or None,
+            "child_ids": self._child_ids,
+            "metadata": self._metadata if self._metadata is not None else {}
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert this feature to a dictionary for serialization.
+        
+        Returns:
+            Dictionary representation of the feature
+        """
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+        
+        # Rebuild the string IDs if child_ids was changed without add_child
+        child_ids = self._child_ids
+        if child_ids:
+            if self._synced_child_ids_str() is None:
+                self._child_ids_str = [str(cid) for cid in child_ids]
+                self._child_ids_str_version = child_ids.version
+            child_ids_str = list(self._child_ids_str)
+        else:
+            child_ids_str = []
+        
+        data = self._raw_dict()
+        data["id"] = self._id_str
+        data["genome_id"] = str(self.genome_id)
+        data["created_at"] = self._created_at_iso
+        data["parent_id"] = str(self.parent_id) if self.parent_id else None
+        data["child_ids"] = child_ids_str
+        return data
+    
+    def to_orjson(self) -> Dict[str, Any]:
+        """Convert this feature to a dictionary for orjson serialization.
+        
+        UUIDs and datetimes are left as objects; orjson serializes them
+        natively to the same strings to_dict produces, without the
+        per-field string conversions.
+        
+        Returns:
+            Dictionary representation of the feature
+        """
+        data = self._raw_dict()
+        data["child_ids"] = list(self._child_ids or ())
+        return data
\ No newline at end of file
@@ -1,9 +1,11 @@
 """Genome model for BLIMS."""
 
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, List, Optional, Any, Set, Union
 from uuid import UUID, uuid4
 
+from blims.models.feature import _IdList, _as_uuid
+
 
 class Genome:
     """A genome in the LIMS system.
@@ -13,6 +15,13 @@ class Genome:
     features.
     """
     
+    __slots__ = (
+        "id", "name", "species", "assembly_version", "created_by", "created_at",
+        "description", "fasta_path", "index_paths", "sample_id", "metadata",
+        "_feature_ids", "_feature_id_set", "_feature_id_set_version", "_id_str",
+        "_created_at_iso", "_feature_ids_str", "_feature_ids_str_version",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -25,6 +34,7 @@ class Genome:
         index_paths: Optional[Dict[str, str]] = None,
         sample_id: Optional[Union[UUID, str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None,
     ):
         """Initialize a new Genome.
         
@@ -39,19 +49,63 @@ class Genome:
             index_paths: Dictionary of paths to genome indices (key=tool, value=path)
             sample_id: Optional ID of a sample this genome is derived from
             metadata: Additional metadata as key-value pairs
+            created_at: Creation time (now if not provided); pass one shared
+                value when creating many objects at once
         """
         self.id = id or uuid4()
         self.name = name
         self.species = species
         self.assembly_version = assembly_version
         self.created_by = created_by
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
         self.description = description
         self.fasta_path = fasta_path
         self.index_paths = index_paths or {}
         self.sample_id = sample_id
         self.metadata = metadata or {}
-        self.feature_ids: List[UUID] = []
+        self.feature_ids = []
+        
+        # String forms used by to_dict; id and created_at never change.
+        # created_at is formatted on first use, keeping bulk creation cheap
+        self._id_str = str(self.id)
+        self._created_at_iso: Optional[str] = None
+    
+    @property
+    def feature_ids(self) -> List[UUID]:
+        """IDs of the features in this genome, in insertion order.
+        
+        Assigning a list stores a copy; change the contents in place or
+        with add_feature/add_features.
+        """
+        return self._feature_ids
+    
+    @feature_ids.setter
+    def feature_ids(self, value: List[UUID]) -> None:
+        self._feature_ids = _IdList(value)
+        # The membership set and string forms of the old list no longer
+        # apply; unless the list is empty, to_dict rebuilds the strings
+        self._feature_id_set: Set[UUID] = set(value)
+        self._feature_id_set_version = 0
+        self._feature_ids_str: List[str] = []
+        self._feature_ids_str_version = -1 if value else 0
+    
+    def _synced_feature_id_set(self) -> Set[UUID]:
+        """Get the feature ID set, rebuilt if feature_ids changed without add_feature."""
+        feature_ids = self._feature_ids
+        if self._feature_id_set_version != feature_ids.version:
+            self._feature_id_set = set(feature_ids)
+            self._feature_id_set_version = feature_ids.version
+        return self._feature_id_set
+    
+    def _extend_feature_ids(self, new_ids: List[UUID]) -> None:
+        """Append new feature IDs, extending their string forms if current."""
+        feature_ids = self._feature_ids
+        in_step = self._feature_ids_str_version == feature_ids.version
+        feature_ids.extend(new_ids)
+        self._feature_id_set_version = feature_ids.version
+        if in_step:
+            self._feature_ids_str.extend([str(fid) for fid in new_ids])
+            self._feature_ids_str_version = feature_ids.version
         
     def add_feature(self, feature_id: Union[UUID, str]) -> None:
         """Add a feature to this genome.
@@ -59,9 +113,31 @@ class Genome:
         Args:
             feature_id: The ID of the feature to add
         """
-        feature_id_uuid = feature_id if isinstance(feature_id, UUID) else UUID(str(feature_id))
-        if feature_id_uuid not in self.feature_ids:
-            self.feature_ids.append(feature_id_uuid)
+        feature_id_uuid = feature_id if type(feature_id) is UUID else _as_uuid(feature_id)
+        
+        seen = self._synced_feature_id_set()
+        if feature_id_uuid not in seen:
+            seen.add(feature_id_uuid)
+            self._extend_feature_ids([feature_id_uuid])
+    
+    def add_features(self, feature_ids: Iterable[Union[UUID, str]]) -> None:
+        """Add several features to this genome.
+        
+        Features already in the genome, or repeated in feature_ids, are
+        added once.
+        
+        Args:
+            feature_ids: The IDs of the features to add
+        """
+        seen = self._synced_feature_id_set()
+        new_ids = []
+        for feature_id in feature_ids:
+            feature_id_uuid = feature_id if type(feature_id) is UUID else _as_uuid(feature_id)
+            if feature_id_uuid not in seen:
+                seen.add(feature_id_uuid)
+                new_ids.append(feature_id_uuid)
+        if new_ids:
+            self._extend_feature_ids(new_ids)
     
     def add_index(self, tool: str, path: str) -> None:
         """Add or update an index path for this genome.
@@ -81,23 +157,59 @@ class Genome:
         """
         self.metadata[key] = value
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert this genome to a dictionary for serialization.
+    def _raw_dict(self) -> Dict[str, Any]:
+        """Get the serialized fields, with UUIDs and datetimes left as objects.
         
-        Returns:
-            Dictionary representation of the genome
+        Shared by to_dict and to_orjson so the field set is defined once;
+        feature_ids is the live list, replaced by both callers.
         """
         return {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
             "species": self.species,
             "assembly_version": self.assembly_version,
             "created_by": self.created_by,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
             "description": self.description,
             "fasta_path": self.fasta_path,
             "index_paths": self.index_paths,
-            "sample_id": str(self.sample_id) if self.sample_id else None,
-            "feature_ids": [str(fid) for fid in self.feature_ids],
+            "sample_id": self.sample_id or None,
+            "feature_ids": self.feature_ids,
             "metadata": self.metadata
-        }
\ No newline at end of file
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert this genome to a dictionary for serialization.
+        
+        Returns:
+            Dictionary representation of the genome
+        """
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+        
+        # Rebuild the string IDs if feature_ids was changed without add_feature
+        feature_ids = self._feature_ids
+        if self._feature_ids_str_version != feature_ids.version:
+            self._feature_ids_str = [str(fid) for fid in feature_ids]
+            self._feature_ids_str_version = feature_ids.version
+        
+        data = self._raw_dict()
+        data["id"] = self._id_str
+        data["created_at"] = self._created_at_iso
+        data["sample_id"] = str(self.sample_id) if self.sample_id else None
+        data["feature_ids"] = list(self._feature_ids_str)
+        return data
+    
+    def to_orjson(self) -> Dict[str, Any]:
+        """Convert this genome to a dictionary for orjson serialization.
+        
+        UUIDs and datetimes are left as objects; orjson serializes them
+        natively to the same strings to_dict produces, without the
+        per-field string conversions.
+        
+        Returns:
+            Dictionary representation of the genome
+        """
+        data = self._raw_dict()
+        data["feature_ids"] = list(self.feature_ids)
+        return data
\ No newline at end of file
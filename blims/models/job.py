@@ -1,8 +1,9 @@
 """Job model for BLIMS."""
 
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
 
@@ -31,6 +32,44 @@ class JobType(str, Enum):
     CUSTOM = "CUSTOM"
 
 
+# JobStatus and JobType by value, for converting serialized values
+_STATUS_BY_VALUE = JobStatus._value2member_map_
+_TYPE_BY_VALUE = JobType._value2member_map_
+
+
+def _coerce_status(value: str) -> JobStatus:
+    """Convert a status value to JobStatus with a dict lookup.
+    
+    Raises:
+        ValueError: If the value is not a job status
+    """
+    status = _STATUS_BY_VALUE.get(value)
+    return status if status is not None else JobStatus(value)
+
+
+def _coerce_type(value: str) -> JobType:
+    """Convert a job type value to JobType with a dict lookup.
+    
+    Raises:
+        ValueError: If the value is not a job type
+    """
+    job_type = _TYPE_BY_VALUE.get(value)
+    return job_type if job_type is not None else JobType(value)
+
+
+# Timestamp fields stored as ISO 8601 strings when serialized
+_TIMESTAMP_FIELDS = ("start_time", "end_time")
+
+# Status -> (sets start_time, sets end_time) when a job moves into it
+_TRANSITIONS: Dict[JobStatus, Tuple[bool, bool]] = {
+    JobStatus.RUNNING: (True, False),
+    JobStatus.SUCCEEDED: (False, True),
+    JobStatus.FAILED: (False, True),
+    JobStatus.CANCELED: (False, True),
+}
+_NO_TIMESTAMPS = (False, False)
+
+
 class Job:
     """A bioinformatics job in the LIMS system.
     
@@ -39,6 +78,16 @@ class Job:
     input/output locations, and AWS Batch information.
     """
     
+    __slots__ = (
+        "id", "name", "job_type", "created_by", "created_at",
+        "description", "parameters", "input_files", "output_files", "status",
+        "log_url", "aws_job_id", "aws_job_definition", "aws_job_queue",
+        "_parent_job_ids", "_child_job_ids", "_start_ts", "_end_ts",
+        "_start_tz", "_end_tz",
+        "_sample_id", "_sample_id_str", "_id_str", "_parent_job_id_set",
+        "_child_job_id_set",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -59,6 +108,7 @@ class Job:
         child_job_ids: Optional[List[Union[UUID, str]]] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
+        created_at: Optional[datetime] = None,
     ):
         """Initialize a new Job.
         
@@ -81,18 +131,20 @@ class Job:
             child_job_ids: IDs of jobs that depend on this job
             start_time: When the job started execution
             end_time: When the job finished execution
+            created_at: Creation time (now if not provided); pass the stored
+                value when loading jobs
         """
         self.id = id or uuid4()
         self.name = name
-        self.job_type = job_type if isinstance(job_type, JobType) else JobType(job_type)
+        self.job_type = job_type if type(job_type) is JobType else _coerce_type(job_type)
         self.sample_id = sample_id
         self.created_by = created_by
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
         self.description = description
         self.parameters = parameters or {}
         self.input_files = input_files or []
         self.output_files = output_files or []
-        self.status = status if isinstance(status, JobStatus) else JobStatus(status)
+        self.status = status if type(status) is JobStatus else _coerce_status(status)
         self.log_url = log_url
         self.aws_job_id = aws_job_id
         self.aws_job_definition = aws_job_definition
@@ -102,6 +154,69 @@ class Job:
         self.start_time = start_time
         self.end_time = end_time
         
+        # String form of id, used as the repository key and by to_dict;
+        # id never changes
+        self._id_str = str(self.id)
+    
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """When the job started execution.
+        
+        Stored as a POSIX timestamp plus the tzinfo of the assigned value,
+        so status updates and durations need no datetime objects; read back
+        in that timezone, or as a naive local datetime if none was given.
+        """
+        return datetime.fromtimestamp(self._start_ts, self._start_tz) if self._start_ts is not None else None
+    
+    @start_time.setter
+    def start_time(self, value: Optional[datetime]) -> None:
+        self._start_ts = value.timestamp() if value is not None else None
+        self._start_tz = value.tzinfo if value is not None else None
+    
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """When the job finished execution, stored like start_time."""
+        return datetime.fromtimestamp(self._end_ts, self._end_tz) if self._end_ts is not None else None
+    
+    @end_time.setter
+    def end_time(self, value: Optional[datetime]) -> None:
+        self._end_ts = value.timestamp() if value is not None else None
+        self._end_tz = value.tzinfo if value is not None else None
+    
+    @property
+    def sample_id(self) -> Union[UUID, str]:
+        """ID of the sample this job processes."""
+        return self._sample_id
+    
+    @sample_id.setter
+    def sample_id(self, sample_id: Union[UUID, str]) -> None:
+        # Keep the string form used by sample queries in step
+        self._sample_id = sample_id
+        self._sample_id_str = str(sample_id)
+    
+    # The job ID lists keep membership sets, built on the first add and
+    # rebuilt if the list was appended to directly or replaced
+    
+    @property
+    def parent_job_ids(self) -> List[Union[UUID, str]]:
+        """IDs of the jobs this job depends on."""
+        return self._parent_job_ids
+    
+    @parent_job_ids.setter
+    def parent_job_ids(self, job_ids: List[Union[UUID, str]]) -> None:
+        self._parent_job_ids = job_ids
+        self._parent_job_id_set: Optional[Set[Union[UUID, str]]] = None
+    
+    @property
+    def child_job_ids(self) -> List[Union[UUID, str]]:
+        """IDs of the jobs that depend on this job."""
+        return self._child_job_ids
+    
+    @child_job_ids.setter
+    def child_job_ids(self, job_ids: List[Union[UUID, str]]) -> None:
+        self._child_job_ids = job_ids
+        self._child_job_id_set: Optional[Set[Union[UUID, str]]] = None
+        
     def update_status(self, status: JobStatus) -> None:
         """Update the job status and timestamps.
         
@@ -109,14 +224,16 @@ class Job:
             status: The new job status
         """
         old_status = self.status
-        self.status = status if isinstance(status, JobStatus) else JobStatus(status)
+        self.status = status if type(status) is JobStatus else _coerce_status(status)
         
         # Update timestamps when the job starts or ends
-        if old_status != JobStatus.RUNNING and status == JobStatus.RUNNING:
-            self.start_time = datetime.now()
-        
-        if status in [JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELED]:
-            self.end_time = datetime.now()
+        sets_start, sets_end = _TRANSITIONS.get(self.status, _NO_TIMESTAMPS)
+        if sets_start and old_status is not JobStatus.RUNNING:
+            self._start_ts = time.time()
+            self._start_tz = None
+        elif sets_end:
+            self._end_ts = time.time()
+            self._end_tz = None
     
     def add_parent_job(self, job_id: Union[UUID, str]) -> None:
         """Add a parent job that this job depends on.
@@ -124,7 +241,11 @@ class Job:
         Args:
             job_id: The ID of the parent job
         """
-        if job_id not in self.parent_job_ids:
+        seen = self._parent_job_id_set
+        if seen is None or len(seen) != len(self.parent_job_ids):
+            seen = self._parent_job_id_set = set(self.parent_job_ids)
+        if job_id not in seen:
+            seen.add(job_id)
             self.parent_job_ids.append(job_id)
     
     def add_child_job(self, job_id: Union[UUID, str]) -> None:
@@ -133,7 +254,11 @@ class Job:
         Args:
             job_id: The ID of the child job
         """
-        if job_id not in self.child_job_ids:
+        seen = self._child_job_id_set
+        if seen is None or len(seen) != len(self.child_job_ids):
+            seen = self._child_job_id_set = set(self.child_job_ids)
+        if job_id not in seen:
+            seen.add(job_id)
             self.child_job_ids.append(job_id)
     
     def add_input_file(self, path: str, description: str) -> None:
@@ -169,11 +294,11 @@ class Job:
         Returns:
             Duration in seconds or None if not applicable
         """
-        if not self.start_time:
+        if self._start_ts is None:
             return None
         
-        end = self.end_time or datetime.now()
-        return (end - self.start_time).total_seconds()
+        end = self._end_ts if self._end_ts is not None else time.time()
+        return end - self._start_ts
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert this job to a dictionary for serialization.
@@ -182,10 +307,10 @@ class Job:
             Dictionary representation of the job
         """
         return {
-            "id": str(self.id),
+            "id": self._id_str,
             "name": self.name,
             "job_type": self.job_type.value,
-            "sample_id": str(self.sample_id),
+            "sample_id": self._sample_id_str,
             "created_by": self.created_by,
             "created_at": self.created_at.isoformat(),
             "description": self.description,
@@ -199,7 +324,78 @@ class Job:
             "aws_job_queue": self.aws_job_queue,
             "parent_job_ids": [str(jid) for jid in self.parent_job_ids],
             "child_job_ids": [str(jid) for jid in self.child_job_ids],
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "start_time": self.start_time.isoformat() if self._start_ts is not None else None,
+            "end_time": self.end_time.isoformat() if self._end_ts is not None else None,
             "duration": self.get_duration(),
-        }
\ No newline at end of file
+        }
+    
+    def to_orjson(self) -> Dict[str, Any]:
+        """Convert this job to a dictionary for orjson serialization.
+        
+        UUIDs and datetimes are left as objects; orjson serializes them
+        natively to the same strings to_dict produces, without the
+        per-field string conversions.
+        
+        Returns:
+            Dictionary representation of the job
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "job_type": self.job_type.value,
+            "sample_id": self.sample_id,
+            "created_by": self.created_by,
+            "created_at": self.created_at,
+            "description": self.description,
+            "parameters": self.parameters,
+            "input_files": self.input_files,
+            "output_files": self.output_files,
+            "status": self.status.value,
+            "log_url": self.log_url,
+            "aws_job_id": self.aws_job_id,
+            "aws_job_definition": self.aws_job_definition,
+            "aws_job_queue": self.aws_job_queue,
+            "parent_job_ids": list(self.parent_job_ids),
+            "child_job_ids": list(self.child_job_ids),
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.get_duration(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        """Create a Job from a dictionary produced by to_dict.
+        
+        Args:
+            data: Dictionary data
+            
+        Returns:
+            Job instance
+            
+        Raises:
+            ValueError: If the job type or status is not recognized
+        """
+        timestamps = {}
+        for field in _TIMESTAMP_FIELDS + ("created_at",):
+            value = data.get(field)
+            timestamps[field] = datetime.fromisoformat(value) if value else None
+        
+        return cls(
+            name=data["name"],
+            job_type=data["job_type"],
+            sample_id=data["sample_id"],
+            created_by=data["created_by"],
+            id=UUID(data["id"]) if data.get("id") else None,
+            description=data.get("description"),
+            parameters=data.get("parameters"),
+            input_files=data.get("input_files"),
+            output_files=data.get("output_files"),
+            status=data.get("status", JobStatus.PENDING),
+            log_url=data.get("log_url"),
+            aws_job_id=data.get("aws_job_id"),
+            aws_job_definition=data.get("aws_job_definition"),
+            aws_job_queue=data.get("aws_job_queue"),
+            parent_job_ids=data.get("parent_job_ids"),
+            child_job_ids=data.get("child_job_ids"),
+            **timestamps,
+        )
@@ -1,24 +1,24 @@
 """Sample model for BLIMS."""
 
+import itertools
+import sys
 from datetime import datetime
-import re
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
-# Global counter for sample IDs
-_next_sample_number = 1
+# Global counter for sample IDs; next() on a count is atomic
+_sample_numbers = itertools.count(1)
 
 
 def get_next_sample_id() -> str:
     """Get the next sample ID in the format 's1', 's2', etc.
     
+    Safe to call from several threads; each call gets a distinct ID.
+    
     Returns:
         A string with the next sample ID
     """
-    global _next_sample_number
-    sample_id = f"s{_next_sample_number}"
-    _next_sample_number += 1
-    return sample_id
+    return f"s{next(_sample_numbers)}"
 
 
 def reset_sample_counter(max_id: int = 0):
@@ -27,8 +27,8 @@ def reset_sample_counter(max_id: int = 0):
     Args:
         max_id: The maximum ID currently in use
     """
-    global _next_sample_number
-    _next_sample_number = max_id + 1
+    global _sample_numbers
+    _sample_numbers = itertools.count(max_id + 1)
 
 
 def extract_sample_number(sample_id: str) -> int:
@@ -40,13 +40,50 @@ def extract_sample_number(sample_id: str) -> int:
     Returns:
         The extracted number
     """
-    if not sample_id or not isinstance(sample_id, str):
+    if not sample_id or not isinstance(sample_id, str) or sample_id[0] != 's':
         return 0
-        
-    match = re.match(r's(\d+)', sample_id)
-    if match:
-        return int(match.group(1))
-    return 0
+    
+    # Common case: the whole ID is 's' followed by digits
+    digits = sample_id[1:]
+    if digits.isdecimal():
+        return int(digits)
+    
+    # Otherwise use the digits right after the 's', if any
+    end = 1
+    while end < len(sample_id) and sample_id[end].isdecimal():
+        end += 1
+    return int(sample_id[1:end]) if end > 1 else 0
+
+
+def _parse_id(value: str) -> Union[UUID, str]:
+    """Parse a serialized ID back to a UUID, keeping non-UUID IDs as strings."""
+    try:
+        return UUID(value)
+    except ValueError:
+        return value
+
+
+# Records grouped by their 'type', with the list and length they were
+# grouped from so a replaced or directly changed list is noticed
+_TypeGroups = Tuple[List[Dict[str, Any]], int, Dict[Any, List[Dict[str, Any]]]]
+
+
+def _group_by_type(records: List[Dict[str, Any]]) -> _TypeGroups:
+    """Group sequencing data or analysis records by their 'type'."""
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for record in records:
+        groups.setdefault(record.get('type'), []).append(record)
+    return (records, len(records), groups)
+
+
+def _add_to_groups(
+    grouped: Optional[_TypeGroups], records: List[Dict[str, Any]], record: Dict[str, Any]
+) -> Optional[_TypeGroups]:
+    """File a record just appended to records, if its groups are current."""
+    if grouped is None or grouped[0] is not records or grouped[1] != len(records) - 1:
+        return None
+    grouped[2].setdefault(record.get('type'), []).append(record)
+    return (records, len(records), grouped[2])
 
 
 class Sample:
@@ -56,6 +93,17 @@ class Sample:
     They can also contain other samples or be containers themselves.
     """
 
+    __slots__ = (
+        "id", "sample_id", "name", "sample_type", "created_by", "created_at",
+        "metadata", "_parent_ids", "_file_paths", "_child_ids",
+        "_contained_sample_ids", "_contained_sample_set", "_container_id",
+        "_container_id_str",
+        "barcode", "is_container", "sequencing_data", "analyses",
+        "genome_ids", "_dict_cache", "_id_str", "_file_path_set",
+        "_parent_id_set", "_child_id_set", "_sequencing_by_type",
+        "_analyses_by_type",
+    )
+
     def __init__(
         self,
         name: str,
@@ -72,6 +120,7 @@ class Sample:
         sequencing_data: Optional[List[Dict[str, Any]]] = None,
         analyses: Optional[List[Dict[str, Any]]] = None,
         genome_ids: Optional[List[Union[UUID, str]]] = None,
+        created_at: Optional[datetime] = None,
     ):
         """Initialize a new Sample.
 
@@ -90,24 +139,120 @@ class Sample:
             sequencing_data: Sequencing data associated with this sample
             analyses: Analyses performed on this sample
             genome_ids: IDs of genomes associated with this sample
+            created_at: Creation time (now if not provided); pass the stored
+                value when loading samples
         """
         self.id = id or uuid4()
         self.sample_id = sample_id or get_next_sample_id()
         self.name = name
-        self.sample_type = sample_type
+        # Interned: many samples share a handful of type names
+        self.sample_type = sys.intern(sample_type)
         self.created_by = created_by
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
         self.metadata = metadata or {}
         self.parent_ids = parent_ids or []
         self.file_paths = file_paths or []
-        self.child_ids: List[Union[UUID, str]] = []
+        self.child_ids = []
         self.contained_sample_ids = contained_sample_ids or []
-        self.container_id: Optional[Union[UUID, str]] = None  # ID of the sample containing this one
+        self.container_id = None  # ID of the sample containing this one
         self.barcode = barcode
         self.is_container = is_container
         self.sequencing_data = sequencing_data or []
         self.analyses = analyses or []
         self.genome_ids = genome_ids or []
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        
+        # sequencing_data and analyses grouped by type, built on the first
+        # filtered get and kept up to date by the add methods
+        self._sequencing_by_type: Optional[_TypeGroups] = None
+        self._analyses_by_type: Optional[_TypeGroups] = None
+        
+        # String form of id, used as the repository key and by to_dict;
+        # id never changes
+        self._id_str = str(self.id)
+
+    def invalidate_dict_cache(self) -> None:
+        """Discard the cached result of to_dict().
+
+        The mutator methods call this automatically; call it after
+        assigning sample attributes directly.
+        """
+        self._dict_cache = None
+
+    @property
+    def contained_sample_ids(self) -> List[Union[UUID, str]]:
+        """IDs of samples contained within this sample, in insertion order.
+
+        Use add_contained_sample/remove_contained_sample to change the
+        contents so the membership set stays in sync with the list.
+        """
+        return self._contained_sample_ids
+
+    @contained_sample_ids.setter
+    def contained_sample_ids(self, sample_ids: List[Union[UUID, str]]) -> None:
+        self._contained_sample_ids = list(sample_ids)
+        self._contained_sample_set: Set[Union[UUID, str]] = set(sample_ids)
+        self._dict_cache = None
+
+    # file_paths, parent_ids and child_ids keep membership sets, built on
+    # the first add and rebuilt if the list was appended to directly or
+    # replaced
+
+    @property
+    def file_paths(self) -> List[str]:
+        """Paths of the files attached to this sample."""
+        return self._file_paths
+
+    @file_paths.setter
+    def file_paths(self, file_paths: List[str]) -> None:
+        self._file_paths = file_paths
+        self._file_path_set: Optional[Set[str]] = None
+        self._dict_cache = None
+
+    @property
+    def parent_ids(self) -> List[Union[UUID, str]]:
+        """IDs of the samples this sample was derived from."""
+        return self._parent_ids
+
+    @parent_ids.setter
+    def parent_ids(self, parent_ids: List[Union[UUID, str]]) -> None:
+        self._parent_ids = parent_ids
+        self._parent_id_set: Optional[Set[Union[UUID, str]]] = None
+        self._dict_cache = None
+
+    @property
+    def child_ids(self) -> List[Union[UUID, str]]:
+        """IDs of the samples derived from this sample."""
+        return self._child_ids
+
+    @child_ids.setter
+    def child_ids(self, child_ids: List[Union[UUID, str]]) -> None:
+        self._child_ids = child_ids
+        self._child_id_set: Optional[Set[Union[UUID, str]]] = None
+        self._dict_cache = None
+
+    @property
+    def container_id(self) -> Optional[Union[UUID, str]]:
+        """ID of the sample containing this one, if any."""
+        return self._container_id
+
+    @container_id.setter
+    def container_id(self, container_id: Optional[Union[UUID, str]]) -> None:
+        # Keep the string form used as the repository's container key in step
+        self._container_id = container_id
+        self._container_id_str = str(container_id) if container_id else None
+        self._dict_cache = None
+
+    def contains_sample(self, sample_id: Union[UUID, str]) -> bool:
+        """Check whether a sample is contained within this sample.
+
+        Args:
+            sample_id: The ID of the sample to check
+
+        Returns:
+            True if the sample is contained in this sample
+        """
+        return sample_id in self._contained_sample_set
 
     def add_metadata(self, key: str, value: Any) -> None:
         """Add or update metadata for this sample.
@@ -117,6 +262,7 @@ class Sample:
             value: The metadata value
         """
         self.metadata[key] = value
+        self._dict_cache = None
 
     def add_file(self, file_path: str) -> None:
         """Add a file to this sample.
@@ -124,8 +270,13 @@ class Sample:
         Args:
             file_path: Path to the file
         """
-        if file_path not in self.file_paths:
+        seen = self._file_path_set
+        if seen is None or len(seen) != len(self.file_paths):
+            seen = self._file_path_set = set(self.file_paths)
+        if file_path not in seen:
+            seen.add(file_path)
             self.file_paths.append(file_path)
+            self._dict_cache = None
 
     def add_parent(self, parent_id: UUID) -> None:
         """Add a parent sample to this sample's lineage.
@@ -133,8 +284,13 @@ class Sample:
         Args:
             parent_id: The ID of the parent sample
         """
-        if parent_id not in self.parent_ids:
+        seen = self._parent_id_set
+        if seen is None or len(seen) != len(self.parent_ids):
+            seen = self._parent_id_set = set(self.parent_ids)
+        if parent_id not in seen:
+            seen.add(parent_id)
             self.parent_ids.append(parent_id)
+            self._dict_cache = None
 
     def add_child(self, child_id: UUID) -> None:
         """Add a child sample to this sample's lineage.
@@ -142,8 +298,13 @@ class Sample:
         Args:
             child_id: The ID of the child sample
         """
-        if child_id not in self.child_ids:
+        seen = self._child_id_set
+        if seen is None or len(seen) != len(self.child_ids):
+            seen = self._child_id_set = set(self.child_ids)
+        if child_id not in seen:
+            seen.add(child_id)
             self.child_ids.append(child_id)
+            self._dict_cache = None
             
     def add_contained_sample(self, sample_id: UUID) -> None:
         """Add a sample to be contained within this sample.
@@ -151,8 +312,28 @@ class Sample:
         Args:
             sample_id: The ID of the sample to contain
         """
-        if sample_id not in self.contained_sample_ids:
-            self.contained_sample_ids.append(sample_id)
+        if sample_id not in self._contained_sample_set:
+            self._contained_sample_set.add(sample_id)
+            self._contained_sample_ids.append(sample_id)
+            self._dict_cache = None
+
+    def add_contained_samples(self, sample_ids: Iterable[UUID]) -> None:
+        """Add several samples to be contained within this sample.
+
+        Samples already contained, or repeated in sample_ids, are added once.
+
+        Args:
+            sample_ids: The IDs of the samples to contain
+        """
+        contained = self._contained_sample_set
+        new_ids = []
+        for sample_id in sample_ids:
+            if sample_id not in contained:
+                contained.add(sample_id)
+                new_ids.append(sample_id)
+        if new_ids:
+            self._contained_sample_ids.extend(new_ids)
+            self._dict_cache = None
             
     def remove_contained_sample(self, sample_id: UUID) -> None:
         """Remove a contained sample from this sample.
@@ -160,8 +341,10 @@ class Sample:
         Args:
             sample_id: The ID of the sample to remove
         """
-        if sample_id in self.contained_sample_ids:
-            self.contained_sample_ids.remove(sample_id)
+        if sample_id in self._contained_sample_set:
+            self._contained_sample_set.discard(sample_id)
+            self._contained_sample_ids.remove(sample_id)
+            self._dict_cache = None
             
     def set_container(self, container_id: Optional[UUID]) -> None:
         """Set the container of this sample.
@@ -170,6 +353,7 @@ class Sample:
             container_id: The ID of the container sample, or None to remove
         """
         self.container_id = container_id
+        self._dict_cache = None
 
     def add_sequencing_data(self, data: Dict[str, Any]) -> None:
         """Add sequencing data reference to this sample.
@@ -178,6 +362,8 @@ class Sample:
             data: Dictionary with sequencing data information
         """
         self.sequencing_data.append(data)
+        self._dict_cache = None
+        self._sequencing_by_type = _add_to_groups(self._sequencing_by_type, self.sequencing_data, data)
     
     def add_analysis(self, analysis: Dict[str, Any]) -> None:
         """Add analysis reference to this sample.
@@ -186,6 +372,8 @@ class Sample:
             analysis: Dictionary with analysis information
         """
         self.analyses.append(analysis)
+        self._dict_cache = None
+        self._analyses_by_type = _add_to_groups(self._analyses_by_type, self.analyses, analysis)
         
     def get_sequencing_data(self, data_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get sequencing data for this sample.
@@ -199,7 +387,10 @@ class Sample:
         if not data_type:
             return self.sequencing_data
         
-        return [data for data in self.sequencing_data if data.get('type') == data_type]
+        grouped = self._sequencing_by_type
+        if grouped is None or grouped[0] is not self.sequencing_data or grouped[1] != len(self.sequencing_data):
+            grouped = self._sequencing_by_type = _group_by_type(self.sequencing_data)
+        return list(grouped[2].get(data_type, ()))
     
     def get_analyses(self, analysis_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get analyses for this sample.
@@ -213,7 +404,10 @@ class Sample:
         if not analysis_type:
             return self.analyses
         
-        return [analysis for analysis in self.analyses if analysis.get('type') == analysis_type]
+        grouped = self._analyses_by_type
+        if grouped is None or grouped[0] is not self.analyses or grouped[1] != len(self.analyses):
+            grouped = self._analyses_by_type = _group_by_type(self.analyses)
+        return list(grouped[2].get(analysis_type, ()))
         
     def add_genome(self, genome_id: Union[UUID, str]) -> None:
         """Associate a genome with this sample.
@@ -228,6 +422,7 @@ class Sample:
                 return  # Already exists, no need to add
                 
         # Add the genome ID (maintain original type)
+        self._dict_cache = None
         if isinstance(genome_id, UUID):
             self.genome_ids.append(genome_id)
         else:
@@ -240,11 +435,17 @@ class Sample:
     def to_dict(self) -> Dict[str, Any]:
         """Convert this sample to a dictionary for serialization.
 
+        The result is cached until the sample is next modified, so callers
+        must not mutate the returned dictionary.
+
         Returns:
             Dictionary representation of the sample
         """
-        return {
-            "id": str(self.id),
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        self._dict_cache = {
+            "id": self._id_str,
             "sample_id": self.sample_id,
             "name": self.name,
             "sample_type": self.sample_type,
@@ -255,10 +456,78 @@ class Sample:
             "child_ids": [str(cid) for cid in self.child_ids],
             "file_paths": self.file_paths,
             "contained_sample_ids": [str(sid) for sid in self.contained_sample_ids],
-            "container_id": str(self.container_id) if self.container_id else None,
+            "container_id": self._container_id_str,
             "barcode": self.barcode,
             "is_container": self.is_container,
             "sequencing_data": self.sequencing_data,
             "analyses": self.analyses,
             "genome_ids": [str(gid) for gid in self.genome_ids],
         }
+        return self._dict_cache
+
+    def to_orjson(self) -> Dict[str, Any]:
+        """Convert this sample to a dictionary for orjson serialization.
+
+        UUIDs and datetimes are left as objects; orjson serializes them
+        natively to the same strings to_dict produces, without the
+        per-field string conversions.
+
+        Returns:
+            Dictionary representation of the sample
+        """
+        return {
+            "id": self.id,
+            "sample_id": self.sample_id,
+            "name": self.name,
+            "sample_type": self.sample_type,
+            "created_by": self.created_by,
+            "created_at": self.created_at,
+            "metadata": self.metadata,
+            "parent_ids": list(self.parent_ids),
+            "child_ids": list(self.child_ids),
+            "file_paths": self.file_paths,
+            "contained_sample_ids": list(self.contained_sample_ids),
+            "container_id": self.container_id or None,
+            "barcode": self.barcode,
+            "is_container": self.is_container,
+            "sequencing_data": self.sequencing_data,
+            "analyses": self.analyses,
+            "genome_ids": list(self.genome_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Sample":
+        """Create a Sample from a dictionary produced by to_dict.
+
+        Args:
+            data: Dictionary data
+
+        Returns:
+            Sample instance
+        """
+        sample = cls(
+            name=data["name"],
+            sample_type=data["sample_type"],
+            created_by=data["created_by"],
+            id=_parse_id(data["id"]) if data.get("id") else None,
+            metadata=data.get("metadata"),
+            parent_ids=[_parse_id(pid) for pid in data.get("parent_ids") or ()],
+            file_paths=data.get("file_paths"),
+            contained_sample_ids=[
+                _parse_id(sid) for sid in data.get("contained_sample_ids") or ()
+            ],
+            sample_id=data.get("sample_id"),
+            barcode=data.get("barcode"),
+            is_container=data.get("is_container", False),
+            sequencing_data=data.get("sequencing_data"),
+            analyses=data.get("analyses"),
+            genome_ids=[_parse_id(gid) for gid in data.get("genome_ids") or ()],
+            created_at=(
+                datetime.fromisoformat(data["created_at"])
+                if data.get("created_at") else None
+            ),
+        )
+        sample.child_ids = [_parse_id(cid) for cid in data.get("child_ids") or ()]
+        if data.get("container_id"):
+            sample.container_id = _parse_id(data["container_id"])
+        return sample
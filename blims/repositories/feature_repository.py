@@ -1,9 +1,159 @@
 """Repository for managing genomic features."""
 
-from typing import Dict, List, Optional, Union
+from bisect import bisect_left, bisect_right
+from itertools import compress, islice
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import uuid
 
-from blims.models.feature import Feature, FeatureType
+from blims.models.feature import Feature, FeatureType, FrozenFeature
+
+
+# Candidate windows up to this size are scanned directly instead of
+# walking the interval tree
+_SCAN_LIMIT = 64
+
+
+class _IntervalBucket:
+    """Features of one chromosome of one genome, sorted by start position.
+    
+    Start and end positions are kept in their own lists, parallel to the
+    features, so region queries can binary-search the starts and filter
+    the ends without touching the feature objects. Queries whose
+    candidates are too many to scan (a bucket holding some very long
+    features) use an implicit interval tree over the same sorted order:
+    each index is a node, and max_ends holds the largest end position in
+    its subtree.
+    """
+    
+    __slots__ = ("starts", "ends", "features", "max_length", "_max_ends",
+                 "_max_level", "_frozen")
+    
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.features: List[Feature] = []
+        # Upper bound on the length of any feature in the bucket
+        self.max_length = 0
+        # Interval tree, built on the first query that needs it
+        self._max_ends: Optional[List[int]] = None
+        self._max_level = 0
+        # Frozen snapshots parallel to features, built on first frozen query
+        self._frozen: Optional[List[FrozenFeature]] = None
+    
+    def add(self, feature: Feature) -> None:
+        i = bisect_right(self.starts, feature.start)
+        self.starts.insert(i, feature.start)
+        self.ends.insert(i, feature.end)
+        self.features.insert(i, feature)
+        self.max_length = max(self.max_length, feature.end - feature.start + 1)
+        self._max_ends = None
+        self._frozen = None
+    
+    def remove(self, feature: Feature, start: int) -> None:
+        i = bisect_left(self.starts, start)
+        while i < len(self.starts) and self.starts[i] == start:
+            if self.features[i] is feature:
+                del self.starts[i]
+                del self.ends[i]
+                del self.features[i]
+                self._max_ends = None
+                self._frozen = None
+                return
+            i += 1
+    
+    def _build_tree(self) -> List[int]:
+        ends = self.ends
+        max_ends = list(ends)
+        n = len(ends)
+        # Leaves (even indices) are their own subtree; level k nodes are
+        # the indices whose lowest k bits are set. last tracks the largest
+        # end under the rightmost node, standing in for missing children
+        last_i = (n - 1) & ~1
+        last = ends[last_i]
+        k = 1
+        while (1 << k) <= n:
+            x = 1 << (k - 1)
+            for i in range((x << 1) - 1, n, x << 2):
+                right = max_ends[i + x] if i + x < n else last
+                max_ends[i] = max(ends[i], max_ends[i - x], right)
+            last_i = last_i - x if (last_i >> k) & 1 else last_i + x
+            if last_i < n and max_ends[last_i] > last:
+                last = max_ends[last_i]
+            k += 1
+        self._max_level = k - 1
+        self._max_ends = max_ends
+        return max_ends
+    
+    def _overlap_indices(self, start: int, end: int) -> List[int]:
+        """Get the indices of features overlapping a region, in order."""
+        # Only features starting within max_length of the region can reach it
+        lo = bisect_left(self.starts, start - self.max_length + 1)
+        hi = bisect_right(self.starts, end)
+        if hi - lo <= _SCAN_LIMIT:
+            # Filter the window's ends in C: keep i where start <= ends[i]
+            reaches = map(start.__le__, islice(self.ends, lo, hi))
+            return list(compress(range(lo, hi), reaches))
+        
+        max_ends = self._max_ends
+        if max_ends is None:
+            max_ends = self._build_tree()
+        starts = self.starts
+        ends = self.ends
+        n = len(starts)
+        found = []
+        # Depth-first, left to right; left_done marks a node whose left
+        # subtree has already been visited
+        stack = [(((1 << self._max_level) - 1), self._max_level, False)]
+        while stack:
+            x, k, left_done = stack.pop()
+            if k <= 3:
+                # Small subtree: check it directly
+                i0 = x >> k << k
+                for i in range(i0, min(i0 + (1 << (k + 1)) - 1, n)):
+                    if starts[i] > end:
+                        break
+                    if ends[i] >= start:
+                        found.append(i)
+            elif not left_done:
+                stack.append((x, k, True))
+                y = x - (1 << (k - 1))
+                if y >= n or max_ends[y] >= start:
+                    stack.append((y, k - 1, False))
+            elif x < n and starts[x] <= end:
+                if ends[x] >= start:
+                    found.append(x)
+                stack.append((x + (1 << (k - 1)), k - 1, False))
+        return found
+    
+    def overlapping(self, start: int, end: int) -> List[Feature]:
+        features = self.features
+        return [features[i] for i in self._overlap_indices(start, end)]
+    
+    def overlapping_frozen(self, start: int, end: int) -> List[FrozenFeature]:
+        if self._frozen is None:
+            self._frozen = [f.freeze() for f in self.features]
+        frozen = self._frozen
+        return [frozen[i] for i in self._overlap_indices(start, end)]
+
+
+def _discard(index: Dict[str, Dict[str, Feature]], key: str, feature_id: str) -> None:
+    """Remove a feature from one bucket of a lookup index."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(feature_id, None)
+        if not bucket:
+            del index[key]
+
+
+def _to_str_id(value: Union[str, uuid.UUID]) -> str:
+    """Get the string form of an ID, skipping str() for string IDs."""
+    return value if type(value) is str else str(value)
+
+
+def _region_key(genome_id: Union[str, uuid.UUID], chromosome: str) -> Tuple[str, str]:
+    # Chromosome names are interned so region lookups compare them by identity
+    return (_to_str_id(genome_id), sys.intern(chromosome))
 
 
 class FeatureRepository:
@@ -16,6 +166,76 @@ class FeatureRepository:
     def __init__(self):
         """Initialize the feature repository."""
         self.features: Dict[str, Feature] = {}
+        
+        # Region index: (genome ID, chromosome) -> features sorted by start,
+        # plus where each feature was indexed so it can be removed again.
+        # Rebuilt if the features dict is replaced
+        self._regions: Dict[Tuple[str, str], _IntervalBucket] = {}
+        self._indexed_at: Dict[str, Tuple[Tuple[str, str], int, Feature]] = {}
+        self._indexed_features: Optional[Dict[str, Feature]] = None
+        
+        # Lookup indexes: genome ID / feature type / parent ID -> features
+        # by ID, in insertion order, plus the keys each feature was filed
+        # under. Rebuilt together with the region index
+        self._by_genome: Dict[str, Dict[str, Feature]] = {}
+        self._by_type: Dict[str, Dict[str, Feature]] = {}
+        self._by_parent: Dict[str, Dict[str, Feature]] = {}
+        self._lookup_keys: Dict[str, Tuple[str, str, Optional[str]]] = {}
+    
+    def _ensure_indexed(self) -> None:
+        """Rebuild the region and lookup indexes if features was replaced."""
+        if self._indexed_features is not self.features:
+            self._regions = {}
+            self._indexed_at = {}
+            self._by_genome = {}
+            self._by_type = {}
+            self._by_parent = {}
+            self._lookup_keys = {}
+            self._indexed_features = self.features
+            for feature_id, feature in self.features.items():
+                self._index_lookups(feature_id, feature)
+            # Index in position order so each insert lands at a bucket's end
+            by_position = sorted(
+                self.features.items(), key=lambda item: item[1].position_key
+            )
+            for feature_id, feature in by_position:
+                self._index_region(feature_id, feature)
+    
+    def _index_feature(self, feature_id: str, feature: Feature) -> None:
+        self._index_lookups(feature_id, feature)
+        self._index_region(feature_id, feature)
+    
+    def _index_region(self, feature_id: str, feature: Feature) -> None:
+        key = _region_key(feature.genome_id, feature.chromosome)
+        bucket = self._regions.get(key)
+        if bucket is None:
+            bucket = self._regions[key] = _IntervalBucket()
+        bucket.add(feature)
+        self._indexed_at[feature_id] = (key, feature.start, feature)
+    
+    def _index_lookups(self, feature_id: str, feature: Feature) -> None:
+        genome_key = _to_str_id(feature.genome_id)
+        type_key = feature.feature_type.value
+        parent_key = _to_str_id(feature.parent_id) if feature.parent_id else None
+        self._by_genome.setdefault(genome_key, {})[feature_id] = feature
+        self._by_type.setdefault(type_key, {})[feature_id] = feature
+        if parent_key is not None:
+            self._by_parent.setdefault(parent_key, {})[feature_id] = feature
+        self._lookup_keys[feature_id] = (genome_key, type_key, parent_key)
+    
+    def _unindex_feature(self, feature_id: str) -> None:
+        entry = self._indexed_at.pop(feature_id, None)
+        if entry is not None:
+            key, start, feature = entry
+            self._regions[key].remove(feature, start)
+        
+        keys = self._lookup_keys.pop(feature_id, None)
+        if keys is not None:
+            genome_key, type_key, parent_key = keys
+            _discard(self._by_genome, genome_key, feature_id)
+            _discard(self._by_type, type_key, feature_id)
+            if parent_key is not None:
+                _discard(self._by_parent, parent_key, feature_id)
     
     def create_feature(self, feature: Feature) -> Feature:
         """Store a new feature in the repository.
@@ -26,8 +246,11 @@ class FeatureRepository:
         Returns:
             The stored feature with any repository-assigned fields
         """
-        feature_id = str(feature.id)
+        feature_id = feature._id_str
+        self._ensure_indexed()
+        self._unindex_feature(feature_id)
         self.features[feature_id] = feature
+        self._index_feature(feature_id, feature)
         return feature
     
     def get_feature(self, feature_id: Union[str, uuid.UUID]) -> Optional[Feature]:
@@ -39,9 +262,27 @@ class FeatureRepository:
         Returns:
             The feature if found, None otherwise
         """
-        feature_id_str = str(feature_id)
+        feature_id_str = _to_str_id(feature_id)
         return self.features.get(feature_id_str)
     
+    def get_features(self, feature_ids: Iterable[Union[str, uuid.UUID]]) -> Dict[str, Feature]:
+        """Retrieve several features by ID in one call.
+        
+        Args:
+            feature_ids: The IDs of the features to retrieve
+            
+        Returns:
+            The features found, keyed by string ID; missing IDs are left out
+        """
+        features = self.features
+        found = {}
+        for feature_id in feature_ids:
+            feature_id_str = _to_str_id(feature_id)
+            feature = features.get(feature_id_str)
+            if feature is not None:
+                found[feature_id_str] = feature
+        return found
+    
     def update_feature(self, feature: Feature) -> Feature:
         """Update an existing feature.
         
@@ -54,11 +295,14 @@ class FeatureRepository:
         Raises:
             ValueError: If the feature doesn't exist
         """
-        feature_id = str(feature.id)
+        feature_id = feature._id_str
         if feature_id not in self.features:
             raise ValueError(f"Feature with ID {feature_id} not found")
         
+        self._ensure_indexed()
+        self._unindex_feature(feature_id)
         self.features[feature_id] = feature
+        self._index_feature(feature_id, feature)
         return feature
     
     def delete_feature(self, feature_id: Union[str, uuid.UUID]) -> bool:
@@ -70,12 +314,45 @@ class FeatureRepository:
         Returns:
             True if the feature was deleted, False if it didn't exist
         """
-        feature_id_str = str(feature_id)
+        feature_id_str = _to_str_id(feature_id)
         if feature_id_str in self.features:
+            self._ensure_indexed()
+            self._unindex_feature(feature_id_str)
             del self.features[feature_id_str]
             return True
         return False
     
+    def delete_features_by_genome(self, genome_id: Union[str, uuid.UUID]) -> int:
+        """Delete all features of a genome.
+        
+        The features are taken from the genome index in one step, and the
+        genome's region buckets are dropped whole instead of being emptied
+        one feature at a time.
+        
+        Args:
+            genome_id: The ID of the genome
+            
+        Returns:
+            Number of features deleted
+        """
+        self._ensure_indexed()
+        genome_key = _to_str_id(genome_id)
+        features = self._by_genome.pop(genome_key, None)
+        if not features:
+            return 0
+        
+        for key in [key for key in self._regions if key[0] == genome_key]:
+            del self._regions[key]
+        
+        for feature_id in features:
+            self._indexed_at.pop(feature_id, None)
+            _, type_key, parent_key = self._lookup_keys.pop(feature_id)
+            _discard(self._by_type, type_key, feature_id)
+            if parent_key is not None:
+                _discard(self._by_parent, parent_key, feature_id)
+            del self.features[feature_id]
+        return len(features)
+    
     def get_all_features(self) -> List[Feature]:
         """Get all features in the repository.
         
@@ -93,8 +370,8 @@ class FeatureRepository:
         Returns:
             List of features for the specified genome
         """
-        genome_id_str = str(genome_id)
-        return [f for f in self.features.values() if str(f.genome_id) == genome_id_str]
+        self._ensure_indexed()
+        return list(self._by_genome.get(_to_str_id(genome_id), {}).values())
     
     def get_features_by_type(self, feature_type: Union[str, FeatureType], genome_id: Optional[Union[str, uuid.UUID]] = None) -> List[Feature]:
         """Get all features of a specific type.
@@ -108,12 +385,13 @@ class FeatureRepository:
         """
         type_str = feature_type.value if isinstance(feature_type, FeatureType) else feature_type
         
+        self._ensure_indexed()
+        of_type = self._by_type.get(type_str, {})
         if genome_id:
-            genome_id_str = str(genome_id)
-            return [f for f in self.features.values() 
-                    if f.feature_type.value == type_str and str(f.genome_id) == genome_id_str]
+            in_genome = self._by_genome.get(_to_str_id(genome_id), {})
+            return [f for fid, f in of_type.items() if fid in in_genome]
         
-        return [f for f in self.features.values() if f.feature_type.value == type_str]
+        return list(of_type.values())
     
     def get_features_by_chromosome(self, chromosome: str, genome_id: Union[str, uuid.UUID]) -> List[Feature]:
         """Get all features on a specific chromosome of a genome.
@@ -122,16 +400,48 @@ class FeatureRepository:
             chromosome: The chromosome name
             genome_id: The ID of the genome
             
+        Answered from the region index, which already groups each genome's
+        features by chromosome.
+        
         Returns:
-            List of features on the specified chromosome
+            List of features on the specified chromosome, ordered by start
+            position
         """
-        genome_id_str = str(genome_id)
-        return [f for f in self.features.values() 
-                if f.chromosome == chromosome and str(f.genome_id) == genome_id_str]
+        self._ensure_indexed()
+        bucket = self._regions.get(_region_key(genome_id, chromosome))
+        if bucket is None:
+            return []
+        return list(bucket.features)
     
     def get_features_in_region(self, chromosome: str, start: int, end: int, genome_id: Union[str, uuid.UUID]) -> List[Feature]:
         """Get all features within a genomic region.
         
+        Args:
+            chromosome: The chromosome name
+            start: Start position
+            end: End position
+            genome_id: The ID of the genome
+            
+        Answered from an index of each chromosome's features sorted by
+        start position, so only features near the region are examined.
+        
+        Returns:
+            List of features overlapping the specified region, ordered by
+            start position
+        """
+        self._ensure_indexed()
+        bucket = self._regions.get(_region_key(genome_id, chromosome))
+        if bucket is None:
+            return []
+        return bucket.overlapping(start, end)
+    
+    def get_frozen_features_in_region(self, chromosome: str, start: int, end: int, genome_id: Union[str, uuid.UUID]) -> List[FrozenFeature]:
+        """Get read-only snapshots of the features within a genomic region.
+        
+        Like get_features_in_region, but for callers that only read
+        coordinates. Snapshots are built once per chromosome and reused
+        until a feature on it is added, updated or deleted.
+        
         Args:
             chromosome: The chromosome name
             start: Start position
@@ -139,13 +449,14 @@ class FeatureRepository:
             genome_id: The ID of the genome
             
         Returns:
-            List of features overlapping the specified region
+            List of frozen features overlapping the specified region,
+            ordered by start position
         """
-        genome_id_str = str(genome_id)
-        return [f for f in self.features.values() 
-                if f.chromosome == chromosome 
-                and str(f.genome_id) == genome_id_str
-                and f.start <= end and f.end >= start]
+        self._ensure_indexed()
+        bucket = self._regions.get(_region_key(genome_id, chromosome))
+        if bucket is None:
+            return []
+        return bucket.overlapping_frozen(start, end)
     
     def get_features_by_parent(self, parent_id: Union[str, uuid.UUID]) -> List[Feature]:
         """Get all child features of a parent feature.
@@ -156,6 +467,5 @@ class FeatureRepository:
         Returns:
             List of child features
         """
-        parent_id_str = str(parent_id)
-        return [f for f in self.features.values() 
-                if f.parent_id and str(f.parent_id) == parent_id_str]
\ No newline at end of file
+        self._ensure_indexed()
+        return list(self._by_parent.get(_to_str_id(parent_id), {}).values())
\ No newline at end of file
@@ -6,6 +6,11 @@ import uuid
 from blims.models.genome import Genome
 
 
+def _to_str_id(value: Union[str, uuid.UUID]) -> str:
+    """Get the string form of an ID, skipping str() for string IDs."""
+    return value if type(value) is str else str(value)
+
+
 class GenomeRepository:
     """Repository for managing genomes.
     
@@ -26,7 +31,7 @@ class GenomeRepository:
         Returns:
             The stored genome with any repository-assigned fields
         """
-        genome_id = str(genome.id)
+        genome_id = genome._id_str
         self.genomes[genome_id] = genome
         return genome
     
@@ -39,7 +44,7 @@ class GenomeRepository:
         Returns:
             The genome if found, None otherwise
         """
-        genome_id_str = str(genome_id)
+        genome_id_str = _to_str_id(genome_id)
         return self.genomes.get(genome_id_str)
     
     def update_genome(self, genome: Genome) -> Genome:
@@ -54,7 +59,7 @@ class GenomeRepository:
         Raises:
             ValueError: If the genome doesn't exist
         """
-        genome_id = str(genome.id)
+        genome_id = genome._id_str
         if genome_id not in self.genomes:
             raise ValueError(f"Genome with ID {genome_id} not found")
         
@@ -70,7 +75,7 @@ class GenomeRepository:
         Returns:
             True if the genome was deleted, False if it didn't exist
         """
-        genome_id_str = str(genome_id)
+        genome_id_str = _to_str_id(genome_id)
         if genome_id_str in self.genomes:
             del self.genomes[genome_id_str]
             return True
@@ -115,5 +120,5 @@ class GenomeRepository:
         Returns:
             List of genomes associated with the sample
         """
-        sample_id_str = str(sample_id)
+        sample_id_str = _to_str_id(sample_id)
         return [g for g in self.genomes.values() if g.sample_id and str(g.sample_id) == sample_id_str]
\ No newline at end of file
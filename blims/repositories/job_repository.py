@@ -1,11 +1,51 @@
 """Repository for managing bioinformatics jobs."""
 
-from typing import Dict, List, Optional, Union
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
 import uuid
 from datetime import datetime
 
 from blims.models.job import Job, JobStatus, JobType
 
+# Job attributes with a lookup index: index name -> key of a job
+_INDEX_KEYS: Dict[str, Callable[[Job], Hashable]] = {
+    "status": lambda job: job.status.value,
+    "job_type": lambda job: job.job_type.value,
+    "created_by": lambda job: job.created_by,
+    "sample_id": lambda job: job._sample_id_str,
+}
+
+# Position of each index's key in the per-job key tuples
+_INDEX_POSITIONS = {name: i for i, name in enumerate(_INDEX_KEYS)}
+
+
+def _discard(index: Dict[Hashable, Dict[str, Job]], key: Hashable, job_id: str) -> None:
+    """Remove a job from one bucket of a lookup index."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(job_id, None)
+        if not bucket:
+            del index[key]
+
+
+def _created_key(created_at: datetime) -> float:
+    """Get the creation-time index key of a job: POSIX seconds.
+    
+    Naive and timezone-aware datetimes cannot be compared with each other,
+    but their timestamps can; naive times are taken as local time, as
+    datetime.timestamp() does.
+    """
+    try:
+        return created_at.timestamp()
+    except (OverflowError, OSError, ValueError):
+        # Naive times at the ends of the datetime range, e.g. datetime.min
+        return float("-inf") if created_at.year < 1970 else float("inf")
+
+
+def _to_str_id(value: Union[str, uuid.UUID]) -> str:
+    """Get the string form of an ID, skipping str() for string IDs."""
+    return value if type(value) is str else str(value)
+
 
 class JobRepository:
     """Repository for managing bioinformatics jobs.
@@ -17,6 +57,114 @@ class JobRepository:
     def __init__(self):
         """Initialize the job repository."""
         self.jobs: Dict[str, Job] = {}
+        
+        # Lookup indexes: index name -> key -> jobs by ID, in insertion
+        # order, plus the keys each job was filed under so it can be removed
+        # again. Rebuilt if the jobs dict is replaced
+        self._indexes: Dict[str, Dict[Hashable, Dict[str, Job]]] = {
+            name: {} for name in _INDEX_KEYS
+        }
+        self._index_keys: Dict[str, Tuple[Hashable, ...]] = {}
+        self._indexed_jobs: Optional[Dict[str, Job]] = None
+        
+        # Creation-time index: jobs sorted by created_at, with the times as
+        # POSIX seconds in a parallel list for binary search
+        self._created_times: List[float] = []
+        self._by_created: List[Job] = []
+    
+    def _ensure_indexed(self) -> None:
+        """Rebuild the lookup indexes if jobs was replaced."""
+        if self._indexed_jobs is not self.jobs:
+            self._indexes = {name: {} for name in _INDEX_KEYS}
+            self._index_keys = {}
+            self._indexed_jobs = self.jobs
+            for job_id, job in self.jobs.items():
+                self._index_job(job_id, job, by_created=False)
+            self._by_created = sorted(self.jobs.values(), key=lambda job: _created_key(job.created_at))
+            self._created_times = [_created_key(job.created_at) for job in self._by_created]
+    
+    def _index_job(self, job_id: str, job: Job, by_created: bool = True) -> None:
+        keys = tuple(key(job) for key in _INDEX_KEYS.values())
+        created = _created_key(job.created_at)
+        for index, key in zip(self._indexes.values(), keys):
+            index.setdefault(key, {})[job_id] = job
+        # The creation time is kept last so the job can be found again
+        self._index_keys[job_id] = keys + (created,)
+        
+        if by_created:
+            # New jobs are usually the newest, so this is normally an append
+            i = bisect_right(self._created_times, created)
+            self._created_times.insert(i, created)
+            self._by_created.insert(i, job)
+    
+    def _unindex_job(self, job_id: str) -> None:
+        keys = self._index_keys.pop(job_id, None)
+        if keys is None:
+            return
+        for index, key in zip(self._indexes.values(), keys):
+            _discard(index, key, job_id)
+        
+        i = self._created_position(job_id, keys[-1])
+        if i is not None:
+            del self._created_times[i]
+            del self._by_created[i]
+    
+    def _created_position(self, job_id: str, created: float) -> Optional[int]:
+        """Find a job's position in the creation-time index."""
+        i = bisect_left(self._created_times, created)
+        while i < len(self._created_times) and self._created_times[i] == created:
+            if self._by_created[i]._id_str == job_id:
+                return i
+            i += 1
+        return None
+    
+    def _reindex_job(self, job_id: str, job: Job) -> None:
+        """Refile a stored job under the indexes whose keys changed."""
+        old_keys = self._index_keys.get(job_id)
+        if old_keys is None:
+            self._index_job(job_id, job)
+            return
+        keys = tuple(key(job) for key in _INDEX_KEYS.values())
+        created = _created_key(job.created_at)
+        i = self._created_position(job_id, old_keys[-1])
+        for index, old_key, key in zip(self._indexes.values(), old_keys, keys):
+            if key != old_key:
+                _discard(index, old_key, job_id)
+                index.setdefault(key, {})[job_id] = job
+            else:
+                # Same key; keep the position but hold the stored object
+                index[key][job_id] = job
+        
+        if old_keys[-1] == created:
+            if i is not None:
+                self._by_created[i] = job
+        else:
+            if i is not None:
+                del self._created_times[i]
+                del self._by_created[i]
+            i = bisect_right(self._created_times, created)
+            self._created_times.insert(i, created)
+            self._by_created.insert(i, job)
+        self._index_keys[job_id] = keys + (created,)
+    
+    def _refile(self, name: str, job_id: str, job: Job) -> None:
+        """Move a stored job within one lookup index after its key changed."""
+        keys = self._index_keys.get(job_id)
+        if keys is None:
+            return
+        position = _INDEX_POSITIONS[name]
+        new_key = _INDEX_KEYS[name](job)
+        if new_key == keys[position]:
+            return
+        index = self._indexes[name]
+        _discard(index, keys[position], job_id)
+        index.setdefault(new_key, {})[job_id] = job
+        self._index_keys[job_id] = keys[:position] + (new_key,) + keys[position + 1:]
+    
+    def _lookup(self, name: str, key: Hashable) -> List[Job]:
+        """Get the jobs filed under a key of one lookup index."""
+        self._ensure_indexed()
+        return list(self._indexes[name].get(key, {}).values())
     
     def create_job(self, job: Job) -> Job:
         """Store a new job in the repository.
@@ -27,7 +175,11 @@ class JobRepository:
         Returns:
             The stored job with any repository-assigned fields
         """
-        job_id = str(job.id)
+        job_id = job._id_str
+        self._ensure_indexed()
+        self._unindex_job(job_id)
+        # Indexed before it is stored, so a failure leaves no half-added job
+        self._index_job(job_id, job)
         self.jobs[job_id] = job
         return job
     
@@ -40,7 +192,7 @@ class JobRepository:
         Returns:
             The job if found, None otherwise
         """
-        job_id_str = str(job_id)
+        job_id_str = _to_str_id(job_id)
         return self.jobs.get(job_id_str)
     
     def update_job(self, job: Job) -> Job:
@@ -55,10 +207,12 @@ class JobRepository:
         Raises:
             ValueError: If the job doesn't exist
         """
-        job_id = str(job.id)
+        job_id = job._id_str
         if job_id not in self.jobs:
             raise ValueError(f"Job with ID {job_id} not found")
         
+        self._ensure_indexed()
+        self._reindex_job(job_id, job)
         self.jobs[job_id] = job
         return job
     
@@ -75,12 +229,14 @@ class JobRepository:
         Raises:
             ValueError: If the job doesn't exist
         """
-        job_id_str = str(job_id)
+        job_id_str = _to_str_id(job_id)
         job = self.get_job(job_id_str)
         if not job:
             raise ValueError(f"Job with ID {job_id_str} not found")
         
+        self._ensure_indexed()
         job.update_status(status)
+        self._refile("status", job_id_str, job)
         return job
     
     def delete_job(self, job_id: Union[str, uuid.UUID]) -> bool:
@@ -92,8 +248,10 @@ class JobRepository:
         Returns:
             True if the job was deleted, False if it didn't exist
         """
-        job_id_str = str(job_id)
+        job_id_str = _to_str_id(job_id)
         if job_id_str in self.jobs:
+            self._ensure_indexed()
+            self._unindex_job(job_id_str)
             del self.jobs[job_id_str]
             return True
         return False
@@ -115,19 +273,23 @@ class JobRepository:
         Returns:
             List of jobs for the sample
         """
-        sample_id_str = str(sample_id)
-        return [job for job in self.jobs.values() if str(job.sample_id) == sample_id_str]
+        return self._lookup("sample_id", _to_str_id(sample_id))
     
     def get_jobs_by_status(self, status: JobStatus) -> List[Job]:
         """Get all jobs with a specific status.
         
+        Answered from an index kept in step by update_job_status and
+        update_job; a status changed on the job alone is picked up at
+        its next update_job.
+        
         Args:
             status: The status to filter by
             
         Returns:
             List of jobs with the specified status
         """
-        return [job for job in self.jobs.values() if job.status == status]
+        status_str = status.value if isinstance(status, JobStatus) else status
+        return self._lookup("status", status_str)
     
     def get_jobs_by_type(self, job_type: JobType) -> List[Job]:
         """Get all jobs of a specific type.
@@ -138,7 +300,8 @@ class JobRepository:
         Returns:
             List of jobs with the specified type
         """
-        return [job for job in self.jobs.values() if job.job_type == job_type]
+        type_str = job_type.value if isinstance(job_type, JobType) else job_type
+        return self._lookup("job_type", type_str)
     
     def get_jobs_created_after(self, timestamp: datetime) -> List[Job]:
         """Get all jobs created after a specific time.
@@ -147,9 +310,10 @@ class JobRepository:
             timestamp: The timestamp to filter by
             
         Returns:
-            List of jobs created after the timestamp
+            List of jobs created after the timestamp, oldest first
         """
-        return [job for job in self.jobs.values() if job.created_at > timestamp]
+        self._ensure_indexed()
+        return self._by_created[bisect_right(self._created_times, _created_key(timestamp)):]
     
     def get_jobs_for_user(self, username: str) -> List[Job]:
         """Get all jobs created by a specific user.
@@ -160,4 +324,4 @@ class JobRepository:
         Returns:
             List of jobs created by the user
         """
-        return [job for job in self.jobs.values() if job.created_by == username]
\ No newline at end of file
+        return self._lookup("created_by", username)
\ No newline at end of file
@@ -1,10 +1,31 @@
 """Repository for managing samples."""
 
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
 import uuid
 
 from blims.models.sample import Sample
 
+# Sample attributes with a lookup index: index name -> key of a sample
+_INDEX_KEYS: Dict[str, Callable[[Sample], Hashable]] = {
+    "sample_type": lambda sample: sample.sample_type,
+    "container_id": lambda sample: sample._container_id_str,
+    "is_container": lambda sample: bool(sample.is_container),
+}
+
+
+def _discard(index: Dict[Hashable, Dict[str, Sample]], key: Hashable, sample_id: str) -> None:
+    """Remove a sample from one bucket of a lookup index."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(sample_id, None)
+        if not bucket:
+            del index[key]
+
+
+def _to_str_id(value: Union[str, uuid.UUID]) -> str:
+    """Get the string form of an ID, skipping str() for string IDs."""
+    return value if type(value) is str else str(value)
+
 
 class SampleRepository:
     """Repository for managing samples.
@@ -17,6 +38,80 @@ class SampleRepository:
         """Initialize the sample repository."""
         self.samples: Dict[str, Sample] = {}
         self.sample_ids: Dict[str, str] = {}  # Maps sample_id to sample UUID
+        
+        # Lookup indexes: index name -> key -> samples by ID, in insertion
+        # order, plus the keys each sample was filed under (and, last, the
+        # sample_id it was mapped under) so it can be moved or removed
+        # again. Rebuilt, along with sample_ids, if samples is replaced
+        self._indexes: Dict[str, Dict[Hashable, Dict[str, Sample]]] = {
+            name: {} for name in _INDEX_KEYS
+        }
+        self._index_keys: Dict[str, Tuple[Hashable, ...]] = {}
+        self._indexed_samples: Optional[Dict[str, Sample]] = None
+    
+    def _ensure_indexed(self) -> None:
+        """Rebuild the indexes and sample_ids if samples was replaced."""
+        if self._indexed_samples is not self.samples:
+            self.rebuild_indexes()
+    
+    def rebuild_indexes(self) -> None:
+        """Rebuild the lookup indexes and the sample_id mapping from samples.
+        
+        Called automatically when samples is replaced; call it directly
+        after changing stored samples in bulk without update_sample.
+        """
+        self._indexes = {name: {} for name in _INDEX_KEYS}
+        self._index_keys = {}
+        self.sample_ids = {}
+        self._indexed_samples = self.samples
+        for sample_id, sample in self.samples.items():
+            self._index_sample(sample_id, sample)
+    
+    def _index_sample(self, sample_id: str, sample: Sample) -> None:
+        keys = tuple(key(sample) for key in _INDEX_KEYS.values())
+        for index, key in zip(self._indexes.values(), keys):
+            index.setdefault(key, {})[sample_id] = sample
+        self._index_keys[sample_id] = keys + (sample.sample_id,)
+        if sample.sample_id:
+            self.sample_ids[sample.sample_id] = sample_id
+    
+    def _unmap_sample_id(self, sample_id: str, human_id: Optional[str]) -> None:
+        # Only drop the mapping if it still points at this sample
+        if human_id and self.sample_ids.get(human_id) == sample_id:
+            del self.sample_ids[human_id]
+    
+    def _unindex_sample(self, sample_id: str) -> None:
+        keys = self._index_keys.pop(sample_id, None)
+        if keys is None:
+            return
+        for index, key in zip(self._indexes.values(), keys):
+            _discard(index, key, sample_id)
+        self._unmap_sample_id(sample_id, keys[-1])
+    
+    def _reindex_sample(self, sample_id: str, sample: Sample) -> None:
+        """Refile a stored sample under the indexes whose keys changed."""
+        old_keys = self._index_keys.get(sample_id)
+        if old_keys is None:
+            self._index_sample(sample_id, sample)
+            return
+        keys = tuple(key(sample) for key in _INDEX_KEYS.values())
+        for index, old_key, key in zip(self._indexes.values(), old_keys, keys):
+            if key != old_key:
+                _discard(index, old_key, sample_id)
+                index.setdefault(key, {})[sample_id] = sample
+            else:
+                # Same key; keep the position but hold the stored object
+                index[key][sample_id] = sample
+        if old_keys[-1] != sample.sample_id:
+            self._unmap_sample_id(sample_id, old_keys[-1])
+        if sample.sample_id:
+            self.sample_ids[sample.sample_id] = sample_id
+        self._index_keys[sample_id] = keys + (sample.sample_id,)
+    
+    def _lookup(self, name: str, key: Hashable) -> Iterator[Sample]:
+        """Iterate over the samples filed under a key of one lookup index."""
+        self._ensure_indexed()
+        return iter(self._indexes[name].get(key, {}).values())
     
     def create_sample(self, sample: Sample) -> Sample:
         """Store a new sample in the repository.
@@ -27,13 +122,11 @@ class SampleRepository:
         Returns:
             The stored sample with any repository-assigned fields
         """
-        sample_id = str(sample.id)
+        sample_id = sample._id_str
+        self._ensure_indexed()
+        self._unindex_sample(sample_id)
         self.samples[sample_id] = sample
-        
-        # Create a mapping for sample_id if it exists
-        if hasattr(sample, 'sample_id') and sample.sample_id:
-            self.sample_ids[sample.sample_id] = sample_id
-        
+        self._index_sample(sample_id, sample)
         return sample
     
     def get_sample(self, sample_id: Union[str, uuid.UUID]) -> Optional[Sample]:
@@ -45,8 +138,25 @@ class SampleRepository:
         Returns:
             The sample if found, None otherwise
         """
-        sample_id_str = str(sample_id)
-        return self.samples.get(sample_id_str)
+        return self.samples.get(_to_str_id(sample_id))
+    
+    def get_samples(self, sample_ids: Iterable[Union[str, uuid.UUID]]) -> Dict[str, Sample]:
+        """Retrieve several samples by ID in one call.
+        
+        Args:
+            sample_ids: The IDs of the samples to retrieve
+            
+        Returns:
+            The samples found, keyed by string ID; missing IDs are left out
+        """
+        samples = self.samples
+        found = {}
+        for sample_id in sample_ids:
+            sample_id_str = _to_str_id(sample_id)
+            sample = samples.get(sample_id_str)
+            if sample is not None:
+                found[sample_id_str] = sample
+        return found
     
     def get_sample_by_sample_id(self, sample_id: str) -> Optional[Sample]:
         """Retrieve a sample by its human-readable sample ID.
@@ -57,17 +167,9 @@ class SampleRepository:
         Returns:
             The sample if found, None otherwise
         """
-        if sample_id in self.sample_ids:
-            return self.samples.get(self.sample_ids[sample_id])
-        
-        # Fallback: iterate through samples to find matching sample_id
-        for sample in self.samples.values():
-            if hasattr(sample, 'sample_id') and sample.sample_id == sample_id:
-                # Update the mapping for future lookups
-                self.sample_ids[sample_id] = str(sample.id)
-                return sample
-        
-        return None
+        self._ensure_indexed()
+        uuid_str = self.sample_ids.get(sample_id)
+        return self.samples.get(uuid_str) if uuid_str else None
     
     def update_sample(self, sample: Sample) -> Sample:
         """Update an existing sample.
@@ -81,21 +183,48 @@ class SampleRepository:
         Raises:
             ValueError: If the sample doesn't exist
         """
-        sample_id = str(sample.id)
+        sample_id = sample._id_str
         if sample_id not in self.samples:
             raise ValueError(f"Sample with ID {sample_id} not found")
         
-        # Update the mapping if sample_id has changed
-        old_sample = self.samples[sample_id]
-        if hasattr(old_sample, 'sample_id') and hasattr(sample, 'sample_id'):
-            if old_sample.sample_id != sample.sample_id:
-                if old_sample.sample_id in self.sample_ids:
-                    del self.sample_ids[old_sample.sample_id]
-                if sample.sample_id:
-                    self.sample_ids[sample.sample_id] = sample_id
+        self._store_update(sample)
+        return sample
+    
+    def update_samples(self, samples: Iterable[Sample]) -> List[Sample]:
+        """Update several existing samples as one batch.
+        
+        Every sample is checked before any is written, so either all of the
+        updates are applied or none are.
         
+        Args:
+            samples: The samples with updated fields
+            
+        Returns:
+            The updated samples
+            
+        Raises:
+            ValueError: If any of the samples doesn't exist
+        """
+        samples = list(samples)
+        for sample in samples:
+            if sample._id_str not in self.samples:
+                raise ValueError(f"Sample with ID {sample.id} not found")
+        
+        for sample in samples:
+            self._store_update(sample)
+        return samples
+    
+    def _store_update(self, sample: Sample) -> None:
+        """Store an updated sample that is known to exist.
+        
+        Args:
+            sample: The sample with updated fields
+        """
+        sample_id = sample._id_str
+        sample.invalidate_dict_cache()
+        self._ensure_indexed()
         self.samples[sample_id] = sample
-        return sample
+        self._reindex_sample(sample_id, sample)
     
     def delete_sample(self, sample_id: Union[str, uuid.UUID]) -> bool:
         """Delete a sample from the repository.
@@ -106,35 +235,77 @@ class SampleRepository:
         Returns:
             True if the sample was deleted, False if it didn't exist
         """
-        sample_id_str = str(sample_id)
+        sample_id_str = _to_str_id(sample_id)
         if sample_id_str in self.samples:
-            # Remove from sample_ids mapping if needed
-            sample = self.samples[sample_id_str]
-            if hasattr(sample, 'sample_id') and sample.sample_id in self.sample_ids:
-                del self.sample_ids[sample.sample_id]
-            
+            self._ensure_indexed()
+            self._unindex_sample(sample_id_str)
             del self.samples[sample_id_str]
             return True
         return False
     
+    def iter_samples(self) -> Iterator[Sample]:
+        """Iterate over all samples in the repository without copying them.
+        
+        The iter_* methods read the repository's own storage, so samples
+        must not be created or deleted while iterating; use the matching
+        get_* method for a list that is safe to keep.
+        
+        Returns:
+            Iterator over all samples
+        """
+        return iter(self.samples.values())
+    
+    def iter_samples_by_type(self, sample_type: str) -> Iterator[Sample]:
+        """Iterate over the samples of a specific type.
+        
+        Args:
+            sample_type: The sample type to filter by
+            
+        Returns:
+            Iterator over samples with the specified type
+        """
+        return self._lookup("sample_type", sample_type)
+    
+    def iter_samples_by_container(self, container_id: Union[str, uuid.UUID]) -> Iterator[Sample]:
+        """Iterate over the samples in a specific container.
+        
+        Args:
+            container_id: The ID of the container
+            
+        Returns:
+            Iterator over samples in the container
+        """
+        return self._lookup("container_id", _to_str_id(container_id))
+    
+    def iter_containers(self) -> Iterator[Sample]:
+        """Iterate over all containers.
+        
+        Returns:
+            Iterator over samples that are containers
+        """
+        return self._lookup("is_container", True)
+    
     def get_all_samples(self) -> List[Sample]:
         """Get all samples in the repository.
         
         Returns:
             List of all samples
         """
-        return list(self.samples.values())
+        return list(self.iter_samples())
     
     def get_samples_by_type(self, sample_type: str) -> List[Sample]:
         """Get all samples of a specific type.
         
+        Answered from an index kept in step by create, update and delete;
+        a change made to a sample alone is picked up at its next update.
+        
         Args:
             sample_type: The sample type to filter by
             
         Returns:
             List of samples with the specified type
         """
-        return [s for s in self.samples.values() if s.sample_type == sample_type]
+        return list(self.iter_samples_by_type(sample_type))
     
     def get_samples_by_container(self, container_id: Union[str, uuid.UUID]) -> List[Sample]:
         """Get all samples in a specific container.
@@ -145,8 +316,7 @@ class SampleRepository:
         Returns:
             List of samples in the container
         """
-        container_id_str = str(container_id)
-        return [s for s in self.samples.values() if hasattr(s, 'container_id') and str(s.container_id) == container_id_str]
+        return list(self.iter_samples_by_container(container_id))
     
     def get_containers(self) -> List[Sample]:
         """Get all containers.
@@ -154,4 +324,4 @@ class SampleRepository:
         Returns:
             List of all containers (samples that are containers)
         """
-        return [s for s in self.samples.values() if hasattr(s, 'is_container') and s.is_container]
\ No newline at end of file
+        return list(self.iter_containers())
\ No newline at end of file
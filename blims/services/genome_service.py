@@ -1,7 +1,10 @@
 """Service for managing genomes and features in BLIMS."""
 
 import os
-from typing import Dict, List, Optional, Any, Union, Tuple
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Any, Union, Tuple
+from urllib.parse import unquote
 import uuid
 
 from blims.models.genome import Genome
@@ -11,6 +14,30 @@ from blims.repositories.feature_repository import FeatureRepository
 from blims.services.sample_service import SampleService
 
 
+# Fields that must be present to create a genome or feature
+_GENOME_REQUIRED_FIELDS = frozenset({'name', 'species', 'assembly_version', 'created_by'})
+_FEATURE_REQUIRED_FIELDS = frozenset(
+    {'name', 'feature_type', 'chromosome', 'start', 'end', 'genome_id', 'created_by'}
+)
+
+# GFF3 feature types (column 3) with a matching FeatureType; other types
+# are imported as CUSTOM with the GFF type kept in metadata
+_GFF_FEATURE_TYPES = {
+    "gene": FeatureType.GENE,
+    "exon": FeatureType.EXON,
+    "CDS": FeatureType.CDS,
+    "promoter": FeatureType.PROMOTER,
+    "enhancer": FeatureType.ENHANCER,
+    "SNV": FeatureType.SNP,
+    "SNP": FeatureType.SNP,
+    "indel": FeatureType.INDEL,
+    "copy_number_variation": FeatureType.CNV,
+    "structural_variant": FeatureType.SV,
+    "repeat_region": FeatureType.REPEAT,
+    "regulatory_region": FeatureType.REGULATORY,
+}
+
+
 class GenomeService:
     """Service for managing genomes and genomic features.
     
@@ -49,10 +76,9 @@ class GenomeService:
             ValueError: If required fields are missing or invalid
         """
         # Validate required fields
-        required_fields = ['name', 'species', 'assembly_version', 'created_by']
-        for field in required_fields:
-            if field not in genome_data:
-                raise ValueError(f"Missing required field: {field}")
+        missing = _GENOME_REQUIRED_FIELDS - genome_data.keys()
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
         
         # Validate sample_id if provided
         if 'sample_id' in genome_data and genome_data['sample_id'] and self.sample_service:
@@ -157,10 +183,8 @@ class GenomeService:
             True if the genome was deleted, False if it didn't exist
         """
         # Also delete all features associated with this genome
-        features = self.feature_repository.get_features_by_genome(genome_id)
-        for feature in features:
-            self.feature_repository.delete_feature(feature.id)
-            
+        self.feature_repository.delete_features_by_genome(genome_id)
+        
         return self.genome_repository.delete_genome(genome_id)
     
     # Feature methods
@@ -177,10 +201,9 @@ class GenomeService:
             ValueError: If required fields are missing or invalid
         """
         # Validate required fields
-        required_fields = ['name', 'feature_type', 'chromosome', 'start', 'end', 'genome_id', 'created_by']
-        for field in required_fields:
-            if field not in feature_data:
-                raise ValueError(f"Missing required field: {field}")
+        missing = _FEATURE_REQUIRED_FIELDS - feature_data.keys()
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
         
         # Validate genome_id
         genome_id = feature_data['genome_id']
@@ -188,7 +211,8 @@ class GenomeService:
         if not genome:
             raise ValueError(f"Genome with ID {genome_id} not found")
         
-        # Validate parent_id if provided
+        # Validate parent_id if provided, keeping the parent for the update below
+        parent = None
         if 'parent_id' in feature_data and feature_data['parent_id']:
             parent_id = feature_data['parent_id']
             parent = self.feature_repository.get_feature(parent_id)
@@ -215,19 +239,80 @@ class GenomeService:
             metadata=feature_data.get('metadata', {})
         )
         
-        # Add feature to genome
+        # Add feature to genome. The genome is the instance the repository
+        # holds, so this needs no update_genome write
         genome.add_feature(feature.id)
-        self.genome_repository.update_genome(genome)
         
         # Add feature to parent if applicable
-        if 'parent_id' in feature_data and feature_data['parent_id']:
-            parent = self.feature_repository.get_feature(feature_data['parent_id'])
-            if parent:
-                parent.add_child(feature.id)
-                self.feature_repository.update_feature(parent)
+        if parent is not None:
+            parent.add_child(feature.id)
+            self.feature_repository.update_feature(parent)
         
         return self.feature_repository.create_feature(feature)
     
+    def create_features(self, features: Iterable[Feature]) -> List[Feature]:
+        """Create several features as one batch.
+        
+        Each genome is fetched once for the whole batch, and each stored
+        parent feature updated once for all of its new children.
+        Parents may also be features earlier or later in the batch. Every
+        feature is checked before any is stored, so either all of them
+        are created or none are.
+        
+        Args:
+            features: The features to create
+            
+        Returns:
+            The created features
+            
+        Raises:
+            ValueError: If a genome or parent feature doesn't exist, or a
+                parent is in a different genome
+        """
+        features = list(features)
+        batch = {feature._id_str: feature for feature in features}
+        
+        # Validate genomes, collecting the new feature IDs for each
+        genomes: Dict[str, Tuple[Genome, List[uuid.UUID]]] = {}
+        for feature in features:
+            genome_key = str(feature.genome_id)
+            entry = genomes.get(genome_key)
+            if entry is None:
+                genome = self.genome_repository.get_genome(genome_key)
+                if not genome:
+                    raise ValueError(f"Genome with ID {feature.genome_id} not found")
+                entry = genomes[genome_key] = (genome, [])
+            entry[1].append(feature.id)
+        
+        # Validate parents, collecting the new child IDs for each
+        parents: Dict[str, Tuple[Feature, List[uuid.UUID]]] = {}
+        for feature in features:
+            if not feature.parent_id:
+                continue
+            parent_key = str(feature.parent_id)
+            entry = parents.get(parent_key)
+            if entry is None:
+                parent = batch.get(parent_key) or self.feature_repository.get_feature(parent_key)
+                if not parent:
+                    raise ValueError(f"Parent feature with ID {feature.parent_id} not found")
+                entry = parents[parent_key] = (parent, [])
+            if str(entry[0].genome_id) != str(feature.genome_id):
+                raise ValueError("Parent feature must be in the same genome as the feature")
+            entry[1].append(feature.id)
+        
+        # Add features to genomes and children to parents
+        for genome, feature_ids in genomes.values():
+            genome.add_features(feature_ids)
+        
+        for parent_key, (parent, child_ids) in parents.items():
+            parent.add_children(child_ids)
+            if parent_key not in batch:
+                self.feature_repository.update_feature(parent)
+        
+        for feature in features:
+            self.feature_repository.create_feature(feature)
+        return features
+    
     def get_feature(self, feature_id: Union[str, uuid.UUID]) -> Optional[Feature]:
         """Get a feature by ID.
         
@@ -265,7 +350,12 @@ class GenomeService:
         return self.feature_repository.get_features_in_region(chromosome, start, end, genome_id)
     
     def import_features_from_gff(self, genome_id: Union[str, uuid.UUID], gff_path: str, created_by: str) -> int:
-        """Import features from a GFF file.
+        """Import features from a GFF3 file.
+        
+        Records are parsed into features first and then created as one
+        batch with create_features. Parent attributes are resolved against
+        the IDs in the same file; only the first parent of a record is
+        kept.
         
         Args:
             genome_id: The ID of the genome to associate features with
@@ -288,12 +378,83 @@ class GenomeService:
         if not os.path.exists(gff_path):
             raise FileNotFoundError(f"GFF file not found: {gff_path}")
         
-        # Import features
-        count = 0
-        # For future implementation: actual GFF parsing and feature creation
-        # This would create Feature objects from GFF records and add them to the repository
+        features = self._parse_gff(gff_path, genome.id, created_by)
+        return len(self.create_features(features))
+    
+    def _parse_gff(self, gff_path: str, genome_id: uuid.UUID, created_by: str) -> List[Feature]:
+        """Parse the records of a GFF3 file into features.
+        
+        Args:
+            gff_path: Path to the GFF file
+            genome_id: The ID of the genome the features belong to
+            created_by: The user importing the features
+            
+        Returns:
+            The parsed features, with parent IDs resolved
+            
+        Raises:
+            ValueError: If a record is malformed or names an unknown parent
+        """
+        features: List[Feature] = []
+        by_gff_id: Dict[str, Feature] = {}
+        parent_gff_ids: List[Tuple[Feature, str]] = []
+        created_at = datetime.now()
+        
+        with open(gff_path) as gff:
+            for line_number, line in enumerate(gff, 1):
+                line = line.rstrip("\n")
+                if line.startswith("##FASTA"):
+                    break
+                if not line or line.startswith("#"):
+                    continue
+                
+                columns = line.split("\t")
+                if len(columns) != 9:
+                    raise ValueError(f"Invalid GFF record on line {line_number}: expected 9 columns")
+                seqid, _source, gff_type, start, end, _score, strand, _phase, attributes = columns
+                
+                attrs: Dict[str, str] = {}
+                for attribute in attributes.split(";"):
+                    if "=" in attribute:
+                        key, value = attribute.split("=", 1)
+                        attrs[key.strip()] = unquote(value)
+                
+                feature_type = _GFF_FEATURE_TYPES.get(gff_type, FeatureType.CUSTOM)
+                metadata = None
+                if feature_type is FeatureType.CUSTOM:
+                    # Kept in every feature's metadata; share one string per type
+                    gff_type = sys.intern(gff_type)
+                    metadata = {"gff_type": gff_type}
+                gff_id = attrs.get("ID")
+                try:
+                    feature = Feature(
+                        name=attrs.get("Name") or gff_id or gff_type,
+                        feature_type=feature_type,
+                        chromosome=unquote(seqid),
+                        start=int(start),
+                        end=int(end),
+                        genome_id=genome_id,
+                        created_by=created_by,
+                        strand=strand if strand in ("+", "-") else None,
+                        metadata=metadata,
+                        created_at=created_at,
+                    )
+                except ValueError:
+                    raise ValueError(f"Invalid GFF record on line {line_number}: bad coordinates")
+                
+                features.append(feature)
+                if gff_id:
+                    by_gff_id[gff_id] = feature
+                if attrs.get("Parent"):
+                    parent_gff_ids.append((feature, attrs["Parent"].split(",")[0]))
         
-        return count
+        for feature, parent_gff_id in parent_gff_ids:
+            parent = by_gff_id.get(parent_gff_id)
+            if parent is None:
+                raise ValueError(f"GFF parent {parent_gff_id} of feature {feature.name} not found")
+            feature.parent_id = parent.id
+        
+        return features
     
     def get_feature_hierarchy(self, feature_id: Union[str, uuid.UUID]) -> Dict[str, Any]:
         """Get a feature and all its child features in a hierarchical structure.
@@ -314,7 +475,11 @@ class GenomeService:
         return self._build_feature_hierarchy(feature)
     
     def _build_feature_hierarchy(self, feature: Feature) -> Dict[str, Any]:
-        """Recursively build a feature hierarchy.
+        """Build a feature hierarchy.
+        
+        The tree is walked a level at a time rather than recursively, with
+        one bulk fetch for all children on each level; each feature is
+        expanded at most once.
         
         Args:
             feature: The feature to build the hierarchy for
@@ -325,10 +490,25 @@ class GenomeService:
         result = feature.to_dict()
         result['children'] = []
         
-        # Get child features
-        for child_id in feature.child_ids:
-            child = self.feature_repository.get_feature(child_id)
-            if child:
-                result['children'].append(self._build_feature_hierarchy(child))
+        expanded = {feature._id_str}
+        level = [(feature, result)]
+        while level:
+            found = self.feature_repository.get_features(
+                child_id for parent, _ in level for child_id in parent.child_ids
+            )
+            next_level = []
+            for parent, node in level:
+                children = node['children']
+                for child_id in parent.child_ids:
+                    child = found.get(str(child_id))
+                    if not child:
+                        continue
+                    child_node = child.to_dict()
+                    child_node['children'] = []
+                    children.append(child_node)
+                    if child._id_str not in expanded:
+                        expanded.add(child._id_str)
+                        next_level.append((child, child_node))
+            level = next_level
                 
         return result
\ No newline at end of file
@@ -12,6 +12,24 @@ from blims.repositories.job_repository import JobRepository
 from blims.services.sample_service import SampleService
 
 
+# Fields that must be present to create a job
+_JOB_REQUIRED_FIELDS = frozenset({'name', 'job_type', 'sample_id', 'created_by'})
+
+# AWS Batch job states mapped to job statuses
+_AWS_STATUS_MAP = {
+    'SUBMITTED': JobStatus.SUBMITTED,
+    'PENDING': JobStatus.PENDING,
+    'RUNNABLE': JobStatus.PENDING,
+    'STARTING': JobStatus.PENDING,
+    'RUNNING': JobStatus.RUNNING,
+    'SUCCEEDED': JobStatus.SUCCEEDED,
+    'FAILED': JobStatus.FAILED
+}
+
+# Statuses of jobs that may still change on AWS Batch
+_ACTIVE_STATUSES = frozenset({JobStatus.PENDING, JobStatus.SUBMITTED, JobStatus.RUNNING})
+
+
 class JobService:
     """Service for managing bioinformatics jobs.
     
@@ -54,10 +72,9 @@ class JobService:
             ValueError: If required fields are missing or sample does not exist
         """
         # Validate required fields
-        required_fields = ['name', 'job_type', 'sample_id', 'created_by']
-        for field in required_fields:
-            if field not in job_data:
-                raise ValueError(f"Missing required field: {field}")
+        missing = _JOB_REQUIRED_FIELDS - job_data.keys()
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
         
         # Validate sample exists
         sample_id = job_data['sample_id']
@@ -184,7 +201,8 @@ class JobService:
         command_override = None
         
         # Different job types need different parameter mappings
-        if job.job_type == JobType.READ_PROCESSING:
+        job_type = job.job_type
+        if job_type is JobType.READ_PROCESSING:
             parameters = {
                 'sra_accession': job.parameters.get('sra_accession', ''),
                 'output_prefix': job.parameters.get('output_prefix', ''),
@@ -192,7 +210,7 @@ class JobService:
                 'rrna_reference': job.parameters.get('rrna_reference', ''),
                 'output_bucket': self.aws_config.get('s3', {}).get('bioinformatics_bucket', '')
             }
-        elif job.job_type == JobType.NORMALIZATION:
+        elif job_type is JobType.NORMALIZATION:
             command_override = "/usr/local/bin/normalize_reads.sh"
             parameters = {
                 'input_bucket': self.aws_config.get('s3', {}).get('bioinformatics_bucket', ''),
@@ -273,18 +291,9 @@ class JobService:
             aws_status = aws_job['status']
             
             # Map AWS status to our status enum
-            status_map = {
-                'SUBMITTED': JobStatus.SUBMITTED,
-                'PENDING': JobStatus.PENDING,
-                'RUNNABLE': JobStatus.PENDING,
-                'STARTING': JobStatus.PENDING,
-                'RUNNING': JobStatus.RUNNING,
-                'SUCCEEDED': JobStatus.SUCCEEDED,
-                'FAILED': JobStatus.FAILED
-            }
-            
-            if aws_status in status_map:
-                job.update_status(status_map[aws_status])
+            status = _AWS_STATUS_MAP.get(aws_status)
+            if status is not None:
+                job.update_status(status)
                 
                 # Update job with additional AWS information
                 if 'logStreamName' in aws_job['container']:
@@ -322,9 +331,8 @@ class JobService:
             raise ValueError("AWS Batch is not configured")
             
         # Get all jobs that have AWS job IDs and are not in a terminal state
-        active_states = [JobStatus.PENDING, JobStatus.SUBMITTED, JobStatus.RUNNING]
         jobs = [job for job in self.get_all_jobs() 
-                if job.aws_job_id and job.status in active_states]
+                if job.aws_job_id and job.status in _ACTIVE_STATUSES]
         
         results = []
         for job in jobs:
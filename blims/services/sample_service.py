@@ -1,6 +1,6 @@
 """Service for managing samples in BLIMS."""
 
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 import uuid
 from datetime import datetime
 
@@ -44,6 +44,17 @@ class SampleService:
         """
         return self.sample_repository.get_sample(sample_id)
     
+    def get_samples(self, sample_ids: Iterable[Union[str, uuid.UUID]]) -> Dict[str, Sample]:
+        """Get several samples by ID in one call.
+        
+        Args:
+            sample_ids: The IDs of the samples to retrieve
+            
+        Returns:
+            The samples found, keyed by string ID; missing IDs are left out
+        """
+        return self.sample_repository.get_samples(sample_ids)
+    
     def get_sample_by_sample_id(self, sample_id: str) -> Optional[Sample]:
         """Get a sample by its human-readable sample ID.
         
@@ -63,6 +74,16 @@ class SampleService:
         """
         return self.sample_repository.get_all_samples()
     
+    def iter_samples(self) -> Iterator[Sample]:
+        """Iterate over all samples without copying them into a list.
+        
+        Samples must not be created or deleted while iterating.
+        
+        Returns:
+            Iterator over all samples
+        """
+        return self.sample_repository.iter_samples()
+    
     def update_sample(self, sample: Sample) -> Sample:
         """Update an existing sample.
         
@@ -77,6 +98,20 @@ class SampleService:
         """
         return self.sample_repository.update_sample(sample)
     
+    def update_samples(self, samples: Iterable[Sample]) -> List[Sample]:
+        """Update several existing samples in one repository write.
+        
+        Args:
+            samples: The samples with updated fields
+            
+        Returns:
+            The updated samples
+            
+        Raises:
+            ValueError: If any of the samples doesn't exist
+        """
+        return self.sample_repository.update_samples(samples)
+    
     def delete_sample(self, sample_id: Union[str, uuid.UUID]) -> bool:
         """Delete a sample.
         
@@ -11,8 +11,9 @@ import logging
 import json
 import uuid
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
-from typing import Any, Dict, List, Optional, Union, BinaryIO, Tuple
+from typing import Any, Callable, Dict, List, Optional, Union, BinaryIO, Tuple
 
 from blims.config import get_aws_region, get_s3_bucket, get_dynamodb_table, get_batch_job_queue
 
@@ -22,6 +23,15 @@ logger = logging.getLogger(__name__)
 # Get AWS region from config
 DEFAULT_REGION = get_aws_region()
 
+# Multipart settings for S3 uploads; sequencing files run to tens of GB, so
+# use larger parts and more parallel part uploads than boto3's defaults
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
 class AWSManager:
     """Manager for AWS services used by BLIMS."""
     
@@ -36,6 +46,7 @@ class AWSManager:
         self.dynamodb_client = None
         self.dynamodb_resource = None
         self.batch_client = None
+        self.sqs_client = None
         
         # Initialize clients
         self.initialize_clients()
@@ -53,6 +64,9 @@ class AWSManager:
             # Batch for running bioinformatics analyses
             self.batch_client = boto3.client('batch', region_name=self.region)
             
+            # SQS for receiving Batch job state-change events
+            self.sqs_client = boto3.client('sqs', region_name=self.region)
+            
             logger.info("AWS clients initialized successfully")
         except ClientError as e:
             logger.error(f"Failed to initialize AWS clients: {str(e)}")
@@ -78,7 +92,8 @@ class AWSManager:
             return False
     
     def upload_file(self, file_path: str, bucket: str, object_name: Optional[str] = None,
-                  metadata: Optional[Dict[str, str]] = None) -> bool:
+                  metadata: Optional[Dict[str, str]] = None,
+                  callback: Optional[Callable[[int], None]] = None) -> bool:
         """Upload a file to an S3 bucket.
         
         Args:
@@ -86,6 +101,8 @@ class AWSManager:
             bucket: Bucket to upload to
             object_name: S3 object name (defaults to file_path basename)
             metadata: Optional metadata for the file
+            callback: Optional function called with the number of bytes
+                sent for each transferred chunk
             
         Returns:
             True if file was uploaded, False otherwise
@@ -104,7 +121,9 @@ class AWSManager:
                 file_path, 
                 bucket, 
                 object_name,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Callback=callback,
+                Config=UPLOAD_TRANSFER_CONFIG
             )
             logger.info(f"Uploaded {file_path} to {bucket}/{object_name}")
             return True
@@ -165,6 +184,44 @@ class AWSManager:
             logger.error(f"Failed to generate presigned URL: {str(e)}")
             return None
     
+    def get_presigned_put_url(self, bucket: str, object_name: str, expiration: int = 3600) -> Optional[str]:
+        """Generate a presigned URL that lets a client upload an object directly.
+        
+        Args:
+            bucket: S3 bucket name
+            object_name: S3 object name
+            expiration: URL expiration time in seconds (default 1 hour)
+            
+        Returns:
+            Presigned PUT URL or None if failed
+        """
+        try:
+            return self.s3_client.generate_presigned_url(
+                'put_object',
+                Params={'Bucket': bucket, 'Key': object_name},
+                ExpiresIn=expiration
+            )
+        except ClientError as e:
+            logger.error(f"Failed to generate presigned upload URL: {str(e)}")
+            return None
+    
+    def get_object_size(self, bucket: str, object_name: str) -> Optional[int]:
+        """Get the size of an S3 object.
+        
+        Args:
+            bucket: S3 bucket name
+            object_name: S3 object name
+            
+        Returns:
+            Size in bytes, or None if the object does not exist
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=bucket, Key=object_name)
+            return response['ContentLength']
+        except ClientError as e:
+            logger.error(f"Failed to get {bucket}/{object_name}: {str(e)}")
+            return None
+    
     # DynamoDB operations for sample data
     
     def create_samples_table(self, table_name: str = 'blims-samples') -> bool:
@@ -302,6 +359,31 @@ class AWSManager:
         except ClientError as e:
             logger.error(f"Failed to get job status: {str(e)}")
             return None
+    
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, str]:
+        """Get the statuses of several AWS Batch jobs.
+        
+        DescribeJobs accepts up to 100 job IDs, so this makes one request
+        per 100 jobs rather than one per job.
+        
+        Args:
+            job_ids: AWS Batch job IDs
+            
+        Returns:
+            Mapping of job ID to status; jobs whose status could not be
+            retrieved are omitted
+        """
+        statuses = {}
+        for start in range(0, len(job_ids), 100):
+            chunk = job_ids[start:start + 100]
+            try:
+                response = self.batch_client.describe_jobs(jobs=chunk)
+            except ClientError as e:
+                logger.error(f"Failed to get job statuses: {str(e)}")
+                continue
+            for job in response['jobs']:
+                statuses[job['jobId']] = job['status']
+        return statuses
 
 # Helper functions for common operations
 
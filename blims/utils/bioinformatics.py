@@ -96,6 +96,26 @@ class BioinfManager:
     
     # Sequencing data management
     
+    def get_reads_key(
+        self,
+        sample_id: str,
+        file_name: str,
+        sequencing_type: Union[SequencingType, str] = SequencingType.ILLUMINA
+    ) -> str:
+        """Get the S3 key under which a sample's sequencing reads are stored.
+        
+        Args:
+            sample_id: Sample ID
+            file_name: Name of the file
+            sequencing_type: Type of sequencing data
+            
+        Returns:
+            S3 key
+        """
+        if isinstance(sequencing_type, SequencingType):
+            sequencing_type = sequencing_type.value
+        return f"samples/{sample_id}/reads/{sequencing_type}/{file_name}"
+    
     def upload_reads(
         self, 
         sample_id: str, 
@@ -103,7 +123,7 @@ class BioinfManager:
         sequencing_type: Union[SequencingType, str] = SequencingType.ILLUMINA,
         file_type: Union[FileType, str] = FileType.FASTQ,
         metadata: Optional[Dict[str, str]] = None
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, str, Optional[int]]:
         """Upload sequencing reads for a sample.
         
         Args:
@@ -114,7 +134,8 @@ class BioinfManager:
             metadata: Additional metadata to store with the file
             
         Returns:
-            Tuple of (success status, S3 key)
+            Tuple of (success status, S3 key, bytes uploaded); the size is
+            None if the transfer did not report any progress
         """
         # Convert enum to string if needed
         if isinstance(sequencing_type, SequencingType):
@@ -125,7 +146,7 @@ class BioinfManager:
         
         # Generate S3 key for the file
         file_name = os.path.basename(file_path)
-        s3_key = f"samples/{sample_id}/reads/{sequencing_type}/{file_name}"
+        s3_key = self.get_reads_key(sample_id, file_name, sequencing_type)
         
         # Prepare metadata
         file_metadata = metadata or {}
@@ -135,15 +156,19 @@ class BioinfManager:
             "file_type": file_type
         })
         
-        # Upload the file
+        # Upload the file, counting bytes as they are sent; the transfer
+        # may report chunks from several threads, and list.append is atomic
+        chunk_sizes = []
         success = self.aws.upload_file(
             file_path=file_path,
             bucket=self.bucket,
             object_name=s3_key,
-            metadata=file_metadata
+            metadata=file_metadata,
+            callback=chunk_sizes.append
         )
         
-        return success, s3_key
+        size = sum(chunk_sizes) if chunk_sizes else None
+        return success, s3_key, size
     
     def get_reads_url(self, sample_id: str, file_name: str, sequencing_type: Union[SequencingType, str] = SequencingType.ILLUMINA) -> Optional[str]:
         """Get a presigned URL for accessing sequencing reads.
@@ -161,7 +186,7 @@ class BioinfManager:
             sequencing_type = sequencing_type.value
             
         # Generate S3 key
-        s3_key = f"samples/{sample_id}/reads/{sequencing_type}/{file_name}"
+        s3_key = self.get_reads_key(sample_id, file_name, sequencing_type)
         
         # Generate URL
         return self.aws.get_presigned_url(self.bucket, s3_key)
@@ -233,6 +258,17 @@ class BioinfManager:
         """
         return self.aws.get_job_status(job_id)
     
+    def check_analysis_status_batch(self, job_ids: List[str]) -> Dict[str, str]:
+        """Check the statuses of several analysis jobs at once.
+        
+        Args:
+            job_ids: AWS Batch job IDs
+            
+        Returns:
+            Mapping of job ID to status for the jobs that were found
+        """
+        return self.aws.get_job_statuses(job_ids)
+    
     def get_analysis_results(self, sample_id: str, analysis_type: Union[AnalysisType, str]) -> List[Dict[str, Any]]:
         """Get the list of analysis result files.
         
@@ -0,0 +1,108 @@
+"""Concurrency utilities for state shared between threads."""
+
+import threading
+from typing import Any, Dict, Generic, Hashable, Iterator, List, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ShardedMap(Generic[K, V]):
+    """A dictionary split into shards, each guarded by its own lock.
+
+    Writers lock only the shard owning their key, so updates to unrelated
+    keys do not contend. Reads take no lock, since a single dict lookup is
+    atomic in CPython. Callers that need a read-modify-write on one key to
+    be atomic hold lock_for(key) around it.
+    """
+
+    def __init__(self, nshards: int = 16):
+        """Initialize an empty map.
+
+        Args:
+            nshards: Number of shards
+        """
+        if nshards < 1:
+            raise ValueError("nshards must be at least 1")
+        self._nshards = nshards
+        self._maps: List[Dict[K, V]] = [{} for _ in range(nshards)]
+        self._locks = [threading.RLock() for _ in range(nshards)]
+
+    def _shard(self, key: K) -> int:
+        return hash(key) % self._nshards
+
+    def lock_for(self, key: K) -> threading.RLock:
+        """Get the lock guarding the shard that owns a key.
+
+        Args:
+            key: The key
+
+        Returns:
+            The shard's (reentrant) lock
+        """
+        return self._locks[self._shard(key)]
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Get the value for a key without locking.
+
+        Args:
+            key: The key
+            default: Value returned if the key is absent
+
+        Returns:
+            The value, or default
+        """
+        return self._maps[self._shard(key)].get(key, default)
+
+    def set(self, key: K, value: V) -> None:
+        """Set the value for a key.
+
+        Args:
+            key: The key
+            value: The value
+        """
+        h = self._shard(key)
+        with self._locks[h]:
+            self._maps[h][key] = value
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        """Remove a key and return its value.
+
+        Args:
+            key: The key
+            default: Value returned if the key is absent
+
+        Returns:
+            The removed value, or default
+        """
+        h = self._shard(key)
+        with self._locks[h]:
+            return self._maps[h].pop(key, default)
+
+    def keys(self) -> List[K]:
+        """Get a snapshot of the keys in all shards.
+
+        Returns:
+            List of keys
+        """
+        return [key for shard in self._maps for key in list(shard)]
+
+    def __getitem__(self, key: K) -> V:
+        return self._maps[self._shard(key)][key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        h = self._shard(key)
+        with self._locks[h]:
+            del self._maps[h][key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._maps[hash(key) % self._nshards]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._maps)
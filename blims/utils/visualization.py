@@ -24,19 +24,18 @@ def create_sample_network(samples: List[Any]) -> nx.DiGraph:
     
     # Add all samples as nodes
     for sample in samples:
-        is_container = getattr(sample, 'is_container', False)
         G.add_node(
             str(sample.id),
             id=str(sample.id),
             label=sample.name,
             title=f"{sample.name} ({sample.sample_type})",
             type=sample.sample_type,
-            is_container=is_container,
+            is_container=sample.is_container,
         )
     
     # Add container edges
     for sample in samples:
-        if hasattr(sample, 'container_id') and sample.container_id:
+        if sample.container_id:
             container_id = str(sample.container_id)
             if G.has_node(container_id):
                 G.add_edge(
@@ -47,7 +46,7 @@ def create_sample_network(samples: List[Any]) -> nx.DiGraph:
     
     # Add parent-child edges
     for sample in samples:
-        if hasattr(sample, 'parent_ids') and sample.parent_ids:
+        if sample.parent_ids:
             for parent_id in sample.parent_ids:
                 parent_id_str = str(parent_id)
                 if G.has_node(parent_id_str):
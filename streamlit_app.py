@@ -513,7 +513,7 @@ if page == "Sample Management":
         non_container_samples = [s for s in samples if not s.is_container]
         
         if non_container_samples:
-            # Convert to DataFrame for display
+            # Build table rows for display
             samples_data = []
             for sample in non_container_samples:
                 container_name = ""
@@ -532,10 +532,9 @@ if page == "Sample Management":
                     "Actions": sample.id
                 })
             
-            df = pd.DataFrame(samples_data)
-            
-            # Display as table with action buttons
-            for i, row in df.iterrows():
+            # Display as table with action buttons, iterating the row dicts
+            # directly rather than building a Series per DataFrame row
+            for row in samples_data:
                 col1, col2, col3, col4, col5, col6, col7 = st.columns([1, 2, 1, 1, 1, 1, 1])
                 with col1:
                     st.write(row["ID"])
@@ -584,7 +583,7 @@ elif page == "Container Management":
         containers = sample_service.get_containers()
         
         if containers:
-            # Convert to DataFrame for display
+            # Build table rows for display
             containers_data = []
             for container in containers:
                 parent_name = ""
@@ -605,10 +604,9 @@ elif page == "Container Management":
                     "Actions": container.id
                 })
             
-            df = pd.DataFrame(containers_data)
-            
-            # Display as table with action buttons
-            for i, row in df.iterrows():
+            # Display as table with action buttons, iterating the row dicts
+            # directly rather than building a Series per DataFrame row
+            for row in containers_data:
                 col1, col2, col3, col4, col5, col6, col7 = st.columns([1, 2, 1, 1, 1, 1, 1])
                 with col1:
                     st.write(row["ID"])
@@ -18,6 +18,10 @@ test_service = SampleService(repository=test_repo)
 @pytest.fixture(autouse=True)
 def reset_test_repo():
     test_repo._samples = {}
+    test_repo._metadata_index = {}
+    test_repo._by_sample_id = {}
+    test_repo._lineage_cache.clear()
+    test_repo._missing_parent_ids.clear()
 
 # Override the service dependency
 def get_test_service_override():
@@ -79,6 +83,27 @@ def test_create_sample():
     assert test_repo.get(sample_id) is not None
 
 
+def test_create_sample_with_parent_ids():
+    """Test creating a sample with repeated and invalid parent IDs via API."""
+    parent = Sample(name="Parent", sample_type="Blood", created_by="API Tester")
+    test_repo.add(parent)
+    
+    sample_data = {
+        "name": "Child Sample",
+        "sample_type": "DNA",
+        "created_by": "API Tester",
+        "parent_ids": [str(parent.id), str(parent.id).upper()]
+    }
+    response = client.post("/api/v1/samples", json=sample_data)
+    assert response.status_code == 200
+    assert response.json()["parent_ids"] == [str(parent.id)]
+    
+    sample_data["parent_ids"] = [str(parent.id), "not-a-uuid"]
+    response = client.post("/api/v1/samples", json=sample_data)
+    assert response.status_code == 400
+    assert "not-a-uuid" in response.json()["detail"]
+
+
 def test_get_sample():
     """Test retrieving a sample via API."""
     # First create a sample
@@ -230,6 +255,8 @@ def test_search_samples():
     
     # Clear repository first to have predictable results
     test_repo._samples = {}
+    test_repo._metadata_index = {}
+    test_repo._by_sample_id = {}
     
     # Create test samples
     response1 = client.post("/api/v1/samples", json=sample_data_1)
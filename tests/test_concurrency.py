@@ -0,0 +1,57 @@
+"""Tests for the concurrency utilities."""
+import threading
+
+import pytest
+
+from blims.utils.concurrency import ShardedMap
+
+
+class TestShardedMap:
+    """Test cases for ShardedMap."""
+    
+    def test_mapping_operations(self):
+        """Test get, set, pop and membership across shards."""
+        m = ShardedMap(nshards=4)
+        for i in range(20):
+            m[f"job-{i}"] = i
+        
+        assert len(m) == 20
+        assert "job-3" in m
+        assert m["job-3"] == 3
+        assert m.get("missing") is None
+        assert sorted(m) == sorted(f"job-{i}" for i in range(20))
+        
+        assert m.pop("job-3") == 3
+        assert m.pop("job-3", "gone") == "gone"
+        del m["job-4"]
+        assert "job-4" not in m
+        assert len(m) == 18
+        
+        with pytest.raises(KeyError):
+            m["job-3"]
+    
+    def test_invalid_shard_count(self):
+        """Test that at least one shard is required."""
+        with pytest.raises(ValueError):
+            ShardedMap(nshards=0)
+    
+    def test_concurrent_updates(self):
+        """Test read-modify-write under lock_for from several threads."""
+        m = ShardedMap()
+        keys = [f"job-{i}" for i in range(8)]
+        for key in keys:
+            m[key] = 0
+        
+        def worker():
+            for _ in range(500):
+                for key in keys:
+                    with m.lock_for(key):
+                        m[key] = m[key] + 1
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert all(m[key] == 2000 for key in keys)
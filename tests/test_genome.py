@@ -1,9 +1,14 @@
 """Test cases for genome models, repositories, and services."""
 
+import os
+import random
+import tempfile
 import unittest
 import uuid
 from datetime import datetime
 
+import orjson
+
 from blims.models.genome import Genome
 from blims.models.feature import Feature, FeatureType
 from blims.repositories.genome_repository import GenomeRepository
@@ -66,7 +71,27 @@ class TestGenomeModel(unittest.TestCase):
         another_feature_id = uuid.uuid4()
         genome.add_feature(another_feature_id)
         self.assertEqual(len(genome.feature_ids), 2)
-        
+
+        # Add several features at once, skipping ones already present
+        new_ids = [uuid.uuid4(), uuid.uuid4()]
+        genome.add_features([str(feature_id), new_ids[0], new_ids[1], new_ids[0]])
+        self.assertEqual(genome.feature_ids, [feature_id, another_feature_id] + new_ids)
+        self.assertEqual(genome.to_dict()["feature_ids"], [str(fid) for fid in genome.feature_ids])
+
+        # Features dropped by replacing feature_ids can be added again
+        genome.feature_ids = [another_feature_id, new_ids[0], new_ids[1], uuid.uuid4()]
+        genome.add_feature(feature_id)
+        self.assertEqual(genome.feature_ids[-1], feature_id)
+        genome.feature_ids = [another_feature_id]
+        genome.add_features([feature_id])
+        self.assertEqual(genome.feature_ids, [another_feature_id, feature_id])
+
+        # So can features removed in place, even if the length is unchanged
+        genome.feature_ids.remove(feature_id)
+        genome.feature_ids.append(new_ids[0])
+        genome.add_feature(feature_id)
+        self.assertEqual(genome.feature_ids, [another_feature_id, new_ids[0], feature_id])
+
     def test_add_index(self):
         """Test adding an index to a genome."""
         genome = Genome(
@@ -118,6 +143,32 @@ class TestGenomeModel(unittest.TestCase):
         self.assertEqual(genome_dict["index_paths"], {"bwa": "/path/to/index"})
         self.assertEqual(genome_dict["feature_ids"], [str(feature_id)])
 
+        # Replacing feature_ids with a list of the same length is serialized
+        other_id = uuid.uuid4()
+        genome.feature_ids = [other_id]
+        self.assertEqual(genome.to_dict()["feature_ids"], [str(other_id)])
+
+        # So is an in-place change that keeps the length
+        genome.feature_ids[0] = feature_id
+        self.assertEqual(genome.to_dict()["feature_ids"], [str(feature_id)])
+        third_id = uuid.uuid4()
+        genome.add_feature(third_id)
+        genome.feature_ids.reverse()
+        self.assertEqual(genome.to_dict()["feature_ids"], [str(third_id), str(feature_id)])
+
+    def test_to_orjson(self):
+        """Test that orjson output of to_orjson matches to_dict."""
+        genome = Genome(
+            name="Human Genome",
+            species="Homo sapiens",
+            assembly_version="GRCh38",
+            created_by="test_user",
+            created_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+        )
+        genome.add_feature(uuid.uuid4())
+
+        self.assertEqual(orjson.loads(orjson.dumps(genome.to_orjson())), genome.to_dict())
+
 
 class TestFeatureModel(unittest.TestCase):
     """Test cases for the Feature model."""
@@ -151,7 +202,40 @@ class TestFeatureModel(unittest.TestCase):
         self.assertIsInstance(feature.id, uuid.UUID)
         self.assertIsInstance(feature.created_at, datetime)
         self.assertEqual(feature.child_ids, [])
-        
+
+        # Chromosome names are interned and shared between features
+        other = Feature(
+            name="TP53",
+            feature_type=FeatureType.GENE,
+            chromosome="".join(["chr", "17"]),
+            start=7661779,
+            end=7687538,
+            genome_id=genome_id,
+            created_by="test_user",
+        )
+        self.assertIs(other.chromosome, feature.chromosome)
+        self.assertIs(other.get_position()[0], feature.chromosome)
+
+    def test_shared_created_at(self):
+        """Test stamping several features with one creation time."""
+        now = datetime(2024, 1, 2, 3, 4, 5)
+        features = [
+            Feature(
+                name=f"Exon {i}",
+                feature_type=FeatureType.EXON,
+                chromosome="chr17",
+                start=100 * i + 1,
+                end=100 * i + 50,
+                genome_id=uuid.uuid4(),
+                created_by="test_user",
+                created_at=now
+            )
+            for i in range(3)
+        ]
+
+        self.assertTrue(all(f.created_at is now for f in features))
+        self.assertEqual(features[0].to_dict()["created_at"], "2024-01-02T03:04:05")
+
     def test_get_position(self):
         """Test getting a feature's position."""
         feature = Feature(
@@ -170,6 +254,7 @@ class TestFeatureModel(unittest.TestCase):
         
         # Check position
         self.assertEqual(position, ("chr17", 43044295, 43125483, "+"))
+        self.assertEqual(feature.position_key, ("chr17", 43044295, 43125483))
         
     def test_get_length(self):
         """Test getting a feature's length."""
@@ -217,7 +302,31 @@ class TestFeatureModel(unittest.TestCase):
         another_child_id = uuid.uuid4()
         feature.add_child(another_child_id)
         self.assertEqual(len(feature.child_ids), 2)
-        
+
+        # String IDs and children appended directly are not duplicated
+        feature.add_child(str(another_child_id))
+        appended_id = uuid.uuid4()
+        feature.child_ids.append(appended_id)
+        feature.add_child(appended_id)
+        self.assertEqual(feature.child_ids, [child_id, another_child_id, appended_id])
+
+        # Add several children at once
+        new_ids = [uuid.uuid4(), uuid.uuid4()]
+        feature.add_children([child_id, str(new_ids[0]), new_ids[1], new_ids[0]])
+        self.assertEqual(feature.child_ids, [child_id, another_child_id, appended_id] + new_ids)
+
+        # Children dropped by replacing child_ids can be added again
+        replacement_ids = [another_child_id] + [uuid.uuid4() for _ in range(4)]
+        feature.child_ids = list(replacement_ids)
+        feature.add_child(child_id)
+        self.assertEqual(feature.child_ids, replacement_ids + [child_id])
+
+        # So can children removed in place, even if the length is unchanged
+        feature.child_ids.remove(child_id)
+        feature.child_ids.append(new_ids[0])
+        feature.add_children([child_id])
+        self.assertEqual(feature.child_ids, replacement_ids + [new_ids[0], child_id])
+
     def test_to_dict(self):
         """Test converting a feature to a dictionary."""
         genome_id = uuid.uuid4()
@@ -255,6 +364,50 @@ class TestFeatureModel(unittest.TestCase):
         self.assertIn("id", feature_dict)
         self.assertIn("created_at", feature_dict)
 
+        # Later children appear in new dictionaries without changing old ones
+        another_child_id = uuid.uuid4()
+        feature.add_child(another_child_id)
+        self.assertEqual(feature.to_dict()["child_ids"], [str(child_id), str(another_child_id)])
+        self.assertEqual(feature_dict["child_ids"], [str(child_id)])
+
+        # Children appended directly are still serialized
+        feature.child_ids.append(uuid.uuid4())
+        self.assertEqual(len(feature.to_dict()["child_ids"]), 3)
+
+        # Replacing child_ids with a list of the same length is serialized
+        replacement_ids = [uuid.uuid4() for _ in range(3)]
+        feature.child_ids = replacement_ids
+        self.assertEqual(feature.to_dict()["child_ids"], [str(cid) for cid in replacement_ids])
+
+        # So is an in-place change that keeps the length
+        feature.child_ids[0] = child_id
+        feature.add_child(another_child_id)
+        self.assertEqual(
+            feature.to_dict()["child_ids"],
+            [str(child_id)] + [str(cid) for cid in replacement_ids[1:]] + [str(another_child_id)],
+        )
+
+        # Metadata written through the attribute is kept
+        self.assertEqual(feature_dict["metadata"], {})
+        feature.metadata["source"] = "RefSeq"
+        self.assertEqual(feature.to_dict()["metadata"], {"source": "RefSeq"})
+
+    def test_to_orjson(self):
+        """Test that orjson output of to_orjson matches to_dict."""
+        feature = Feature(
+            name="BRCA1 Exon 1",
+            feature_type=FeatureType.EXON,
+            chromosome="chr17",
+            start=43044295,
+            end=43045679,
+            genome_id=uuid.uuid4(),
+            created_by="test_user",
+            parent_id=uuid.uuid4(),
+        )
+        feature.add_child(uuid.uuid4())
+
+        self.assertEqual(orjson.loads(orjson.dumps(feature.to_orjson())), feature.to_dict())
+
 
 class TestGenomeRepository(unittest.TestCase):
     """Test cases for the GenomeRepository."""
@@ -679,6 +832,10 @@ class TestFeatureRepository(unittest.TestCase):
         self.assertEqual(len(chr13_features), 1)
         self.assertEqual(len(chr1_features), 0)
         
+        # Chromosome names built at runtime find the same features
+        built = "".join(["chr", "17"])
+        self.assertEqual(self.repo.get_features_by_chromosome(built, self.genome_id), chr17_features)
+        
     def test_get_features_in_region(self):
         """Test retrieving features in a genomic region."""
         # Create features
@@ -715,7 +872,163 @@ class TestFeatureRepository(unittest.TestCase):
         self.assertEqual(len(tp53_region), 1)
         self.assertEqual(tp53_region[0].name, "TP53")
         self.assertEqual(len(no_feature_region), 0)
-        
+
+    def test_get_features_in_region_index(self):
+        """Test region queries stay correct as features change."""
+        gene = Feature(
+            name="Gene", feature_type=FeatureType.GENE, chromosome="chr1",
+            start=1000, end=9000, genome_id=self.genome_id, created_by="test_user"
+        )
+        exon = Feature(
+            name="Exon", feature_type=FeatureType.EXON, chromosome="chr1",
+            start=5000, end=5100, genome_id=self.genome_id, created_by="test_user"
+        )
+        snp = Feature(
+            name="SNP", feature_type=FeatureType.SNP, chromosome="chr1",
+            start=200, end=200, genome_id=self.genome_id, created_by="test_user"
+        )
+        for feature in (exon, gene, snp):
+            self.repo.create_feature(feature)
+
+        # A long feature starting well before the region still overlaps it
+        region = self.repo.get_features_in_region("chr1", 5050, 5060, self.genome_id)
+        self.assertEqual([f.name for f in region], ["Gene", "Exon"])
+
+        # Results are ordered by start position
+        region = self.repo.get_features_in_region("chr1", 1, 10000, self.genome_id)
+        self.assertEqual([f.name for f in region], ["SNP", "Gene", "Exon"])
+
+        self.repo.update_feature(exon)
+        self.repo.delete_feature(gene.id)
+        region = self.repo.get_features_in_region("chr1", 1, 10000, self.genome_id)
+        self.assertEqual([f.name for f in region], ["SNP", "Exon"])
+        self.assertEqual(self.repo.get_features_in_region("chr2", 1, 10000, self.genome_id), [])
+
+    def test_get_frozen_features_in_region(self):
+        """Test region queries returning frozen feature snapshots."""
+        gene = Feature(
+            name="Gene", feature_type=FeatureType.GENE, chromosome="chr1",
+            start=1000, end=9000, genome_id=self.genome_id, created_by="test_user",
+            strand="+"
+        )
+        exon = Feature(
+            name="Exon", feature_type=FeatureType.EXON, chromosome="chr1",
+            start=5000, end=5100, genome_id=self.genome_id, created_by="test_user",
+            parent_id=gene.id
+        )
+        self.repo.create_feature(gene)
+        self.repo.create_feature(exon)
+
+        region = self.repo.get_frozen_features_in_region("chr1", 5050, 5060, self.genome_id)
+        self.assertEqual(region, [gene.freeze(), exon.freeze()])
+        self.assertEqual(region[0].get_position(), gene.get_position())
+        self.assertEqual(region[1].get_length(), exon.get_length())
+        self.assertEqual(region[1].parent_id, gene.id)
+
+        # Snapshots follow changes to the repository
+        self.repo.delete_feature(gene.id)
+        region = self.repo.get_frozen_features_in_region("chr1", 5050, 5060, self.genome_id)
+        self.assertEqual([f.name for f in region], ["Exon"])
+        self.assertEqual(self.repo.get_frozen_features_in_region("chr2", 1, 10, self.genome_id), [])
+
+    def test_get_features_in_region_with_long_features(self):
+        """Test region queries on a chromosome with many long features."""
+        rng = random.Random(7)
+        features = []
+        for i in range(500):
+            start = rng.randint(1, 100000)
+            length = rng.choice([10, 100, 1000, 50000])
+            features.append(Feature(
+                name=f"F{i}", feature_type=FeatureType.EXON, chromosome="chr1",
+                start=start, end=start + length - 1, genome_id=self.genome_id,
+                created_by="test_user"
+            ))
+        for feature in features:
+            self.repo.create_feature(feature)
+
+        by_start = sorted(features, key=lambda f: f.start)
+        for _ in range(50):
+            start = rng.randint(1, 150000)
+            end = start + rng.randint(0, 2000)
+            expected = [f for f in by_start if f.start <= end and f.end >= start]
+            region = self.repo.get_features_in_region("chr1", start, end, self.genome_id)
+            self.assertEqual(sorted(f.name for f in region), sorted(f.name for f in expected))
+            self.assertEqual([f.start for f in region], [f.start for f in expected])
+
+    def test_lookup_indexes_follow_updates(self):
+        """Test genome, type and parent lookups after updates and deletes."""
+        other_genome_id = uuid.uuid4()
+        gene = Feature(
+            name="Gene", feature_type=FeatureType.GENE, chromosome="chr1",
+            start=1000, end=9000, genome_id=self.genome_id, created_by="test_user"
+        )
+        exon = Feature(
+            name="Exon", feature_type=FeatureType.EXON, chromosome="chr1",
+            start=5000, end=5100, genome_id=self.genome_id, created_by="test_user",
+            parent_id=gene.id
+        )
+        other = Feature(
+            name="Other", feature_type=FeatureType.EXON, chromosome="chr1",
+            start=10, end=20, genome_id=other_genome_id, created_by="test_user"
+        )
+        for feature in (gene, exon, other):
+            self.repo.create_feature(feature)
+
+        self.assertEqual(self.repo.get_features_by_type(FeatureType.EXON, self.genome_id), [exon])
+        self.assertEqual(self.repo.get_features_by_type("EXON"), [exon, other])
+        self.assertEqual(self.repo.get_features_by_parent(gene.id), [exon])
+
+        # Changing indexed fields in place and saving moves the feature
+        exon.feature_type = FeatureType.CDS
+        exon.parent_id = None
+        self.repo.update_feature(exon)
+        self.assertEqual(self.repo.get_features_by_type(FeatureType.EXON, self.genome_id), [])
+        self.assertEqual(self.repo.get_features_by_type(FeatureType.CDS), [exon])
+        self.assertEqual(self.repo.get_features_by_parent(gene.id), [])
+
+        self.repo.delete_feature(other.id)
+        self.assertEqual(self.repo.get_features_by_genome(other_genome_id), [])
+        self.assertEqual(self.repo.get_features_by_genome(self.genome_id), [gene, exon])
+
+    def test_region_index_rebuilt_after_features_replaced(self):
+        """Test the region index is rebuilt when the features dict is replaced."""
+        features = [
+            Feature(
+                name=f"F{start}", feature_type=FeatureType.EXON, chromosome="chr1",
+                start=start, end=start + 50, genome_id=self.genome_id,
+                created_by="test_user"
+            )
+            for start in (300, 100, 200)
+        ]
+        self.repo.features = {str(f.id): f for f in features}
+
+        region = self.repo.get_features_in_region("chr1", 1, 1000, self.genome_id)
+        self.assertEqual([f.name for f in region], ["F100", "F200", "F300"])
+
+    def test_delete_features_by_genome(self):
+        """Test deleting a genome's features leaves other genomes intact."""
+        other_genome_id = uuid.uuid4()
+        gene = self.repo.create_feature(Feature(
+            "G1", FeatureType.GENE, "chr1", 100, 500, self.genome_id, "test_user"
+        ))
+        self.repo.create_feature(Feature(
+            "E1", FeatureType.EXON, "chr1", 100, 200, self.genome_id, "test_user",
+            parent_id=gene.id
+        ))
+        kept = self.repo.create_feature(Feature(
+            "G2", FeatureType.GENE, "chr1", 100, 500, other_genome_id, "test_user"
+        ))
+        
+        self.assertEqual(self.repo.delete_features_by_genome(str(self.genome_id)), 2)
+        self.assertEqual(self.repo.delete_features_by_genome(self.genome_id), 0)
+        
+        self.assertEqual(self.repo.get_all_features(), [kept])
+        self.assertEqual(self.repo.get_features_by_genome(self.genome_id), [])
+        self.assertEqual(self.repo.get_features_by_type(FeatureType.GENE), [kept])
+        self.assertEqual(self.repo.get_features_by_parent(gene.id), [])
+        self.assertEqual(self.repo.get_features_in_region("chr1", 1, 1000, self.genome_id), [])
+        self.assertEqual(self.repo.get_features_in_region("chr1", 1, 1000, other_genome_id), [kept])
+
     def test_get_features_by_parent(self):
         """Test retrieving child features of a parent feature."""
         # Create parent feature
@@ -1076,6 +1389,103 @@ class TestGenomeService(unittest.TestCase):
         # Check that features were deleted
         self.assertIsNone(self.service.get_feature(feature1.id))
         self.assertIsNone(self.service.get_feature(feature2.id))
+    
+    def test_create_features(self):
+        """Test creating a batch of features with parents in and out of the batch."""
+        genome = self.service.create_genome({
+            "name": "Human Genome",
+            "species": "Homo sapiens",
+            "assembly_version": "GRCh38",
+            "created_by": "test_user"
+        })
+        gene = self.service.create_feature({
+            "name": "BRCA1",
+            "feature_type": "GENE",
+            "chromosome": "chr17",
+            "start": 100,
+            "end": 900,
+            "genome_id": str(genome.id),
+            "created_by": "test_user"
+        })
+        
+        exon = Feature("exon1", FeatureType.EXON, "chr17", 100, 200, genome.id,
+                       "test_user", parent_id=gene.id)
+        other = Feature("TP53", FeatureType.GENE, "chr17", 1000, 2000, genome.id, "test_user")
+        cds = Feature("cds1", FeatureType.CDS, "chr17", 1100, 1200, genome.id,
+                      "test_user", parent_id=other.id)
+        created = self.service.create_features([exon, cds, other])
+        
+        self.assertEqual(created, [exon, cds, other])
+        self.assertEqual(self.feature_repo.get_features_by_parent(gene.id), [exon])
+        self.assertEqual(other.child_ids, [cds.id])
+        self.assertEqual(gene.child_ids, [exon.id])
+        self.assertEqual(genome.feature_ids, [gene.id, exon.id, cds.id, other.id])
+        
+        # A bad parent rejects the whole batch
+        orphan = Feature("orphan", FeatureType.EXON, "chr17", 1, 2, genome.id,
+                         "test_user", parent_id=uuid.uuid4())
+        fine = Feature("fine", FeatureType.GENE, "chr17", 1, 2, genome.id, "test_user")
+        with self.assertRaises(ValueError):
+            self.service.create_features([fine, orphan])
+        self.assertIsNone(self.service.get_feature(fine.id))
+        self.assertNotIn(fine.id, genome.feature_ids)
+    
+    def test_get_deep_feature_hierarchy(self):
+        """Test hierarchies deeper than the recursion limit."""
+        genome = self.service.create_genome({
+            "name": "Human Genome",
+            "species": "Homo sapiens",
+            "assembly_version": "GRCh38",
+            "created_by": "test_user"
+        })
+        chain = [Feature("f0", FeatureType.CUSTOM, "chr1", 1, 10, genome.id, "test_user")]
+        for i in range(1, 2000):
+            chain.append(Feature(f"f{i}", FeatureType.CUSTOM, "chr1", 1, 10, genome.id,
+                                 "test_user", parent_id=chain[-1].id))
+        self.service.create_features(chain)
+        
+        node = self.service.get_feature_hierarchy(chain[0].id)
+        depth = 0
+        while node['children']:
+            node = node['children'][0]
+            depth += 1
+        self.assertEqual(depth, 1999)
+        self.assertEqual(node['name'], "f1999")
+    
+    def test_import_features_from_gff(self):
+        """Test importing GFF3 records, resolving parents within the file."""
+        genome = self.service.create_genome({
+            "name": "Human Genome",
+            "species": "Homo sapiens",
+            "assembly_version": "GRCh38",
+            "created_by": "test_user"
+        })
+        gff = (
+            "##gff-version 3\n"
+            "chr17\tRefSeq\texon\t100\t200\t.\t+\t.\tID=exon1;Parent=gene1\n"
+            "chr17\tRefSeq\tgene\t100\t900\t.\t+\t.\tID=gene1;Name=BRCA1\n"
+            "chr17\tRefSeq\tmRNA\t100\t900\t.\t.\t.\tID=rna1;Parent=gene1\n"
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".gff3", delete=False) as f:
+            f.write(gff)
+        self.addCleanup(os.remove, f.name)
+        
+        self.assertEqual(self.service.import_features_from_gff(genome.id, f.name, "test_user"), 3)
+        
+        features = self.service.get_genome_features(genome.id)
+        exon, gene, rna = features
+        self.assertEqual(gene.name, "BRCA1")
+        self.assertEqual(exon.feature_type, FeatureType.EXON)
+        self.assertEqual(rna.feature_type, FeatureType.CUSTOM)
+        self.assertEqual(rna.metadata, {"gff_type": "mRNA"})
+        self.assertIsNone(rna.strand)
+        self.assertEqual(gene.child_ids, [exon.id, rna.id])
+        self.assertEqual(len(genome.feature_ids), 3)
+        
+        with open(f.name, "a") as out:
+            out.write("chr17\tRefSeq\tgene\t1\t2\n")
+        with self.assertRaises(ValueError):
+            self.service.import_features_from_gff(genome.id, f.name, "test_user")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,193 @@
+"""Test cases for the job model and repository."""
+
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from blims.models.job import Job, JobStatus, JobType
+from blims.repositories.job_repository import JobRepository
+
+
+class TestJobRepository(unittest.TestCase):
+    """Test cases for the JobRepository."""
+
+    def setUp(self):
+        """Set up test cases."""
+        self.repo = JobRepository()
+        self.sample_id = uuid.uuid4()
+
+    def _job(self, name, job_type=JobType.FASTQC, created_by="test_user"):
+        return Job(
+            name=name,
+            job_type=job_type,
+            sample_id=self.sample_id,
+            created_by=created_by,
+        )
+
+    def test_get_jobs_by_type_and_user(self):
+        """Test type and user lookups as jobs are added, updated and deleted."""
+        qc = self.repo.create_job(self._job("QC"))
+        align = self.repo.create_job(self._job("Align", JobType.BWA_MEM, "other_user"))
+
+        self.assertEqual(self.repo.get_jobs_by_type(JobType.FASTQC), [qc])
+        self.assertEqual(self.repo.get_jobs_by_type("BWA_MEM"), [align])
+        self.assertEqual(self.repo.get_jobs_for_user("other_user"), [align])
+        self.assertEqual(self.repo.get_jobs_for_user("nobody"), [])
+
+        # Changing indexed fields in place and saving moves the job
+        qc.job_type = JobType.BWA_MEM
+        self.repo.update_job(qc)
+        self.assertEqual(self.repo.get_jobs_by_type(JobType.FASTQC), [])
+        self.assertEqual(self.repo.get_jobs_by_type(JobType.BWA_MEM), [align, qc])
+
+        self.repo.delete_job(align.id)
+        self.assertEqual(self.repo.get_jobs_for_user("other_user"), [])
+
+    def test_update_job_keeps_order(self):
+        """Test saving a job keeps its place in lookups whose keys are unchanged."""
+        jobs = [self.repo.create_job(self._job(f"QC {i}")) for i in range(3)]
+
+        jobs[0].description = "rerun"
+        self.repo.update_job(jobs[0])
+        self.assertEqual(self.repo.get_jobs_by_type(JobType.FASTQC), jobs)
+        self.assertEqual(self.repo.get_jobs_for_user("test_user"), jobs)
+        self.assertEqual(self.repo.get_jobs_created_after(datetime.min), jobs)
+
+        # Only the changed lookup moves the job; a new creation time refiles it
+        jobs[0].created_by = "other_user"
+        jobs[0].created_at = jobs[2].created_at + timedelta(seconds=1)
+        self.repo.update_job(jobs[0])
+        self.assertEqual(self.repo.get_jobs_by_type(JobType.FASTQC), jobs)
+        self.assertEqual(self.repo.get_jobs_for_user("test_user"), jobs[1:])
+        self.assertEqual(self.repo.get_jobs_created_after(datetime.min), jobs[1:] + jobs[:1])
+
+    def test_get_jobs_by_status(self):
+        """Test status lookups follow status updates."""
+        qc = self.repo.create_job(self._job("QC"))
+        align = self.repo.create_job(self._job("Align", JobType.BWA_MEM))
+
+        self.assertEqual(self.repo.get_jobs_by_status(JobStatus.PENDING), [qc, align])
+
+        self.repo.update_job_status(qc.id, JobStatus.RUNNING)
+        self.assertEqual(self.repo.get_jobs_by_status(JobStatus.PENDING), [align])
+        self.assertEqual(self.repo.get_jobs_by_status("RUNNING"), [qc])
+
+        # Status changed on the job, then saved with update_job
+        align.update_status(JobStatus.FAILED)
+        self.repo.update_job(align)
+        self.assertEqual(self.repo.get_jobs_by_status(JobStatus.PENDING), [])
+        self.assertEqual(self.repo.get_jobs_by_status(JobStatus.FAILED), [align])
+
+        # Status updates leave the other indexes untouched
+        self.assertEqual(self.repo.get_jobs_for_user("test_user"), [qc, align])
+
+    def test_get_jobs_by_sample(self):
+        """Test sample lookups accept UUID or string IDs and follow updates."""
+        qc = self.repo.create_job(self._job("QC"))
+        other = self._job("Other")
+        other.sample_id = str(uuid.uuid4())
+        self.repo.create_job(other)
+
+        self.assertEqual(self.repo.get_jobs_by_sample(self.sample_id), [qc])
+        self.assertEqual(self.repo.get_jobs_by_sample(str(self.sample_id)), [qc])
+
+        other.sample_id = self.sample_id
+        self.repo.update_job(other)
+        self.assertEqual(self.repo.get_jobs_by_sample(self.sample_id), [qc, other])
+
+    def test_get_jobs_created_after(self):
+        """Test creation-time queries return newer jobs, oldest first."""
+        base = datetime(2024, 1, 1)
+        jobs = []
+        for hours in (3, 1, 2, 2):
+            job = Job(
+                name=f"Job {hours}",
+                job_type=JobType.FASTQC,
+                sample_id=self.sample_id,
+                created_by="test_user",
+                created_at=base + timedelta(hours=hours),
+            )
+            jobs.append(self.repo.create_job(job))
+
+        later = self.repo.get_jobs_created_after(base + timedelta(hours=1))
+        self.assertEqual([j.name for j in later], ["Job 2", "Job 2", "Job 3"])
+        self.assertEqual(self.repo.get_jobs_created_after(base + timedelta(hours=3)), [])
+
+        self.repo.delete_job(jobs[3].id)
+        later = self.repo.get_jobs_created_after(base)
+        self.assertEqual(later, [jobs[1], jobs[2], jobs[0]])
+
+    def test_naive_and_aware_created_at(self):
+        """Test jobs with naive and timezone-aware creation times can be mixed."""
+        now = datetime.now(timezone.utc)
+        naive = self._job("Naive")
+        naive.created_at = (now - timedelta(hours=1)).astimezone().replace(tzinfo=None)
+        aware = self._job("Aware")
+        aware.created_at = now
+        self.repo.create_job(naive)
+        self.repo.create_job(aware)
+
+        self.assertEqual(self.repo.get_jobs_created_after(datetime.min), [naive, aware])
+        self.assertEqual(self.repo.get_jobs_created_after(now - timedelta(minutes=30)), [aware])
+
+        self.assertTrue(self.repo.delete_job(naive.id))
+        self.assertEqual(self.repo.get_jobs_created_after(datetime.min), [aware])
+
+        # Rebuilding the indexes sorts both kinds too
+        self.repo.create_job(naive)
+        self.repo.jobs = dict(self.repo.jobs)
+        self.assertEqual(self.repo.get_jobs_created_after(datetime.min), [naive, aware])
+
+    def test_from_dict_keeps_created_at(self):
+        """Test a job loaded from a dict keeps its stored creation time."""
+        job = self._job("QC")
+        job.created_at = datetime(2024, 1, 1, 12, 30)
+        restored = Job.from_dict(job.to_dict())
+        self.assertEqual(restored.created_at, job.created_at)
+        self.assertEqual(restored.id, job.id)
+
+    def test_times_keep_timezone(self):
+        """Test aware start and end times are read back in their timezone."""
+        job = self._job("QC")
+        job.start_time = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        job.end_time = datetime(2024, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=5)))
+        self.assertEqual(job.start_time.tzinfo, timezone.utc)
+        self.assertEqual(job.start_time.hour, 12)
+        self.assertEqual(job.to_dict()["start_time"], "2024-01-01T12:30:00+00:00")
+        self.assertEqual(job.to_dict()["end_time"], "2024-01-01T14:00:00+05:00")
+
+        restored = Job.from_dict(job.to_dict())
+        self.assertEqual(restored.start_time.utcoffset(), timedelta(0))
+        self.assertEqual(restored.end_time, job.end_time)
+
+        # Naive times stay naive
+        job.start_time = datetime(2024, 1, 1, 12, 30)
+        self.assertEqual(job.start_time, datetime(2024, 1, 1, 12, 30))
+
+    def test_job_id_lists_replaced(self):
+        """Test jobs dropped by replacing a dependency list can be added again."""
+        job = self._job("QC")
+        first_id, second_id = uuid.uuid4(), uuid.uuid4()
+        job.add_parent_job(first_id)
+        job.parent_job_ids = [second_id]
+        job.add_parent_job(first_id)
+        self.assertEqual(job.parent_job_ids, [second_id, first_id])
+
+        job.add_child_job(first_id)
+        job.child_job_ids = [second_id]
+        job.add_child_job(first_id)
+        self.assertEqual(job.child_job_ids, [second_id, first_id])
+
+    def test_indexes_rebuilt_after_jobs_replaced(self):
+        """Test lookups are rebuilt when the jobs dict is replaced."""
+        self.repo.create_job(self._job("QC"))
+        job = self._job("Other", JobType.CUSTOM)
+        self.repo.jobs = {str(job.id): job}
+
+        self.assertEqual(self.repo.get_jobs_by_type(JobType.FASTQC), [])
+        self.assertEqual(self.repo.get_jobs_by_type(JobType.CUSTOM), [job])
+        self.assertEqual(self.repo.get_jobs_created_after(datetime.min), [job])
+
+
+if __name__ == "__main__":
+    unittest.main()
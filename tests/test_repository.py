@@ -110,4 +110,81 @@ class TestSampleRepository:
         
         # The SampleRepository doesn't have ancestry/descendant methods,
         # but we can test that the parent-child relationships are maintained
+    
+    def test_update_samples(self):
+        """Test updating several samples as one batch."""
+        self.sample1.name = "Sample 1 (updated)"
+        self.sample2.name = "Sample 2 (updated)"
+        self.repo.update_samples([self.sample1, self.sample2])
+        
+        assert self.repo.get_sample(self.sample1.id).to_dict()["name"] == "Sample 1 (updated)"
+        assert self.repo.get_sample(self.sample2.id).name == "Sample 2 (updated)"
+        
+        # A missing sample rejects the whole batch
+        missing = Sample(
+            name="Missing Sample",
+            sample_type="Test",
+            created_by="Test User",
+            id=UUID("00000000-0000-0000-0000-000000000999")
+        )
+        replacement = Sample(
+            name="Replacement",
+            sample_type="Test",
+            created_by="Test User",
+            id=self.sample1.id
+        )
+        with pytest.raises(ValueError):
+            self.repo.update_samples([replacement, missing])
+        assert self.repo.get_sample(self.sample1.id) is self.sample1
+
+    def test_type_container_and_container_lookups(self):
+        """Test indexed lookups follow creates, updates and deletes."""
+        box = Sample(
+            name="Box",
+            sample_type="Box",
+            created_by="Test User",
+            id=UUID("00000000-0000-0000-0000-000000000010"),
+            is_container=True
+        )
+        self.repo.create_sample(box)
+        
+        assert self.repo.get_samples_by_type("Blood") == [self.sample1]
+        assert self.repo.get_containers() == [box]
+        assert self.repo.get_samples_by_container(box.id) == []
+        
+        self.sample1.container_id = box.id
+        self.sample2.container_id = box.id
+        self.repo.update_samples([self.sample2, self.sample1])
+        assert self.repo.get_samples_by_container(str(box.id)) == [self.sample2, self.sample1]
+        
+        self.sample1.sample_type = "Plasma"
+        self.repo.update_sample(self.sample1)
+        assert self.repo.get_samples_by_type("Blood") == []
+        assert self.repo.get_samples_by_type("Plasma") == [self.sample1]
+        
+        self.repo.delete_sample(box.id)
+        assert self.repo.get_containers() == []
+        self.repo.delete_sample(self.sample2.id)
+        assert self.repo.get_samples_by_container(box.id) == [self.sample1]
+
+    def test_get_sample_by_sample_id(self):
+        """Test the sample_id mapping follows updates and replaced samples."""
+        assert self.repo.get_sample_by_sample_id(self.sample1.sample_id) is self.sample1
+        
+        old_sample_id = self.sample1.sample_id
+        self.sample1.sample_id = "s-renamed"
+        self.repo.update_sample(self.sample1)
+        assert self.repo.get_sample_by_sample_id(old_sample_id) is None
+        assert self.repo.get_sample_by_sample_id("s-renamed") is self.sample1
+        
+        # Replacing samples rebuilds the mapping from the stored samples
+        self.repo.samples = {self.sample2._id_str: self.sample2}
+        assert self.repo.get_sample_by_sample_id("s-renamed") is None
+        assert self.repo.get_sample_by_sample_id(self.sample2.sample_id) is self.sample2
 
+    def test_iter_samples(self):
+        """Test the iterator variants yield what the list getters return."""
+        assert list(self.repo.iter_samples()) == self.repo.get_all_samples()
+        assert list(self.repo.iter_samples_by_type("DNA")) == [self.sample2]
+        assert list(self.repo.iter_samples_by_type("RNA")) == []
+        assert list(self.repo.iter_containers()) == []
@@ -1,8 +1,16 @@
 """Tests for the Sample model."""
+import threading
+
+import orjson
 import pytest
 from uuid import UUID
 
-from blims.models.sample import Sample
+from blims.models.sample import (
+    Sample,
+    extract_sample_number,
+    get_next_sample_id,
+    reset_sample_counter,
+)
 
 
 class TestSample:
@@ -20,6 +28,10 @@ class TestSample:
         assert sample.parent_ids == []
         assert sample.file_paths == []
         assert sample.child_ids == []
+        
+        # Sample types are interned and shared between samples
+        other = Sample(name="Other", sample_type="".join(["Blo", "od"]), created_by="Test User")
+        assert other.sample_type is sample.sample_type
     
     def test_sample_with_metadata(self):
         """Test sample with metadata."""
@@ -92,6 +104,25 @@ class TestSample:
         original_length = len(sample.parent_ids)
         sample.add_parent(parent_id1)
         assert len(sample.parent_ids) == original_length
+        
+        # Children appended directly are still recognized as duplicates
+        other_child_id = UUID("00000000-0000-0000-0000-000000000005")
+        sample.child_ids.append(other_child_id)
+        sample.add_child(other_child_id)
+        sample.add_child(child_id)
+        assert sample.child_ids == [child_id, other_child_id]
+        
+        # IDs dropped by replacing a list with one of the same length can be
+        # added again
+        sample.parent_ids = [parent_id2, parent_id3, child_id]
+        sample.add_parent(parent_id1)
+        assert sample.parent_ids == [parent_id2, parent_id3, child_id, parent_id1]
+        sample.child_ids = [parent_id1, parent_id2]
+        sample.add_child(child_id)
+        assert sample.child_ids == [parent_id1, parent_id2, child_id]
+        sample.file_paths = ["/data/other.bam"]
+        sample.add_file("/data/sample.bam")
+        assert sample.file_paths == ["/data/other.bam", "/data/sample.bam"]
     
     def test_to_dict(self):
         """Test conversion to dictionary."""
@@ -115,5 +146,129 @@ class TestSample:
         assert sample_dict["created_by"] == "Test User"
         assert sample_dict["metadata"] == {"quality": "high"}
         assert sample_dict["child_ids"] == [str(child_id)]
+
+    def test_from_dict(self):
+        """Test that from_dict restores a sample from to_dict output."""
+        parent_id = UUID("00000000-0000-0000-0000-000000000002")
+        sample = Sample(
+            name="Test Sample",
+            sample_type="RNA",
+            created_by="Test User",
+            metadata={"quality": "high"},
+            parent_ids=[parent_id],
+        )
+        sample.add_child(UUID("00000000-0000-0000-0000-000000000003"))
+        sample.set_container(UUID("00000000-0000-0000-0000-000000000004"))
+        
+        restored = Sample.from_dict(sample.to_dict())
         
+        assert restored.id == sample.id
+        assert restored.created_at == sample.created_at
+        assert restored.parent_ids == [parent_id]
+        assert restored.container_id == sample.container_id
+        assert restored.to_dict() == sample.to_dict()
 
+    def test_to_orjson(self):
+        """Test that orjson output of to_orjson matches to_dict."""
+        sample = Sample(
+            name="Test Sample",
+            sample_type="RNA",
+            created_by="Test User",
+            parent_ids=[UUID("00000000-0000-0000-0000-000000000002")],
+        )
+        sample.add_child(UUID("00000000-0000-0000-0000-000000000003"))
+        sample.set_container(UUID("00000000-0000-0000-0000-000000000004"))
+        
+        assert orjson.loads(orjson.dumps(sample.to_orjson())) == sample.to_dict()
+
+    def test_to_dict_cache_invalidation(self):
+        """Test that the cached dictionary is refreshed after changes."""
+        sample = Sample(name="Test Sample", sample_type="RNA", created_by="Test User")
+        
+        first = sample.to_dict()
+        assert sample.to_dict() is first
+        
+        # Mutator methods invalidate the cache
+        sample.add_file("/data/sample1.fastq")
+        assert sample.to_dict()["file_paths"] == ["/data/sample1.fastq"]
+        
+        container_id = UUID("00000000-0000-0000-0000-000000000005")
+        sample.set_container(container_id)
+        assert sample.to_dict()["container_id"] == str(container_id)
+        
+        # Direct attribute changes need an explicit invalidation
+        sample.name = "Renamed Sample"
+        sample.invalidate_dict_cache()
+        assert sample.to_dict()["name"] == "Renamed Sample"
+    
+    def test_get_sequencing_data_and_analyses_by_type(self):
+        """Test type filters see records however they were added."""
+        sample = Sample(
+            name="Test Sample",
+            sample_type="RNA",
+            created_by="Test User",
+            sequencing_data=[{"type": "RNA-Seq", "run": 1}],
+        )
+        sample.add_sequencing_data({"type": "WGS", "run": 2})
+        assert [d["run"] for d in sample.get_sequencing_data("RNA-Seq")] == [1]
+        
+        sample.add_sequencing_data({"type": "RNA-Seq", "run": 3})
+        sample.sequencing_data.append({"type": "RNA-Seq", "run": 4})
+        assert [d["run"] for d in sample.get_sequencing_data("RNA-Seq")] == [1, 3, 4]
+        assert len(sample.get_sequencing_data()) == 4
+        
+        sample.add_analysis({"type": "qc"})
+        assert sample.get_analyses("qc") == [{"type": "qc"}]
+        sample.analyses = [{"type": "alignment"}]
+        assert sample.get_analyses("qc") == []
+        assert sample.get_analyses("alignment") == [{"type": "alignment"}]
+
+    def test_contained_samples(self):
+        """Test adding and removing contained samples."""
+        first = UUID("00000000-0000-0000-0000-000000000006")
+        second = UUID("00000000-0000-0000-0000-000000000007")
+        container = Sample(
+            name="Plate",
+            sample_type="Plate",
+            created_by="Test User",
+            is_container=True,
+            contained_sample_ids=[first],
+        )
+        
+        assert container.contains_sample(first)
+        container.add_contained_sample(second)
+        container.add_contained_sample(first)
+        assert container.contained_sample_ids == [first, second]
+        
+        container.remove_contained_sample(first)
+        assert not container.contains_sample(first)
+        assert container.to_dict()["contained_sample_ids"] == [str(second)]
+
+    def test_extract_sample_number(self):
+        """Test extracting the number from human-readable sample IDs."""
+        assert extract_sample_number("s1") == 1
+        assert extract_sample_number("s2048") == 2048
+        assert extract_sample_number("s12-copy") == 12
+        assert extract_sample_number("s") == 0
+        assert extract_sample_number("x12") == 0
+        assert extract_sample_number("") == 0
+        assert extract_sample_number(None) == 0
+
+    def test_next_sample_id_is_unique_across_threads(self):
+        """Test that concurrent callers never receive the same sample ID."""
+        reset_sample_counter(100)
+        assert get_next_sample_id() == "s101"
+        
+        ids = []
+        
+        def worker():
+            ids.extend(get_next_sample_id() for _ in range(1000))
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(set(ids)) == 4000
+        assert max(extract_sample_number(sid) for sid in ids) == 4101
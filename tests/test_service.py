@@ -1,5 +1,6 @@
 """Tests for the SampleService."""
 import unittest
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 from uuid import UUID
 
@@ -46,6 +47,8 @@ class TestSampleService(unittest.TestCase):
         # Verify sample was added to repository
         retrieved = self.repo.get(sample.id)
         self.assertEqual(retrieved, sample)
+        self.assertEqual(self.repo.get_by_sample_id(sample.sample_id), sample)
+        self.assertIsNone(self.repo.get_by_sample_id("s-unknown"))
     
     def test_create_sample_with_invalid_parent(self):
         """Test creating a sample with an invalid parent ID."""
@@ -57,7 +60,70 @@ class TestSampleService(unittest.TestCase):
                 created_by="Test User",
                 parent_ids=[UUID("00000000-0000-0000-0000-000000000999")]
             )
-    
+
+    def test_create_container_sample(self):
+        """Test creating a container holding existing samples."""
+        tube = self.service.create_sample(
+            name="Tube",
+            sample_type="DNA",
+            created_by="Test User"
+        )
+
+        plate = self.service.create_sample(
+            name="Plate",
+            sample_type="Plate",
+            created_by="Test User",
+            contained_sample_ids=[self.parent_sample.id, tube.id],
+            is_container=True
+        )
+
+        self.assertEqual(plate.contained_sample_ids, [self.parent_sample.id, tube.id])
+        self.assertEqual(tube.container_id, plate.id)
+        self.assertEqual(self.parent_sample.container_id, plate.id)
+        self.assertEqual(
+            self.repo.get_many([tube.id, UUID("00000000-0000-0000-0000-000000000999")]),
+            {tube.id: tube}
+        )
+
+        # A missing contained sample is rejected before anything changes
+        with self.assertRaises(ValueError):
+            self.service.create_sample(
+                name="Box",
+                sample_type="Box",
+                created_by="Test User",
+                contained_sample_ids=[tube.id, UUID("00000000-0000-0000-0000-000000000999")],
+                is_container=True
+            )
+        self.assertEqual(tube.container_id, plate.id)
+
+    def test_add_sample_to_container(self):
+        """Test moving a sample between containers."""
+        box = self.service.create_sample(
+            name="Box", sample_type="Box", created_by="Test User", is_container=True
+        )
+        rack = self.service.create_sample(
+            name="Rack", sample_type="Rack", created_by="Test User", is_container=True
+        )
+
+        self.assertIs(self.service.add_sample_to_container(self.parent_sample.id, box.id), box)
+        self.assertEqual(self.parent_sample.container_id, box.id)
+
+        self.service.add_sample_to_container(self.parent_sample.id, rack.id)
+        self.assertEqual(self.parent_sample.container_id, rack.id)
+        self.assertEqual(box.contained_sample_ids, [])
+        self.assertEqual(rack.contained_sample_ids, [self.parent_sample.id])
+        self.assertEqual(self.service.get_contained_samples(rack.id), [self.parent_sample])
+        self.assertEqual(self.service.get_contained_samples(box.id), [])
+
+        with self.assertRaises(ValueError):
+            self.service.add_sample_to_container(
+                UUID("00000000-0000-0000-0000-000000000999"), rack.id
+            )
+        with self.assertRaises(ValueError):
+            self.service.add_sample_to_container(
+                self.parent_sample.id, UUID("00000000-0000-0000-0000-000000000999")
+            )
+
     def test_derive_sample(self):
         """Test deriving a sample from a parent."""
         # Derive a new sample
@@ -153,6 +219,73 @@ class TestSampleService(unittest.TestCase):
         self.assertEqual(len(lineage["descendants"]), 1)
         self.assertEqual(lineage["descendants"][0], derived)
     
+    def test_get_sample_lineage_diamond(self):
+        """Test that a shared ancestor is only returned once."""
+        left = self.service.derive_sample(
+            parent_id=self.parent_sample.id,
+            name="Left",
+            sample_type="DNA Extract",
+            created_by="Test User"
+        )
+        right = self.service.derive_sample(
+            parent_id=self.parent_sample.id,
+            name="Right",
+            sample_type="RNA Extract",
+            created_by="Test User"
+        )
+        pooled = self.service.create_sample(
+            name="Pooled",
+            sample_type="Library",
+            created_by="Test User",
+            parent_ids=[left.id, right.id]
+        )
+        
+        lineage = self.service.get_sample_lineage(pooled.id)
+        self.assertEqual(lineage["ancestors"], [left, right, self.parent_sample])
+        
+        lineage = self.service.get_sample_lineage(self.parent_sample.id)
+        self.assertEqual(lineage["descendants"], [left, right, pooled])
+
+    def test_get_sample_lineage_after_new_sample(self):
+        """Test that lineage reflects samples added after an earlier query."""
+        lineage = self.service.get_sample_lineage(self.parent_sample.id)
+        self.assertEqual(lineage["descendants"], [])
+
+        derived = self.service.derive_sample(
+            parent_id=self.parent_sample.id,
+            name="Derived Sample",
+            sample_type="DNA Extract",
+            created_by="Test User"
+        )
+
+        lineage = self.service.get_sample_lineage(self.parent_sample.id)
+        self.assertEqual(lineage["descendants"], [derived])
+
+        # Repeated queries return equal, independent lists
+        again = self.service.get_sample_lineage(self.parent_sample.id)
+        self.assertEqual(again["descendants"], [derived])
+        self.assertIsNot(again["descendants"], lineage["descendants"])
+
+    def test_get_sample_lineage_parent_added_later(self):
+        """Test lineage when a sample is stored before a parent it names."""
+        grandparent = Sample(name="Grandparent", sample_type="Blood", created_by="Test User")
+        parent = Sample(
+            name="Parent", sample_type="Blood", created_by="Test User",
+            parent_ids=[grandparent.id]
+        )
+        child = Sample(
+            name="Child", sample_type="DNA", created_by="Test User",
+            parent_ids=[parent.id]
+        )
+        self.repo.add(parent)
+        self.repo.add(child)
+        self.assertEqual(self.service.get_sample_lineage(child.id)["ancestors"], [parent])
+
+        self.repo.add(grandparent)
+        self.assertEqual(
+            self.service.get_sample_lineage(child.id)["ancestors"], [parent, grandparent]
+        )
+
     def test_get_lineage_nonexistent_sample(self):
         """Test getting lineage for a non-existent sample."""
         with self.assertRaises(ValueError):
@@ -194,6 +327,46 @@ class TestSampleService(unittest.TestCase):
         # Search with no matching results
         results = self.service.search_samples({"category": "nonexistent"})
         self.assertEqual(len(results), 0)
+    
+    def test_search_samples_after_metadata_update(self):
+        """Test that search reflects metadata added after creation."""
+        sample = self.service.create_sample(
+            name="Sample A",
+            sample_type="DNA",
+            created_by="Test User",
+            metadata={"status": "pending"}
+        )
+        
+        self.service.add_metadata_to_sample(sample.id, "status", "done")
+        
+        self.assertEqual(self.service.search_samples({"status": "pending"}), [])
+        results = self.service.search_samples({"status": "done"})
+        self.assertEqual([s.id for s in results], [sample.id])
+        
+        # Unhashable values fall back to comparing each sample
+        self.service.add_metadata_to_sample(sample.id, "tags", ["a", "b"])
+        results = self.service.search_samples({"status": "done", "tags": ["a", "b"]})
+        self.assertEqual(len(results), 1)
+    
+    def test_search_samples_insertion_order(self):
+        """Test indexed and unindexed searches both return samples in the order added."""
+        created_at = datetime(2024, 1, 1)
+        samples = [
+            Sample(
+                name=f"Sample {i}",
+                sample_type="DNA",
+                created_by="Test User",
+                metadata={"batch": "b1", "tags": ["x"]},
+                # Added newest first, with ties
+                created_at=created_at - timedelta(days=i // 2),
+            )
+            for i in range(6)
+        ]
+        for sample in samples:
+            self.repo.add(sample)
+        
+        self.assertEqual(self.service.search_samples({"batch": "b1"}), samples)
+        self.assertEqual(self.service.search_samples({"tags": ["x"]}), samples)
 
 
 if __name__ == "__main__":